@@ -0,0 +1,173 @@
+"""
+AKS primality proof (Agrawal, Kayal, Saxena; the version with the
+sqrt(phi(r)) * log2(n) bound on a).
+
+For the smallest r with ord_r(n) > log2(n)^2, a number n that is not a
+perfect power and has no factor up to r is prime iff
+
+    (X + a)^n = X^(n mod r) + a    (mod X^r - 1, n)
+
+for every 1 <= a <= sqrt(phi(r)) * log2(n). Polynomials modulo X^r - 1 are
+kept as r coefficients; products use Kronecker substitution, so each
+squaring is one big-int multiplication followed by a fold of the top r
+slots onto the bottom r. For n below 2^32 the coefficients live in a
+NumPy uint64 array, so packing, unpacking and reducing the slots mod n are
+array operations rather than a Python loop over r coefficients; larger n
+go through int.to_bytes slicing. The a values are independent, so they are split
+into chunks and checked on a process pool; the first failing chunk cancels
+the rest.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from math import gcd, log, sqrt
+import os
+import time
+import numpy as np
+from MahuCrypt_app.cryptography.algos import find_smallest_r, is_perfect_power, _check_deadline
+from MahuCrypt_app.cryptography.factorization import factorize
+from MahuCrypt_app.cryptography.parallel_keygen import process_context
+
+#worker processes for the congruence checks, None means os.cpu_count()
+AKS_WORKERS = None
+#values of a handed to a worker at a time
+AKS_CHUNK_SIZE = 16
+#below this many values of a, starting the pool costs more than the checks
+AKS_PARALLEL_MIN_A = 128
+#up to this size a coefficient fits a uint32, so c_(i-1) + a c_i (a < n) fits a uint64
+AKS_NUMPY_MAX_BITS = 32
+
+
+def _slot(n, r):
+    """ Bytes per packed coefficient: a folded product holds at most r terms below n^2. """
+    return (2 * n.bit_length() + r.bit_length() + 7) // 8
+
+
+def _pack(coefficients, slot):
+    return int.from_bytes(b"".join(c.to_bytes(slot, "little") for c in coefficients), "little")
+
+
+def _unpack(F, r, slot, n):
+    data = F.to_bytes(r * slot, "little")
+    return [int.from_bytes(data[i:i + slot], "little") % n for i in range(0, r * slot, slot)]
+
+
+def _square_mod(coefficients, r, n, slot):
+    """ f^2 mod (X^r - 1, n) with one big-int squaring. """
+    F = _pack(coefficients, slot)
+    H = F * F
+    width = 8 * slot * r
+    #X^(r+i) = X^i, the top r - 1 slots fold onto the bottom ones
+    return _unpack((H & ((1 << width) - 1)) + (H >> width), r, slot, n)
+
+
+def _pack_words(coefficients, slot):
+    """ _pack for a uint64 array of coefficients below 2^32. """
+    width = min(slot, 4)
+    buffer = np.zeros((len(coefficients), slot), dtype=np.uint8)
+    buffer[:, :width] = coefficients.astype("<u8").view(np.uint8).reshape(-1, 8)[:, :width]
+    return int.from_bytes(buffer.tobytes(), "little")
+
+
+def _unpack_words(F, r, slot, n):
+    """ _unpack into a uint64 array, each slot reduced mod n byte by byte from the top (Horner). """
+    data = np.frombuffer(F.to_bytes(r * slot, "little"), dtype=np.uint8).reshape(r, slot)
+    modulus, shift = np.uint64(n), np.uint64(8)
+    coefficients = np.zeros(r, dtype=np.uint64)
+    for j in range(slot - 1, -1, -1):
+        coefficients = ((coefficients << shift) | data[:, j]) % modulus
+    return coefficients
+
+
+def _square_mod_words(coefficients, r, n, slot):
+    F = _pack_words(coefficients, slot)
+    H = F * F
+    width = 8 * slot * r
+    return _unpack_words((H & ((1 << width) - 1)) + (H >> width), r, slot, n)
+
+
+def _polynomial_power_words(a, n, r, slot, deadline):
+    modulus, a = np.uint64(n), np.uint64(a % n)
+    coefficients = np.zeros(r, dtype=np.uint64)
+    coefficients[0] = 1
+    for bit in bin(n)[2:]:
+        _check_deadline(deadline)
+        coefficients = _square_mod_words(coefficients, r, n, slot)
+        if (bit == "1"):
+            coefficients = (np.roll(coefficients, 1) + a * coefficients) % modulus
+    return coefficients.tolist()
+
+
+def polynomial_power(a, n, r, deadline=None):
+    """ (X + a)^n mod (X^r - 1, n) as its r coefficients, lowest degree first. """
+    slot = _slot(n, r)
+    if (n.bit_length() <= AKS_NUMPY_MAX_BITS):
+        return _polynomial_power_words(a, n, r, slot, deadline)
+    coefficients = [0] * r
+    coefficients[0] = 1
+    for bit in bin(n)[2:]:
+        _check_deadline(deadline)
+        coefficients = _square_mod(coefficients, r, n, slot)
+        if (bit == "1"):
+            #multiply by X + a: c_i <- c_(i-1) + a c_i, with c_(-1) = c_(r-1)
+            coefficients = [(coefficients[i - 1] + a * c) % n for i, c in enumerate(coefficients)]
+    return coefficients
+
+
+def aks_congruence_holds(a, n, r, deadline=None):
+    """ (X + a)^n = X^(n mod r) + a (mod X^r - 1, n). """
+    expected = [0] * r
+    expected[n % r] = 1
+    expected[0] = (expected[0] + a) % n
+    return polynomial_power(a, n, r, deadline) == expected
+
+
+def _first_failure(n, r, a_values, deadline):
+    """ First a in a_values whose congruence fails, or None. Runs inside a worker process. """
+    for a in a_values:
+        if not aks_congruence_holds(a, n, r, deadline):
+            return a
+    return None
+
+
+def _euler_phi(r):
+    phi = 1
+    for p, e in factorize(r).items():
+        phi *= (p - 1) * p**(e - 1)
+    return phi
+
+
+def is_prime_aks(n, time_budget=None, workers=None):
+    """ AKS primality proof. With time_budget (seconds) it raises TimeoutError instead of running on.
+    workers = 1 checks the congruences in this process, otherwise on a pool of that many processes;
+    None falls back to AKS_WORKERS. """
+    if workers is None:
+        workers = AKS_WORKERS
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    if (n < 2):
+        return False
+    if is_perfect_power(n):
+        return False
+    r = find_smallest_r(n, deadline)
+    for a in range(2, min(r, n - 1) + 1):
+        if (gcd(a, n) > 1):
+            return False
+    if (n <= r):
+        return True
+    max_a = int(sqrt(_euler_phi(r)) * log(n, 2))
+    chunks = [range(start, min(start + AKS_CHUNK_SIZE, max_a + 1)) for start in range(1, max_a + 1, AKS_CHUNK_SIZE)]
+    if (workers == 1 or max_a < AKS_PARALLEL_MIN_A):
+        return all(_first_failure(n, r, chunk, deadline) is None for chunk in chunks)
+    pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count(), mp_context=process_context())
+    try:
+        pending = {pool.submit(_first_failure, n, r, chunk, deadline) for chunk in chunks}
+        while pending:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                raise TimeoutError("AKS time budget exceeded")
+            for future in done:
+                if future.result() is not None:
+                    return False
+        return True
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
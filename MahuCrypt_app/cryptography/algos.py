@@ -1,34 +1,25 @@
-from math import gcd, isqrt, log, ceil
+from math import gcd, isqrt, log, ceil, prod
+from collections import OrderedDict
+from functools import lru_cache
+from bisect import bisect_left
+import numpy as np
+import threading
+import time
+import os
 import random
-#Extend Ext_Euclide
+from MahuCrypt_app.cryptography.euclid import ext_gcd, inverse_mod
+#Extend Ext_Euclide, the division loop and Lehmer's algorithm live in euclid.py
 def Ext_Euclide(a, b):
-    if b == 0: 
-        d = a
-        x = 1
-        y = 0
-        return d,x,y
-    x2 = 1
-    x1 = 0
-    y1 = 1
-    y2 = 0
-    while (b > 0):
-        q = a // b
-        r = a  % b
-        x = x2 - q*x1
-        y = y2 - q*y1
-        a = b
-        b = r
-        x2 = x1
-        x1 = x
-        y2 = y1
-        y1 = y
-    d = a
-    x = x2
-    y = y2
-    return d,x,y
+    return ext_gcd(a, b)
 
 #Modular Exponentiation
-def modular_exponentiation(b, n, m):
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+def reference_modular_exponentiation(b, n, m):
+    """ Square-and-multiply written out, kept for teaching and as the reference for the other backends. """
     x = 1
     power = b % m 
 
@@ -37,20 +28,97 @@ def modular_exponentiation(b, n, m):
             x = (x * power) % m
         power = (power * power) % m
         n = n // 2
-    return x 
+    return x
+
+def builtin_modular_exponentiation(b, n, m):
+    return pow(b, n, m)
+
+def gmpy2_modular_exponentiation(b, n, m):
+    return int(gmpy2.powmod(b, n, m))
+
+MODULAR_EXPONENTIATION_BACKENDS = {
+    "builtin": builtin_modular_exponentiation,
+    "reference": reference_modular_exponentiation,
+}
+if gmpy2 is not None:
+    MODULAR_EXPONENTIATION_BACKENDS["gmpy2"] = gmpy2_modular_exponentiation
+
+def set_modular_exponentiation_backend(name):
+    """ Selects the backend used by modular_exponentiation: "builtin", "gmpy2" (if installed) or "reference". """
+    global _modular_exponentiation, MODULAR_EXPONENTIATION_BACKEND
+    if name not in MODULAR_EXPONENTIATION_BACKENDS:
+        raise ValueError("Unknown modular exponentiation backend: " + str(name))
+    _modular_exponentiation = MODULAR_EXPONENTIATION_BACKENDS[name]
+    MODULAR_EXPONENTIATION_BACKEND = name
+
+#picked once at import: MAHUCRYPT_MODEXP_BACKEND if set, else gmpy2 when installed, else the builtin pow
+set_modular_exponentiation_backend(
+    os.environ.get("MAHUCRYPT_MODEXP_BACKEND", "gmpy2" if gmpy2 is not None else "builtin")
+)
+
+def modular_exponentiation(b, n, m, backend=None):
+    """ b^n mod m for n >= 0 through the selected backend, or the one named by backend. """
+    if backend is not None:
+        return MODULAR_EXPONENTIATION_BACKENDS[backend](b, n, m)
+    return _modular_exponentiation(b, n, m)
 
-def find_quadratic_residue(p):
-    quadratic_residue = {}
-    for i in range(1, p//2 + 1):
-        m = modular_exponentiation(i,2,p)
-        quadratic_residue[str(m)] = (i, p-i)
-    return quadratic_residue
+def multi_exponentiation(pairs, m, w=None):
+    """ Returns b1^e1 * b2^e2 * ... mod m for pairs [(b1, e1), (b2, e2), ...] with e >= 0 and one shared
+    chain of squarings (Straus interleaving of the width-w windows of every exponent). """
+    pairs = [(b % m, e) for b, e in pairs if e > 0]
+    if (not pairs):
+        return 1 % m
+    length = max(e.bit_length() for b, e in pairs)
+    if (w is None):
+        w = 4 if length > 128 else 2
+    mask = (1 << w) - 1
+    shifts = range((length - 1) // w * w, -1, -w)
+    #b^0 .. b^(2^w - 1) per base and the window digits of its exponent, most significant first
+    expansions = []
+    for b, e in pairs:
+        table = [1, b]
+        for _ in range(mask - 1):
+            table.append(table[-1] * b % m)
+        expansions.append((table, [(e >> shift) & mask for shift in shifts]))
+    result = 1
+    for i in range(len(shifts)):
+        for _ in range(w):
+            result = result * result % m
+        for table, digits in expansions:
+            if (digits[i]):
+                result = result * table[digits[i]] % m
+    return result
+
+#RSA private-key exponentiation through the Chinese remainder theorem
+RSA_CRT_CACHE_SIZE = 64
+
+@lru_cache(maxsize=RSA_CRT_CACHE_SIZE)
+def rsa_crt_params(p, q, d):
+    """ (dp, dq, q^-1 mod p) for a private key, computed once per key. None when p and q are not coprime. """
+    g, q_inv, _ = Ext_Euclide(q, p)
+    if (g != 1):
+        return None
+    #exponents kept in [1, p-1] so that 0^d stays 0 when (p-1) divides d
+    dp = (d - 1) % (p - 1) + 1
+    dq = (d - 1) % (q - 1) + 1
+    return dp, dq, q_inv % p
+
+def rsa_crt_exp(c, p, q, d):
+    """ c^d mod pq from two half-size exponentiations and Garner's recombination. """
+    params = rsa_crt_params(p, q, d)
+    if params is None:
+        return modular_exponentiation(c, d, p * q)
+    dp, dq, q_inv = params
+    m1 = modular_exponentiation(c % p, dp, p)
+    m2 = modular_exponentiation(c % q, dq, q)
+    h = (q_inv * (m1 - m2)) % p
+    return m2 + h * q
 
 def double(point, a, p):
     x, y = point
     if (y == 0):
         return (0,0)
-    _lambda = ((3*x**2 + a) * Ext_Euclide(2*y, p)[1]) % p
+    _lambda = ((3*x**2 + a) * inverse_mod(2*y, p)) % p
     x_r = (_lambda**2 - 2*x) % p
     y_r = (_lambda*(x - x_r) - y) % p
     return (x_r, y_r)
@@ -66,24 +134,301 @@ def add_points(point1, point2, a, p):
         return double(point1, a, p)
     if (x1 == x2 and y1 != y2):
         return (0,0)
-    _lambda = ((y2 - y1) * Ext_Euclide(x2 - x1, p)[1]) % p
+    _lambda = ((y2 - y1) * inverse_mod(x2 - x1, p)) % p
     x_r = (_lambda**2 - x1 - x2) % p
     y_r = (_lambda*(x1 - x_r) - y1) % p
     return (x_r, y_r)
 
-def double_and_add(point, n, a, p):
+#Many affine operations modulo the same p share one inversion (Montgomery's trick)
+def batch_inverse(values, p):
+    """ Inverses of all values mod p for the price of one inversion and 3(n-1) multiplications.
+    Raises ValueError if any value is not invertible. """
+    if not values:
+        return []
+    #prefix[i] = values[0] * ... * values[i]
+    prefix = []
+    acc = 1
+    for v in values:
+        acc = (acc * v) % p
+        prefix.append(acc)
+    inv = inverse_mod(acc, p)
+    result = [0] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        result[i] = (inv * prefix[i - 1]) % p
+        inv = (inv * values[i]) % p
+    result[0] = inv
+    return result
+
+def double_many(points, a, p):
+    """ [double(P) for P in points] with a single inversion. """
+    todo = [i for i, (x, y) in enumerate(points) if y != 0]
+    inverses = batch_inverse([2 * points[i][1] for i in todo], p)
+    result = [(0,0)] * len(points)
+    for i, inv in zip(todo, inverses):
+        x, y = points[i]
+        _lambda = ((3*x**2 + a) * inv) % p
+        x_r = (_lambda**2 - 2*x) % p
+        result[i] = (x_r, (_lambda*(x - x_r) - y) % p)
+    return result
+
+def add_points_many(points1, points2, a, p):
+    """ [add_points(P, Q) for P, Q in zip(points1, points2)] with a single inversion, same special cases. """
+    result = [None] * len(points1)
+    todo = []
+    denominators = []
+    for i, (point1, point2) in enumerate(zip(points1, points2)):
+        (x1, y1), (x2, y2) = point1, point2
+        if (point1 == (0,0)):
+            result[i] = point2
+        elif (point2 == (0,0)):
+            result[i] = point1
+        elif (x1 == x2 and y1 == y2):
+            if (y1 == 0):
+                result[i] = (0,0)
+            else:
+                todo.append((i, 3*x1**2 + a))
+                denominators.append(2 * y1)
+        elif (x1 == x2):
+            result[i] = (0,0)
+        else:
+            todo.append((i, y2 - y1))
+            denominators.append(x2 - x1)
+    for (i, numerator), inv in zip(todo, batch_inverse(denominators, p)):
+        (x1, y1), (x2, y2) = points1[i], points2[i]
+        _lambda = (numerator * inv) % p
+        x_r = (_lambda**2 - x1 - x2) % p
+        result[i] = (x_r, (_lambda*(x1 - x_r) - y1) % p)
+    return result
+
+#Jacobian coordinates: (X, Y, Z) is the affine point (X/Z^2, Y/Z^3), Z = 0 is the point at infinity
+JACOBIAN_INFINITY = (1, 1, 0)
+
+def to_jacobian(point, p):
+    if (point == (0,0)):
+        return JACOBIAN_INFINITY
+    x, y = point
+    return (x % p, y % p, 1)
+
+def from_jacobian(point, p):
+    X, Y, Z = point
+    if (Z % p == 0):
+        return (0,0)
+    z_inv = inverse_mod(Z, p)
+    z_inv_2 = (z_inv * z_inv) % p
+    return ((X * z_inv_2) % p, (Y * z_inv_2 * z_inv) % p)
+
+def from_jacobian_many(points, p):
+    """ [from_jacobian(P) for P in points] with a single inversion. """
+    todo = [i for i, (X, Y, Z) in enumerate(points) if Z % p != 0]
+    inverses = batch_inverse([points[i][2] for i in todo], p)
+    result = [(0,0)] * len(points)
+    for i, z_inv in zip(todo, inverses):
+        X, Y, Z = points[i]
+        z_inv_2 = (z_inv * z_inv) % p
+        result[i] = ((X * z_inv_2) % p, (Y * z_inv_2 * z_inv) % p)
+    return result
+
+def jacobian_double(point, a, p):
+    X, Y, Z = point
+    if (Z == 0 or Y == 0):
+        return JACOBIAN_INFINITY
+    YY = (Y * Y) % p
+    ZZ = (Z * Z) % p
+    S = (4 * X * YY) % p
+    M = (3 * X * X + a * ZZ * ZZ) % p
+    X_r = (M * M - 2 * S) % p
+    Y_r = (M * (S - X_r) - 8 * YY * YY) % p
+    Z_r = (2 * Y * Z) % p
+    return (X_r, Y_r, Z_r)
+
+def jacobian_add(point1, point2, a, p):
+    X1, Y1, Z1 = point1
+    X2, Y2, Z2 = point2
+    if (Z1 == 0):
+        return point2
+    if (Z2 == 0):
+        return point1
+    Z1Z1 = (Z1 * Z1) % p
+    if (Z2 == 1):
+        #mixed addition: point2 is affine, saves the Z2 powers
+        U1, S1 = X1, Y1
+    else:
+        Z2Z2 = (Z2 * Z2) % p
+        U1 = (X1 * Z2Z2) % p
+        S1 = (Y1 * Z2 * Z2Z2) % p
+    U2 = (X2 * Z1Z1) % p
+    S2 = (Y2 * Z1 * Z1Z1) % p
+    H = (U2 - U1) % p
+    R = (S2 - S1) % p
+    if (H == 0):
+        if (R == 0):
+            return jacobian_double(point1, a, p)
+        return JACOBIAN_INFINITY
+    HH = (H * H) % p
+    HHH = (H * HH) % p
+    V = (U1 * HH) % p
+    X_r = (R * R - HHH - 2 * V) % p
+    Y_r = (R * (V - X_r) - S1 * HHH) % p
+    Z_r = (H * Z1 * Z2) % p
+    return (X_r, Y_r, Z_r)
+
+def wnaf(n, w):
+    """ Returns the width-w NAF digits of n, least significant digit first. """
+    digits = []
+    half = 1 << (w - 1)
+    full = 1 << w
+    while n > 0:
+        d = 0
+        if n & 1:
+            d = n & (full - 1)
+            if d >= half:
+                d -= full
+            n -= d
+        digits.append(d)
+        n >>= 1
+    return digits
+
+def choose_window(n):
+    """ Picks the NAF width for a scalar of n's size, 1 means the plain binary method. """
+    bits = n.bit_length()
+    if bits <= 4:
+        return 1
+    if bits <= 24:
+        return 2
+    if bits <= 80:
+        return 3
+    if bits <= 240:
+        return 4
+    if bits <= 640:
+        return 5
+    return 6
+
+def jacobian_negate(point, p):
+    X, Y, Z = point
+    return (X, (-Y) % p, Z)
+
+def odd_multiples(P, w, a, p):
+    """ Returns [P, 3P, 5P, ..., (2^(w-1) - 1)P] in Jacobian coordinates. """
+    multiples = [P]
+    if w > 2:
+        P2 = jacobian_double(P, a, p)
+        for _ in range((1 << (w - 2)) - 1):
+            multiples.append(jacobian_add(multiples[-1], P2, a, p))
+    return multiples
+
+def double_and_add(point, n, a, p, w=None):
+    #works in Jacobian coordinates so the whole multiplication needs a single inversion
+    #w = 1 is the plain left-to-right binary method, w >= 2 uses width-w NAF, None picks w from n
     if (n == 0):
         return (0,0)
     if (n == 1):
         return point
-    T = point
-    d = bin(n)[2:]
-    l = len(d)
-    for i in range(1, l):
-        T = double(T, a, p)
-        if (d[i] == '1'):
-            T = add_points(T, point, a, p)
-    return T
+    if (w is None):
+        w = choose_window(n)
+    P = to_jacobian(point, p)
+    if (w == 1):
+        T = P
+        d = bin(n)[2:]
+        l = len(d)
+        for i in range(1, l):
+            T = jacobian_double(T, a, p)
+            if (d[i] == '1'):
+                T = jacobian_add(T, P, a, p)
+        return from_jacobian(T, p)
+    multiples = odd_multiples(P, w, a, p)
+    T = JACOBIAN_INFINITY
+    for d in reversed(wnaf(n, w)):
+        T = jacobian_double(T, a, p)
+        if (d > 0):
+            T = jacobian_add(T, multiples[d >> 1], a, p)
+        elif (d < 0):
+            T = jacobian_add(T, jacobian_negate(multiples[(-d) >> 1], p), a, p)
+    return from_jacobian(T, p)
+
+def multi_scalar_mul(pairs, a, p, w=None):
+    """ Returns k1*P1 + k2*P2 + ... for pairs [(k1, P1), (k2, P2), ...] with one shared chain of doublings
+    (Straus-Shamir interleaving of the width-w NAF of every scalar). """
+    expansions = []
+    for k, point in pairs:
+        if (k < 0):
+            k, point = -k, (point[0], -point[1])
+        if (k == 0 or point == (0,0)):
+            continue
+        expansions.append((k, to_jacobian(point, p)))
+    if (not expansions):
+        return (0,0)
+    if (w is None):
+        w = max(2, choose_window(max(k for k, _ in expansions)))
+    expansions = [(wnaf(k, w), odd_multiples(P, w, a, p)) for k, P in expansions]
+    T = JACOBIAN_INFINITY
+    for i in range(max(len(digits) for digits, _ in expansions) - 1, -1, -1):
+        T = jacobian_double(T, a, p)
+        for digits, multiples in expansions:
+            if (i >= len(digits)):
+                continue
+            d = digits[i]
+            if (d > 0):
+                T = jacobian_add(T, multiples[d >> 1], a, p)
+            elif (d < 0):
+                T = jacobian_add(T, jacobian_negate(multiples[(-d) >> 1], p), a, p)
+    return from_jacobian(T, p)
+
+#Fixed-base tables: [P, 2P, 4P, ...] in affine form, kept per (base point, curve) with LRU eviction
+FIXED_BASE_CACHE_SIZE = 32
+_fixed_base_tables = OrderedDict()
+_fixed_base_lock = threading.Lock()
+
+def fixed_base_table(point, a, p, length):
+    """ Returns the cached table [2^i * point for i < length], extending it when it is too short. """
+    key = (tuple(point), a, p)
+    with _fixed_base_lock:
+        table = _fixed_base_tables.get(key)
+        if (table is None):
+            table = [to_jacobian(point, p)]
+            _fixed_base_tables[key] = table
+            if (len(_fixed_base_tables) > FIXED_BASE_CACHE_SIZE):
+                _fixed_base_tables.popitem(last=False)
+        else:
+            _fixed_base_tables.move_to_end(key)
+        while (len(table) < length):
+            #stored with Z = 1 so every lookup is a cheap mixed addition
+            table.append(to_jacobian(from_jacobian(jacobian_double(table[-1], a, p), p), p))
+        return table
+
+def clear_fixed_base_cache():
+    with _fixed_base_lock:
+        _fixed_base_tables.clear()
+
+def fixed_base_mul(point, n, a, p, jacobian=False):
+    """ Computes n*point from the cached table of 2^i*point: NAF digits, additions only, no doublings.
+    With jacobian=True the result stays in Jacobian form, for callers that normalize many points at once. """
+    if (n == 0):
+        return JACOBIAN_INFINITY if jacobian else (0,0)
+    digits = wnaf(n, 2)
+    table = fixed_base_table(point, a, p, len(digits))
+    T = JACOBIAN_INFINITY
+    for i, d in enumerate(digits):
+        if (d == 1):
+            T = jacobian_add(T, table[i], a, p)
+        elif (d == -1):
+            T = jacobian_add(T, jacobian_negate(table[i], p), a, p)
+    return T if jacobian else from_jacobian(T, p)
+
+def is_strong_probable_prime(n, a):
+    """ One Miller-Rabin round: is the odd n > 2 a strong probable prime to base a? """
+    d = n - 1
+    r = 0
+    while (d % 2 == 0):
+        d //= 2
+        r += 1
+    x = modular_exponentiation(a, d, n)
+    if (x == 1 or x == n - 1):
+        return True
+    for _ in range(r - 1):
+        x = (x * x) % n
+        if (x == n - 1):
+            return True
+    return False
 
 def miller_rabin_test(n, k):
     if n == 2 or n == 3:
@@ -91,84 +436,242 @@ def miller_rabin_test(n, k):
     if n <= 1 or n % 2 == 0:
         return False
     
-    r = 0
-    d = n - 1
-    while d % 2 == 0:
-        d //= 2
-        r += 1
-    
     for _ in range(k):
-        a = random.randint(2, n - 2)
-        x = modular_exponentiation(a, d, n)
-        if x == 1 or x == n - 1:
-            continue
-        
-        for _ in range(r - 1):
-            x = modular_exponentiation(x, 2, n)
-            if x == n - 1:
-                break
-        else:
-            return False    
+        if not is_strong_probable_prime(n, random.randint(2, n - 2)):
+            return False
     return True
 
+#odd numbers per sieve segment, one byte each: 256 KiB, small enough to stay in cache
+SIEVE_SEGMENT_SIZE = 1 << 18
+
+def _odd_base_primes(limit):
+    """ Odd primes up to limit from a single odd-only array, index i stands for 2i + 1. """
+    flags = np.ones(limit // 2 + 1, dtype=np.bool_)
+    flags[0] = False
+    for i in range(1, (isqrt(limit) - 1) // 2 + 1):
+        if flags[i]:
+            q = 2*i + 1
+            flags[q*q // 2::q] = False
+    return (2*np.flatnonzero(flags) + 1).tolist()
+
+def iter_primes(limit, segment_size=SIEVE_SEGMENT_SIZE):
+    """ Yield the primes up to limit in increasing order. Odd numbers only, sieved one
+    segment of segment_size bytes at a time, so memory stays O(sqrt(limit) + segment_size). """
+    if (limit < 2):
+        return
+    yield 2
+    base = _odd_base_primes(isqrt(limit))
+    lo = 3
+    while (lo <= limit):
+        #segment covers lo, lo + 2, ..., lo + 2(count - 1)
+        count = min(segment_size, (limit - lo) // 2 + 1)
+        seg = np.ones(count, dtype=np.bool_)
+        hi = lo + 2*count
+        for q in base:
+            if (q * q >= hi):
+                break
+            if (q * q >= lo):
+                i = (q*q - lo) // 2
+            else:
+                #first i with lo + 2i = 0 (mod q), (q + 1) / 2 is the inverse of 2
+                i = (-lo * ((q + 1) // 2)) % q
+            seg[i::q] = False
+        yield from (2*np.flatnonzero(seg) + lo).tolist()
+        lo = hi
+
 def sieve_of_eratosthenes(limit):
     """ Trả về danh sách các số nguyên tố đến giới hạn cho trước. """
-    is_prime = [True] * (limit + 1)
-    p = 2
-    while (p * p <= limit):
-        if (is_prime[p] == True):
-            for i in range(p * p, limit + 1, p):
-                is_prime[i] = False
-        p += 1
-    return [p for p in range(2, limit + 1) if is_prime[p]]
+    return list(iter_primes(limit))
 
-def largest_prime_factor(n):
-    largest_prime = 0
-    limit = int(n**0.5) + 1
+#Primality testing sized to the input: trial division, then deterministic or FIPS 186 round counts
+SMALL_PRIMES = sieve_of_eratosthenes(1000)
+SMALL_PRIMES_PRODUCT = prod(SMALL_PRIMES)
+#the first 13 primes as bases decide every n below this bound (Sorenson & Webster)
+DETERMINISTIC_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+DETERMINISTIC_LIMIT = 3317044064679887385961981
+#(minimum bit length, rounds) after FIPS 186-4 Table C.3, error below 2^-100 for random candidates
+MILLER_RABIN_ROUNDS = ((1536, 3), (1024, 4), (512, 7), (0, 27))
+
+def miller_rabin_rounds(bits):
+    for min_bits, rounds in MILLER_RABIN_ROUNDS:
+        if (bits >= min_bits):
+            return rounds
+
+def is_probable_prime(n):
+    """ Primality with the least work for the size of n: one gcd against the small primes,
+    deterministic witnesses below DETERMINISTIC_LIMIT, random bases with miller_rabin_rounds above. """
+    if (n < 2):
+        return False
+    if (gcd(n, SMALL_PRIMES_PRODUCT) != 1):
+        return n <= SMALL_PRIMES[-1] and n in SMALL_PRIMES
+    if (n < SMALL_PRIMES[-1] ** 2):
+        return True
+    if (n < DETERMINISTIC_LIMIT):
+        witnesses = DETERMINISTIC_WITNESSES
+    else:
+        witnesses = [random.randrange(2, n - 1) for _ in range(miller_rabin_rounds(n.bit_length()))]
+    return all(is_strong_probable_prime(n, a) for a in witnesses)
+
+def jacobi_symbol(a, n):
+    """ Jacobi symbol (a/n) for odd n > 0. """
+    a %= n
+    result = 1
+    while (a != 0):
+        while (a % 2 == 0):
+            a //= 2
+            if (n % 8 in (3, 5)):
+                result = -result
+        a, n = n, a
+        if (a % 4 == 3 and n % 4 == 3):
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+def is_strong_lucas_probable_prime(n):
+    """ Strong Lucas test with Selfridge's parameters: the first D in 5, -7, 9, -11, ... with (D/n) = -1,
+    P = 1 and Q = (1 - D)/4. n must be odd and not a perfect square. """
+    D = 5
+    while True:
+        j = jacobi_symbol(D, n)
+        if (j == -1):
+            break
+        if (j == 0 and abs(D) != n):
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P, Q = 1, (1 - D) // 4
+    #no prime divides Q: D = 1 - 4Q would be a square modulo it
+    if (gcd(n, Q) != 1):
+        return False
+    #n + 1 = d * 2^s with d odd
+    d, s = n + 1, 0
+    while (d % 2 == 0):
+        d //= 2
+        s += 1
+    #V'_k = V_2k / Q^k is the Lucas sequence of P' = P^2/Q - 2 and Q' = 1, whose doubling needs neither
+    #U nor Q^k. With P = 1 and m = (d + 1)/2, V_d = Q^m (V'_m + V'_m-1), U_d = Q^m (V'_m - V'_m-1) / D
+    #and V_d2^r = Q^(d 2^(r-1)) V'_d2^(r-1), and Q is a unit mod n, so the test reads off V' alone
+    P2 = (P * P * inverse_mod(Q, n) - 2) % n
+    #(V'_k, V'_k+1) from k = 0 up to k = m - 1, left to right over the bits of m - 1
+    V0, V1 = 2, P2
+    for bit in bin((d + 1) // 2 - 1)[2:]:
+        if (bit == "1"):
+            V0, V1 = (V0 * V1 - P2) % n, (V1 * V1 - 2) % n
+        else:
+            V0, V1 = (V0 * V0 - 2) % n, (V0 * V1 - P2) % n
+    if (V1 == V0 or (V1 + V0) % n == 0):
+        return True
+    #V'_d = V'_m V'_m-1 - V'_1, then V'_2k = V'_k^2 - 2
+    V = (V1 * V0 - P2) % n
+    for _ in range(s - 1):
+        if (V == 0):
+            return True
+        V = (V * V - 2) % n
+    return False
+
+def is_prime_bpsw(n):
+    """ Baillie-PSW: small-prime gcd, strong base-2 Miller-Rabin and a strong Lucas test.
+    No composite passing it is known, and none exists below 2^64. """
+    if (n < 2):
+        return False
+    if (gcd(n, SMALL_PRIMES_PRODUCT) != 1):
+        return n <= SMALL_PRIMES[-1] and n in SMALL_PRIMES
+    if (n < SMALL_PRIMES[-1] ** 2):
+        return True
+    if not is_strong_probable_prime(n, 2):
+        return False
+    #the search for D never ends on a square
+    if (isqrt(n) ** 2 == n):
+        return False
+    return is_strong_lucas_probable_prime(n)
+
+#Odd primes used to sieve a window of consecutive odd candidates before any primality test
+WINDOW_SIEVE_PRIMES = sieve_of_eratosthenes(1 << 15)[1:]
 
-    # Tạo danh sách các số nguyên tố
-    primes = sieve_of_eratosthenes(limit)
+def sieve_odd_window(start, count, limit=1 << 15):
+    """ Mask over start, start + 2, ..., start + 2(count - 1): 1 where no odd prime below limit (at most 2^15)
+    divides the number. start must be odd and above limit so that the sieving primes themselves never occur. """
+    mask = bytearray([1]) * count
+    for q in WINDOW_SIEVE_PRIMES[:bisect_left(WINDOW_SIEVE_PRIMES, limit)]:
+        #first i with start + 2i = 0 (mod q), (q + 1) / 2 is the inverse of 2
+        i = (-start * ((q + 1) // 2)) % q
+        if (i < count):
+            mask[i::q] = bytes(len(range(i, count, q)))
+    return mask
 
-    # Kiểm tra từng số nguyên tố
-    for p in primes:
-        while n % p == 0:
-            largest_prime = p
-            n //= p
+def sieve_safe_prime_window(start, count, limit=1 << 15):
+    """ Mask over q = start, start + 4, ..., start + 4(count - 1): 1 where no odd prime below limit (at most 2^15)
+    divides q or 2q + 1. start must be 1 mod 4 and above limit, so every survivor q gives p = 2q + 1 = 3 (mod 8). """
+    mask = bytearray([1]) * count
+    for r in WINDOW_SIEVE_PRIMES[:bisect_left(WINDOW_SIEVE_PRIMES, limit)]:
+        #((r + 1) / 2)^2 is the inverse of 4, q = 0 kills q and q = (r - 1) / 2 kills 2q + 1
+        inv4 = ((r + 1) // 2) ** 2 % r
+        for target in (0, (r - 1) // 2):
+            i = ((target - start) * inv4) % r
+            if (i < count):
+                mask[i::r] = bytes(len(range(i, count, r)))
+    return mask
 
-    # Nếu n còn lại lớn hơn 1, thì nó là một số nguyên tố
-    if n > 1:
-        largest_prime = n
-    return largest_prime
+def is_safe_prime_generator(g, p):
+    """ For a safe prime p = 2q + 1, g generates Z_p* iff g^2 != 1 and g^q != 1 (mod p). """
+    g %= p
+    if (g == 0 or g == 1 or g == p - 1):
+        return False
+    return modular_exponentiation(g, (p - 1) // 2, p) != 1
+
+def largest_prime_factor(n):
+    """ Largest prime dividing n, 0 for n < 2. Trial division, Pollard-Brent rho and BPSW. """
+    return factorization.largest_prime_factor(n)
 
 
 def is_quadratic_residue(p, x):
-        return pow(x, (p - 1) // 2, p) == 1
+        return modular_exponentiation(x, (p - 1) // 2, p) == 1
+
+def sqrt_mod(n, p):
+    """ Square root of n modulo an odd prime p (Tonelli-Shanks), None if n is not a square. """
+    n %= p
+    if (n == 0):
+        return 0
+    #p = 3 (mod 4): a single exponentiation, and squaring the candidate replaces the residue test
+    if (p % 4 == 3):
+        r = modular_exponentiation(n, (p + 1) // 4, p)
+        return r if r * r % p == n else None
+    if not is_quadratic_residue(p, n):
+        return None
+    #p - 1 = q * 2^s with q odd
+    q, s = p - 1, 0
+    while (q % 2 == 0):
+        q //= 2
+        s += 1
+    #any non-residue z generates the 2-Sylow subgroup through z^q
+    z = 2
+    while is_quadratic_residue(p, z):
+        z += 1
+    m, c = s, modular_exponentiation(z, q, p)
+    t, r = modular_exponentiation(n, q, p), modular_exponentiation(n, (q + 1) // 2, p)
+    while (t != 1):
+        #least i with t^(2^i) = 1
+        i, t2 = 0, t
+        while (t2 != 1):
+            t2 = (t2 * t2) % p
+            i += 1
+        bb = modular_exponentiation(c, 1 << (m - i - 1), p)
+        m, c, t, r = i, (bb * bb) % p, (t * bb * bb) % p, (r * bb) % p
+    return r
 
 def find_point_on_curve(p, a, b):
     #chỉ cần tìm 1 điểm
     for x in range(p):
         y_square = (x**3 + a*x + b) % p
         if is_quadratic_residue(p, y_square):
-            for y in range(1, p//2 + 1):
-                m = modular_exponentiation(y,2,p)
-                if m == y_square:
-                    return (x, y)
-                
+            y = sqrt_mod(y_square, p)
+            #the smaller root, as the old scan over y in [1, p/2] returned
+            return (x, min(y, p - y))
+
 def is_primitive_root(p, a):
     if a == 0 or a == 1:
         return False
-    factors = set()
-    n = p - 1
-    d = 2
-    while d * d <= n:
-        while (n % d) == 0:
-            factors.add(d)
-            n //= d
-        d += 1
-    if n > 1:
-        factors.add(n)
-    for factor in factors:
-        if pow(a, (p - 1) // factor, p) == 1:
+    for factor in (factorization.factorize(p - 1) if p > 2 else ()):
+        if modular_exponentiation(a, (p - 1) // factor, p) == 1:
             return False
     return True
 
@@ -177,37 +680,110 @@ def is_point_on_curve(point, a, b, p):
     x, y = point
     return (y**2 - (x**3 + a*x + b)) % p == 0
 
+def is_singular_curve(a, b, p):
+    """ y^2 = x^3 + a x + b has a repeated root, and so is not an elliptic curve, iff 4 a^3 + 27 b^2 = 0 (mod p). """
+    return (4 * a**3 + 27 * b**2) % p == 0
+
+def integer_root(n, k):
+    """ floor(n^(1/k)) for n >= 0, exact for any size: Newton's method on integers. """
+    if (n < 0 or k < 1):
+        raise ValueError("integer_root needs n >= 0 and k >= 1")
+    if (k == 1 or n < 2):
+        return n
+    if (k == 2):
+        return isqrt(n)
+    #start above the root, the iteration then decreases until it reaches it
+    x = 1 << -(-n.bit_length() // k)
+    while True:
+        y = ((k - 1)*x + n // x**(k - 1)) // k
+        if (y >= x):
+            return x
+        x = y
+
+#exponents up to this bound get residue filters before the root is taken
+POWER_FILTER_MAX_EXPONENT = 64
+
+@lru_cache(maxsize=None)
+def _power_residue_filters(k):
+    """ (m, k-th powers mod m) for the first three primes m = 1 (mod k), where only about 1/k of the
+    units are k-th powers; for k = 2 the moduli 64, 63 and 65 are used instead. """
+    if (k == 2):
+        moduli = [64, 63, 65]
+    else:
+        moduli = []
+        m = k + 1
+        while len(moduli) < 3:
+            if is_probable_prime(m):
+                moduli.append(m)
+            m += k
+    return tuple((m, frozenset(modular_exponentiation(x, k, m) for x in range(m))) for m in moduli)
+
+def perfect_power(n):
+    """ (r, k) with r^k = n and k prime, or None when n is not a perfect power. Only prime k are tried
+    (every perfect power is a prime power of something), each after a 2-adic and a few modular filters. """
+    if (n < 2):
+        return None
+    #if n is even, k must divide the exponent of 2 in n
+    v = (n & -n).bit_length() - 1
+    for k in iter_primes(n.bit_length()):
+        if (v and v % k):
+            continue
+        if (k <= POWER_FILTER_MAX_EXPONENT and
+                any(n % m not in residues for m, residues in _power_residue_filters(k))):
+            continue
+        r = integer_root(n, k)
+        if (r**k == n):
+            return r, k
+    return None
+
 def is_perfect_power(n):
-    for b in range(2, int(log(n, 2)) + 1):
-        a = int(round(n ** (1 / b)))
-        if a ** b == n:
-            return True
-    return False
+    return perfect_power(n) is not None
 
-def find_smallest_r(n):
-    max_k = ceil(log(n, 2)**2)
-    for r in range(2, n):
-        for k in range(1, max_k):
-            if pow(n, k, r) == 1 or gcd(n, r) > 1:
+def _check_deadline(deadline):
+    if (deadline is not None and time.monotonic() > deadline):
+        raise TimeoutError("AKS time budget exceeded")
+
+def multiplicative_order(a, r):
+    """ ord_r(a): the smallest k > 0 with a^k = 1 (mod r), None when gcd(a, r) != 1. Starts from phi(r),
+    read off the factorizations of r and of p - 1 for each p | r, and divides out prime factors q while
+    a^(k/q) = 1 still holds. """
+    if (r == 1):
+        return 1
+    a %= r
+    if (gcd(a, r) != 1):
+        return None
+    phi_factors = {}
+    for p, e in factorization.factorize(r).items():
+        if (e > 1):
+            phi_factors[p] = phi_factors.get(p, 0) + e - 1
+        for q, f in factorization.factorize(p - 1).items():
+            phi_factors[q] = phi_factors.get(q, 0) + f
+    order = prod(q**f for q, f in phi_factors.items())
+    for q, f in phi_factors.items():
+        for _ in range(f):
+            if (modular_exponentiation(a, order // q, r) != 1):
                 break
-        else:
+            order //= q
+    return order
+
+def find_smallest_r(n, deadline=None):
+    """ Smallest r coprime to n with ord_r(n) >= ceil(log2(n)^2), or n when no r < n qualifies. """
+    max_k = ceil(log(n, 2)**2)
+    #ord_r(n) <= phi(r) <= r - 1, so no r <= max_k qualifies
+    for r in range(max(2, max_k + 1), n):
+        _check_deadline(deadline)
+        if (gcd(n, r) == 1 and multiplicative_order(n, r) >= max_k):
             return r
     return n
 
-def is_prime_aks(n):
-    if is_perfect_power(n):
-        return False
-    r = find_smallest_r(n)
-    for a in range(2, r + 1):
-        if 1 < gcd(a, n) < n:
-            return False
-
-    if n <= r:
-        return True
-    max_a = int(2 * isqrt(int(r * log(n, 2))))
-
-    for a in range(1, max_a + 1):
-        if not (pow(a, n, n) == a % n):
-            return False
+def is_prime_aks(n, time_budget=None, workers=None):
+    """ AKS primality proof, polynomial congruences included. With time_budget (seconds) it raises
+    TimeoutError instead of running on; workers is the size of the process pool checking them,
+    None leaving it to aks.AKS_WORKERS. """
+    #imported here, aks builds on find_smallest_r and is_perfect_power from this module
+    from MahuCrypt_app.cryptography.aks import is_prime_aks as _is_prime_aks
+    return _is_prime_aks(n, time_budget, workers)
 
-    return True
\ No newline at end of file
+#factorization builds on the primality tests above, so it is bound last and its functions are looked
+#up at call time, which works whichever of the two modules is imported first
+from MahuCrypt_app.cryptography import factorization
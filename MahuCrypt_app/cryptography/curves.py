@@ -0,0 +1,74 @@
+"""
+Registry of named elliptic curves y^2 = x^3 + a x + b over F_p.
+
+Each entry carries a base point G of prime order n and the cofactor h, so
+that key generation on a named curve skips point counting, factoring the
+group order and searching for a point. The fixed-base table of G used by
+fixed_base_mul is built on the first lookup of the curve.
+
+Curve25519 is given in short Weierstrass form (Wei25519): the Montgomery
+curve v^2 = u^3 + 486662 u^2 + u maps to it by x = u + 486662/3, with
+a = (3 - A^2)/3 and b = (2 A^3 - 9 A)/27.
+"""
+
+from collections import namedtuple
+from MahuCrypt_app.cryptography.algos import fixed_base_table
+
+Curve = namedtuple("Curve", ["name", "p", "a", "b", "G", "n", "h"])
+
+_P256 = 2**256 - 2**224 + 2**192 + 2**96 - 1
+_P384 = 2**384 - 2**128 - 2**96 + 2**32 - 1
+
+CURVES = {curve.name: curve for curve in [
+    Curve("secp256k1",
+          p=2**256 - 2**32 - 977,
+          a=0,
+          b=7,
+          G=(0x79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798,
+             0x483ada7726a3c4655da4fbfc0e1108a8fd17b448a68554199c47d08ffb10d4b8),
+          n=0xfffffffffffffffffffffffffffffffebaaedce6af48a03bbfd25e8cd0364141,
+          h=1),
+    Curve("P-256",
+          p=_P256,
+          a=_P256 - 3,
+          b=0x5ac635d8aa3a93e7b3ebbd55769886bc651d06b0cc53b0f63bce3c3e27d2604b,
+          G=(0x6b17d1f2e12c4247f8bce6e563a440f277037d812deb33a0f4a13945d898c296,
+             0x4fe342e2fe1a7f9b8ee7eb4a7c0f9e162bce33576b315ececbb6406837bf51f5),
+          n=0xffffffff00000000ffffffffffffffffbce6faada7179e84f3b9cac2fc632551,
+          h=1),
+    Curve("P-384",
+          p=_P384,
+          a=_P384 - 3,
+          b=0xb3312fa7e23ee7e4988e056be3f82d19181d9c6efe8141120314088f5013875ac656398d8a2ed19d2a85c8edd3ec2aef,
+          G=(0xaa87ca22be8b05378eb1c71ef320ad746e1d3b628ba79b9859f741e082542a385502f25dbf55296c3a545e3872760ab7,
+             0x3617de4a96262c6f5d9e98bf9292dc29f8f41dbd289a147ce9da3113b5f0b8c00a60b1ce1d7e819d7a431d7c90ea0e5f),
+          n=0xffffffffffffffffffffffffffffffffffffffffffffffffc7634d81f4372ddf581a0db248b0a77aecec196accc52973,
+          h=1),
+    Curve("Curve25519",
+          p=2**255 - 19,
+          a=0x2aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa984914a144,
+          b=0x7b425ed097b425ed097b425ed097b425ed097b425ed097b4260b5e9c7710c864,
+          G=(0x2aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaad245a,
+             0x20ae19a1b8a086b4e01edd2c7748d14c923d4d7e6d7c61b229e9c5a27eced3d9),
+          n=2**252 + 0x14def9dea2f79cd65812631a5cf5d3ed,
+          h=8),
+    #small curves of prime order, for working the arithmetic by hand
+    Curve("toy-17", p=17, a=2, b=2, G=(5, 1), n=19, h=1),
+    Curve("toy-1009", p=1009, a=1, b=14, G=(1, 4), n=1013, h=1),
+    Curve("toy-31", p=2**31 - 1, a=2, b=14, G=(1, 814455902), n=2147505293, h=1),
+]}
+
+#other standard names of the same curves
+CURVE_ALIASES = {"secp256r1": "P-256", "prime256v1": "P-256", "secp384r1": "P-384", "Wei25519": "Curve25519"}
+
+_curves_by_key = {name.lower(): curve for name, curve in CURVES.items()}
+_curves_by_key.update((alias.lower(), CURVES[name]) for alias, name in CURVE_ALIASES.items())
+
+
+def get_curve(name):
+    """ The named curve (case-insensitive, aliases accepted), with the fixed-base table of G built. """
+    curve = _curves_by_key.get(str(name).strip().lower())
+    if curve is None:
+        raise ValueError("Unknown curve %r, expected one of: %s" % (name, ", ".join(CURVES)))
+    fixed_base_table(curve.G, curve.a, curve.p, curve.n.bit_length() + 1)
+    return curve
@@ -0,0 +1,85 @@
+"""
+Integer factorization.
+
+Trial division by the cached SMALL_PRIMES table strips the small factors,
+Baillie-PSW recognises prime cofactors, and Pollard's rho with Brent's cycle
+detection splits whatever is left. Rho finds a factor p in about sqrt(p)
+steps, so curve orders of 64 to 128 bits factor in milliseconds unless they
+are a product of two large primes.
+"""
+
+from math import gcd
+import random
+from MahuCrypt_app.cryptography.algos import SMALL_PRIMES, is_prime_bpsw, perfect_power
+
+#every composite below this bound has a factor in SMALL_PRIMES
+TRIAL_DIVISION_BOUND = SMALL_PRIMES[-1] ** 2
+#products of this many |x - y| share one gcd in Brent's loop
+RHO_BATCH = 128
+
+
+def pollard_brent(n, rng=random):
+    """ A non-trivial factor of an odd composite n that is not a prime power of a small prime. """
+    while True:
+        y = rng.randrange(1, n)
+        c = rng.randrange(1, n)
+        g = r = q = 1
+        while (g == 1):
+            x = y
+            for _ in range(r):
+                y = (y*y + c) % n
+            k = 0
+            while (k < r and g == 1):
+                ys = y
+                for _ in range(min(RHO_BATCH, r - k)):
+                    y = (y*y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += RHO_BATCH
+            r *= 2
+        if (g == n):
+            #the batch overshot, redo it one step at a time from its start
+            g = 1
+            while (g == 1):
+                ys = (ys*ys + c) % n
+                g = gcd(abs(x - ys), n)
+        if (g != n):
+            return g
+        #x and y met mod n itself, try another polynomial
+
+
+def _split(n, factors, multiplicity=1):
+    if (n < TRIAL_DIVISION_BOUND or is_prime_bpsw(n)):
+        factors[n] = factors.get(n, 0) + multiplicity
+        return
+    #rho needs about sqrt(p) steps on p^2, so peel off powers first
+    power = perfect_power(n)
+    if power is not None:
+        _split(power[0], factors, multiplicity * power[1])
+        return
+    d = pollard_brent(n)
+    _split(d, factors, multiplicity)
+    _split(n // d, factors, multiplicity)
+
+
+def factorize(n):
+    """ {prime: exponent} for n >= 1, in increasing order of the primes. """
+    if (n < 1):
+        raise ValueError("n must be a positive integer")
+    factors = {}
+    for p in SMALL_PRIMES:
+        if (p * p > n):
+            break
+        while (n % p == 0):
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    if (n > 1):
+        _split(n, factors)
+    return dict(sorted(factors.items()))
+
+
+def largest_prime_factor(n):
+    """ Largest prime dividing n, 0 for n < 2. """
+    if (n < 2):
+        return 0
+    return max(factorize(n))
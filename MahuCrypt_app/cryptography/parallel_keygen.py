@@ -0,0 +1,139 @@
+"""
+Parallel prime search for key generation.
+
+parallel_primes(search, sizes) finds one prime per entry of `sizes` on a
+ProcessPoolExecutor. Every worker runs an independent random search, so
+several workers can chase the same slot at once. The first prime found for
+a slot wins: that slot's stop event is set, the other searches for it give
+up at their next window, and their workers move on to the slots still
+open. Wall time therefore drops with the number of cores instead of being
+the sum of the individual searches.
+
+`search` must be a module-level function search(bits, should_stop=...) that
+returns None once should_stop() is true, so that the pool can pickle it.
+
+The executor is created on first use and kept for the following requests,
+since starting its workers costs more than a search for small primes.
+Stop events cannot be handed to an executor that already runs, so each
+slot gets a token instead: the workers share an array of stop marks with
+the parent, and a slot is stopped once the mark at token % STOP_MARKS
+reaches its token. Sizes below PARALLEL_MIN_BITS, and machines with one
+core, are searched serially in the calling process.
+
+Workers are never started by fork: a forked child inherits whatever locks
+PRIME_POOL's refill threads hold at that moment and can deadlock on them.
+process_context() gives the forkserver context (spawn where the platform
+has no forkserver); it is shared with the AKS pool. As with any forkserver
+or spawn pool, a worker re-imports the main script of the program, so a
+script that calls parallel key generation or the AKS proof directly must
+keep that call under if __name__ == "__main__". The Django entry points
+already do.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+import itertools
+import multiprocessing
+import os
+import threading
+
+#imported by the forkserver once, so each worker forks with them loaded
+FORKSERVER_PRELOAD = ["MahuCrypt_app.cryptography.public_key_cryptography", "MahuCrypt_app.cryptography.aks"]
+
+#below this many bits a search takes less time than handing it to a worker
+PARALLEL_MIN_BITS = 512
+
+#stop marks shared with the workers, more than the slots a server has open at once
+STOP_MARKS = 4096
+
+#the executor kept between requests, its worker count and the stop marks it shares
+_pool = None
+_pool_workers = None
+_stop_marks = None
+_pool_lock = threading.Lock()
+_tokens = itertools.count(1)
+
+
+def process_context():
+    """ multiprocessing context for the process pools of this package: forkserver, else spawn. """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(FORKSERVER_PRELOAD)
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+def _init_worker(stop_marks):
+    global _stop_marks
+    _stop_marks = stop_marks
+
+
+def _search_slot(search, bits, token):
+    return token, search(bits, should_stop=lambda: _stop_marks[token % STOP_MARKS] >= token)
+
+
+def _get_pool(workers):
+    """ The shared executor, (re)created when there is none or it has another worker count. """
+    global _pool, _pool_workers, _stop_marks
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            context = process_context()
+            _stop_marks = context.Array("q", STOP_MARKS, lock=False)
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker,
+                                        initargs=(_stop_marks,))
+            _pool_workers = workers
+        return _pool, _stop_marks
+
+
+def _discard_pool(pool):
+    """ Drops a broken executor, so that the next request starts a new one. """
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+
+
+def _stop(stop_marks, token):
+    with _pool_lock:
+        i = token % STOP_MARKS
+        stop_marks[i] = max(stop_marks[i], token)
+
+
+def parallel_primes(search, sizes, workers=None):
+    """ [prime of sizes[0] bits, prime of sizes[1] bits, ...] searched on `workers` processes. """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or max(sizes) < PARALLEL_MIN_BITS:
+        return [search(bits) for bits in sizes]
+    pool, stop_marks = _get_pool(workers)
+    with _pool_lock:
+        tokens = [next(_tokens) for _ in sizes]
+    primes = [None] * len(sizes)
+    pending = set()
+    try:
+        #keep every worker busy, spreading the searches over the open slots
+        def submit(count):
+            open_slots = [i for i, p in enumerate(primes) if p is None]
+            return {pool.submit(_search_slot, search, sizes[slot], tokens[slot])
+                    for slot in (open_slots[i % len(open_slots)] for i in range(count))}
+        pending = submit(max(workers, len(sizes)))
+        while None in primes:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                token, p = future.result()
+                slot = tokens.index(token)
+                if p is not None and primes[slot] is None:
+                    primes[slot] = p
+                    _stop(stop_marks, token)
+            if None in primes:
+                pending |= submit(len(done))
+        return primes
+    except BrokenProcessPool:
+        _discard_pool(pool)
+        raise
+    finally:
+        for token in tokens:
+            _stop(stop_marks, token)
+        for future in pending:
+            future.cancel()
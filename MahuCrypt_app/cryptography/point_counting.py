@@ -0,0 +1,445 @@
+"""
+Point counting for y^2 = x^3 + ax + b over F_p.
+
+Small primes are counted directly with Euler's criterion. Larger primes use
+Schoof's algorithm to find the trace t mod a few small primes l, then a
+baby-step giant-step search (Mestre) over the remaining candidates of the
+Hasse interval |t| <= 2*sqrt(p) finishes the job.
+
+Everything is pure Python: about 0.25 s at 64 bits, 2.5 s at 96 bits, 40 s
+at 128 bits and 5-6 minutes at 160 bits. Key generation therefore caps random
+curves at ECC_RANDOM_CURVE_MAX_BITS and leaves larger sizes to the named
+curves of curves.py.
+"""
+
+from math import isqrt
+import random
+from MahuCrypt_app.cryptography.algos import (
+    sieve_of_eratosthenes, sqrt_mod, modular_exponentiation, JACOBIAN_INFINITY, jacobian_double, jacobian_add, wnaf
+)
+
+#below this p the O(p) count is cheaper than anything clever
+NAIVE_LIMIT = 1 << 16
+#stop running Schoof once the baby-step giant-step search has at most this many candidates
+BSGS_CANDIDATES = 1 << 30
+#discard a BSGS run when the point's order is so small that too many candidates match
+_MAX_MATCHES = 32
+
+_SCHOOF_PRIMES = sieve_of_eratosthenes(400)[1:]
+
+#Polynomials over F_p: lists of coefficients, lowest degree first, no trailing zeros
+
+def _poly_trim(f):
+    while f and f[-1] == 0:
+        f.pop()
+    return f
+
+def _poly_add(f, g, p):
+    if len(f) < len(g):
+        f, g = g, f
+    res = list(f)
+    for i, c in enumerate(g):
+        res[i] = (res[i] + c) % p
+    return _poly_trim(res)
+
+def _poly_sub(f, g, p):
+    res = list(f) + [0] * (len(g) - len(f))
+    for i, c in enumerate(g):
+        res[i] = (res[i] - c) % p
+    return _poly_trim(res)
+
+def _poly_scale(f, c, p):
+    return _poly_trim([(x * c) % p for x in f])
+
+def _pack(f, slot):
+    return int.from_bytes(b"".join(c.to_bytes(slot, "little") for c in f), "little")
+
+def _unpack(H, n, slot, p):
+    """ The n lowest coefficients packed in H, reduced mod p. """
+    data = (H & ((1 << (8 * slot * n)) - 1)).to_bytes(n * slot, "little")
+    return _poly_trim([int.from_bytes(data[i:i + slot], "little") % p for i in range(0, n * slot, slot)])
+
+def _slot(p, terms):
+    """ Bytes per packed coefficient so that a sum of `terms` products of residues cannot overflow. """
+    return (2 * p.bit_length() + terms.bit_length() + 7) // 8
+
+def _poly_mul(f, g, p):
+    """ Multiplies two polynomials with Kronecker substitution: pack, one big-int product, unpack. """
+    if not f or not g:
+        return []
+    slot = _slot(p, min(len(f), len(g)))
+    F = _pack(f, slot)
+    H = F * F if f is g else F * _pack(g, slot)
+    return _unpack(H, len(f) + len(g) - 1, slot, p)
+
+def _poly_divmod_small(f, g, p):
+    """ Schoolbook division, only used on tiny polynomials. """
+    f = list(f)
+    inv = pow(g[-1], -1, p)
+    q = [0] * max(len(f) - len(g) + 1, 0)
+    while len(f) >= len(g) and f:
+        c = (f[-1] * inv) % p
+        shift = len(f) - len(g)
+        q[shift] = c
+        for i, gc in enumerate(g):
+            f[shift + i] = (f[shift + i] - c * gc) % p
+        _poly_trim(f)
+    return _poly_trim(q), f
+
+def _poly_gcd(f, g, p):
+    while g:
+        f, g = g, _poly_divmod_small(f, g, p)[1]
+    return f
+
+
+class _QuotientRing:
+    """ Arithmetic in F_p[x]/(h) for a monic h, reduction by Barrett's method with a precomputed inverse. """
+
+    def __init__(self, h, p):
+        self.h = h
+        self.p = p
+        self.d = len(h) - 1
+        self.slot = _slot(p, self.d)
+        #inverse of reverse(h) as a power series mod x^(d-1)
+        rev = h[::-1]
+        n = max(self.d - 1, 1)
+        inv = [1]
+        prec = 1
+        while prec < n:
+            prec = min(2 * prec, n)
+            e = _poly_mul(rev[:prec], inv, p)[:prec]
+            e = _poly_sub([2], e, p)
+            inv = _poly_mul(inv, e, p)[:prec]
+        self.packed_inv = _pack(inv, self.slot)
+        self.packed_h = _pack(h, self.slot)
+
+    def reduce(self, a):
+        d = self.d
+        if len(a) <= d:
+            return a
+        p = self.p
+        slot = self.slot
+        k = len(a) - 1 - d
+        q = _unpack(_pack(a[::-1][:k + 1], slot) * self.packed_inv, k + 1, slot, p)
+        q = _poly_trim((q + [0] * (k + 1 - len(q)))[::-1])
+        return _poly_sub(a[:d], _unpack(_pack(q, slot) * self.packed_h, d, slot, p), p)
+
+    def mul(self, f, g):
+        if not f or not g:
+            return []
+        F = _pack(f, self.slot)
+        H = F * F if f is g else F * _pack(g, self.slot)
+        return self.reduce(_unpack(H, len(f) + len(g) - 1, self.slot, self.p))
+
+    def sqr(self, f):
+        return self.mul(f, f)
+
+    def pow(self, f, e):
+        result = [1]
+        for bit in bin(e)[2:]:
+            result = self.sqr(result)
+            if bit == "1":
+                result = self.mul(result, f)
+        return result
+
+    def pow_x(self, e):
+        """ x^e, multiplying by x is a shift so only the squarings cost anything. """
+        result = [1]
+        for bit in bin(e)[2:]:
+            result = self.sqr(result)
+            if bit == "1":
+                result = self.reduce([0] + result)
+        return result
+
+    def composer(self, u):
+        """ Returns g -> g(u) mod h by Brent-Kung: baby powers u^0..u^(m-1) and Horner in u^m. """
+        p = self.p
+        m = isqrt(self.d) + 1
+        powers = [[1], u]
+        while len(powers) <= m:
+            powers.append(self.mul(powers[-1], u))
+        giant = powers[m]
+        slot = _slot(p, m)
+        packed = [_pack(power, slot) for power in powers[:m]]
+
+        def compose(g):
+            result = []
+            for j in range((len(g) - 1) // m, -1, -1):
+                acc = sum(c * packed[i] for i, c in enumerate(g[j * m:(j + 1) * m]) if c)
+                result = _poly_add(self.mul(result, giant), _unpack(acc, self.d, slot, p), p)
+            return result
+
+        return compose
+
+
+def _division_polynomial(l, a, b, p):
+    """ psi_l for odd l, as a polynomial in x only. """
+    F2 = _poly_mul([4 * b % p, 4 * a % p, 0, 4], [4 * b % p, 4 * a % p, 0, 4], p)
+    f = {
+        0: [],
+        1: [1],
+        2: [1],
+        3: _poly_trim([(-a * a) % p, (12 * b) % p, (6 * a) % p, 0, 3 % p]),
+        4: _poly_trim([(-2 * (8 * b * b + a ** 3)) % p, (-8 * a * b) % p, (-10 * a * a) % p,
+                       (40 * b) % p, (10 * a) % p, 0, 2 % p]),
+    }
+
+    def get(n):
+        if n in f:
+            return f[n]
+        m = n // 2
+        if n % 2 == 1:
+            u = _poly_mul(get(m + 2), _poly_mul(get(m), _poly_mul(get(m), get(m), p), p), p)
+            v = _poly_mul(get(m - 1), _poly_mul(get(m + 1), _poly_mul(get(m + 1), get(m + 1), p), p), p)
+            if m % 2 == 0:
+                u = _poly_mul(F2, u, p)
+            else:
+                v = _poly_mul(F2, v, p)
+            f[n] = _poly_sub(u, v, p)
+        else:
+            u = _poly_mul(get(m + 2), _poly_mul(get(m - 1), get(m - 1), p), p)
+            v = _poly_mul(get(m - 2), _poly_mul(get(m + 1), get(m + 1), p), p)
+            f[n] = _poly_mul(get(m), _poly_sub(u, v, p), p)
+        return f[n]
+
+    return get(l)
+
+
+#Points over F_p[x]/(psi_l) in Jacobian coordinates (X, Y, Z) standing for (X/Z^2, y*Y/Z^3),
+#y being the generic y with y^2 = f(x). Every formula is inversion-free so no gcd is ever needed.
+
+def _ring_add(R, f, P1, P2):
+    X1, Y1, Z1 = P1
+    X2, Y2, Z2 = P2
+    p = R.p
+    Z1Z1 = R.sqr(Z1)
+    Z2Z2 = R.sqr(Z2)
+    U1 = R.mul(X1, Z2Z2)
+    U2 = R.mul(X2, Z1Z1)
+    S1 = R.mul(Y1, R.mul(Z2, Z2Z2))
+    S2 = R.mul(Y2, R.mul(Z1, Z1Z1))
+    H = _poly_sub(U2, U1, p)
+    r = _poly_sub(S2, S1, p)
+    HH = R.sqr(H)
+    HHH = R.mul(H, HH)
+    V = R.mul(U1, HH)
+    X3 = _poly_sub(_poly_sub(R.mul(f, R.sqr(r)), HHH, p), _poly_add(V, V, p), p)
+    Y3 = _poly_sub(R.mul(r, _poly_sub(V, X3, p)), R.mul(S1, HHH), p)
+    Z3 = R.mul(H, R.mul(Z1, Z2))
+    return (X3, Y3, Z3)
+
+def _ring_double(R, f, a, P):
+    X, Y, Z = P
+    p = R.p
+    YY = R.mul(f, R.sqr(Y))
+    S = _poly_scale(R.mul(X, YY), 4, p)
+    ZZ = R.sqr(Z)
+    M = _poly_add(_poly_scale(R.sqr(X), 3, p), _poly_scale(R.sqr(ZZ), a, p), p)
+    X3 = _poly_sub(R.sqr(M), _poly_add(S, S, p), p)
+    Y3 = _poly_sub(R.mul(M, _poly_sub(S, X3, p)), _poly_scale(R.sqr(YY), 8, p), p)
+    Z3 = _poly_scale(R.mul(Y, Z), 2, p)
+    #the true Z3 carries a factor y; rescaling by y keeps X, Z free of y and Y a multiple of y
+    return (R.mul(f, X3), R.mul(f, Y3), R.mul(f, Z3))
+
+def _ring_scalar(R, f, a, P, n):
+    T = P
+    for bit in bin(n)[3:]:
+        T = _ring_double(R, f, a, T)
+        if bit == "1":
+            T = _ring_add(R, f, T, P)
+    return T
+
+def _ring_same_x(R, P1, P2):
+    return R.mul(P1[0], R.sqr(P2[2])) == R.mul(P2[0], R.sqr(P1[2]))
+
+def _ring_same_y(R, P1, P2):
+    Z1, Z2 = P1[2], P2[2]
+    return R.mul(P1[1], R.mul(Z2, R.sqr(Z2))) == R.mul(P2[1], R.mul(Z1, R.sqr(Z1)))
+
+
+def _trace_mod_2(p, a, b):
+    """ t is even exactly when x^3 + ax + b has a root in F_p, i.e. E has a point of order 2. """
+    f = _poly_trim([b, a, 0, 1])
+    xp = [1]
+    for bit in bin(p)[2:]:
+        xp = _poly_divmod_small(_poly_mul(xp, xp, p), f, p)[1]
+        if bit == "1":
+            xp = _poly_divmod_small([0] + xp, f, p)[1]
+    g = _poly_gcd(f, _poly_sub(xp, [0, 1], p), p)
+    return 0 if len(g) > 1 else 1
+
+def _trace_mod_l(l, p, a, b):
+    """ Schoof: the t in [0, l) with pi^2 - t*pi + p = 0 on the l-torsion. """
+    psi = _division_polynomial(l, a, b, p)
+    h = _poly_scale(psi, pow(psi[-1], -1, p), p)
+    R = _QuotientRing(h, p)
+    f = R.reduce(_poly_trim([b, a, 0, 1]))
+    #Frobenius: pi(x, y) = (x^p, y * f^((p-1)/2))
+    xp = R.pow_x(p)
+    yp = R.pow(f, (p - 1) // 2)
+    frob = (xp, yp, [1])
+    #pi^2 by composition, g(x)^p = g(x^p) for any g over F_p
+    compose = R.composer(xp)
+    frob2 = (compose(xp), R.mul(yp, compose(yp)), [1])
+    generic = ([0, 1], [1], [1])
+    q = p % l
+    S = _ring_add(R, f, frob2, _ring_scalar(R, f, a, generic, q))
+    if not S[0] and not S[1] and not S[2]:
+        #pi^2 = q on the whole l-torsion, so pi = +-w with w^2 = q and t = +-2w
+        roots = [w for w in range(1, l) if (w * w) % l == q]
+        if not roots:
+            return 0
+        w = roots[0]
+        if _ring_same_y(R, frob, _ring_scalar(R, f, a, generic, w)):
+            return (2 * w) % l
+        return (-2 * w) % l
+    T = frob
+    for tau in range(1, (l + 1) // 2):
+        if tau == 2:
+            T = _ring_double(R, f, a, frob)
+        elif tau > 2:
+            T = _ring_add(R, f, T, frob)
+        if _ring_same_x(R, S, T):
+            return tau if _ring_same_y(R, S, T) else l - tau
+    return 0
+
+
+#Points over F_p in affine form, None is the point at infinity
+
+def _random_point(p, a, b):
+    while True:
+        x = random.randrange(p)
+        rhs = (x * x * x + a * x + b) % p
+        if rhs != 0 and modular_exponentiation(rhs, (p - 1) // 2, p) == 1:
+            return (x, sqrt_mod(rhs, p))
+
+def _add(P, Q, a, p):
+    if P is None:
+        return Q
+    if Q is None:
+        return P
+    x1, y1 = P
+    x2, y2 = Q
+    if x1 == x2:
+        if (y1 + y2) % p == 0:
+            return None
+        lam = ((3 * x1 * x1 + a) * pow(2 * y1, -1, p)) % p
+    else:
+        lam = ((y2 - y1) * pow(x2 - x1, -1, p)) % p
+    x3 = (lam * lam - x1 - x2) % p
+    return (x3, (lam * (x1 - x3) - y1) % p)
+
+def _neg(P, p):
+    return None if P is None else (P[0], (-P[1]) % p)
+
+def _mul(P, n, a, p):
+    if n < 0:
+        P, n = _neg(P, p), -n
+    if P is None or n == 0:
+        return None
+    J = (P[0], P[1], 1)
+    nJ = (P[0], (-P[1]) % p, 1)
+    T = JACOBIAN_INFINITY
+    for d in reversed(wnaf(n, 2)):
+        T = jacobian_double(T, a, p)
+        if d == 1:
+            T = jacobian_add(T, J, a, p)
+        elif d == -1:
+            T = jacobian_add(T, nJ, a, p)
+    X, Y, Z = T
+    if Z % p == 0:
+        return None
+    z_inv = pow(Z, -1, p)
+    return ((X * z_inv * z_inv) % p, (Y * z_inv * z_inv * z_inv) % p)
+
+def _bsgs(S, R, K, a, p):
+    """ All j in [0, K) with j*S == R, or None when there are too many to be useful. """
+    m = isqrt(K // 2) + 1
+    baby = {}
+    T = None
+    for i in range(m + 1):
+        if T is not None:
+            baby.setdefault(T[0], []).append((i, T[1]))
+        T = _add(T, S, a, p)
+    step = _neg(_mul(S, 2 * m + 1, a, p), p)
+    matches = set()
+    G = R
+    for c in range(K // (2 * m + 1) + 2):
+        base = c * (2 * m + 1)
+        if G is None:
+            matches.add(base)
+        else:
+            for i, y in baby.get(G[0], ()):
+                if y == G[1]:
+                    matches.add(base + i)
+                if (y + G[1]) % p == 0:
+                    matches.add(base - i)
+        if len(matches) > _MAX_MATCHES:
+            return None
+        G = _add(G, step, a, p)
+    return sorted(j for j in matches if 0 <= j < K)
+
+def _finish_with_bsgs(p, a, b, t0, M, hasse):
+    """ Finds t = t0 (mod M) with |t| <= hasse from random points on E and on its quadratic twist. """
+    j_min = -((hasse + t0) // M)
+    j_max = (hasse - t0) // M
+    K = j_max - j_min + 1
+    if K == 1:
+        return t0 + M * j_min
+    g = 2
+    while modular_exponentiation(g, (p - 1) // 2, p) != p - 1:
+        g += 1
+    twist = ((a * g * g) % p, (b * g * g * g) % p)
+    candidates = None
+    for attempt in range(64):
+        on_twist = attempt % 4 == 3
+        ca, cb = twist if on_twist else (a, b)
+        Q = _random_point(p, ca, cb)
+        sign = -1 if on_twist else 1
+        if candidates is None:
+            ##E = p + 1 - t, #E_twist = p + 1 + t, t = t0 + M*(j_min + j)
+            S = _mul(Q, sign * M, ca, p)
+            R = _mul(Q, p + 1 - sign * (t0 + M * j_min), ca, p)
+            found = _bsgs(S, R, K, ca, p)
+            if found is None:
+                continue
+            candidates = [t0 + M * (j_min + j) for j in found]
+        else:
+            candidates = [t for t in candidates if _mul(Q, p + 1 - sign * t, ca, p) is None]
+        if len(candidates) == 1:
+            return candidates[0]
+    raise ValueError("Point counting did not converge")
+
+def _count_points_naive(p, a, b):
+    count = 1
+    half = (p - 1) // 2
+    for x in range(p):
+        y_square = (x**3 + a*x + b) % p
+        if y_square == 0:
+            count += 1
+        elif modular_exponentiation(y_square, half, p) == 1:
+            count += 2
+    return count
+
+def crt_combine(r1, m1, r2, m2):
+    """ The x mod m1*m2 with x = r1 (mod m1) and x = r2 (mod m2), m1 and m2 coprime. """
+    x = r1 + m1 * (((r2 - r1) * pow(m1, -1, m2)) % m2)
+    return x % (m1 * m2), m1 * m2
+
+def count_points(p, a, b):
+    """ Returns the number of points on y^2 = x^3 + ax + b over F_p, the point at infinity included. """
+    if p < NAIVE_LIMIT:
+        return _count_points_naive(p, a, b)
+    a %= p
+    b %= p
+    if (4 * a**3 + 27 * b**2) % p == 0:
+        raise ValueError("Singular curve")
+    hasse = isqrt(4 * p)
+    t, M = _trace_mod_2(p, a, b), 2
+    for l in _SCHOOF_PRIMES:
+        if (2 * hasse) // M + 1 <= BSGS_CANDIDATES:
+            break
+        if l == p:
+            continue
+        t, M = crt_combine(t, M, _trace_mod_l(l, p, a, b), l)
+    return p + 1 - _finish_with_bsgs(p, a, b, t, M, hasse)
@@ -34,3 +34,37 @@ def convert_int_to_str(number):
         number = number // 26
     return res
 
+
+#modulus-sized packing: bytes of the message length in front of the packed data
+PACKED_LENGTH_BYTES = 4
+
+def packed_block_size(modulus):
+    """
+    Bytes per packed block: the most whole bytes whose value is always below the modulus
+    """
+    size = (modulus.bit_length() - 1) // 8
+    if size < 1:
+        raise ValueError("the modulus must have at least 9 bits to pack bytes")
+    return size
+
+def pack_blocks(string, modulus):
+    """
+    Packs the UTF-8 bytes of the string into as few integers below the modulus as possible:
+    a length prefix, the message, then zero bytes up to a whole number of blocks
+    """
+    size = packed_block_size(modulus)
+    data = string.encode("utf-8")
+    data = len(data).to_bytes(PACKED_LENGTH_BYTES, "big") + data
+    data += bytes(-len(data) % size)
+    return [int.from_bytes(data[i:i + size], "big") for i in range(0, len(data), size)]
+
+def unpack_blocks(blocks, modulus):
+    """
+    Inverse of pack_blocks: the length prefix says where the message ends and the padding starts
+    """
+    size = packed_block_size(modulus)
+    data = b"".join(block.to_bytes(size, "big") for block in blocks)
+    length = int.from_bytes(data[:PACKED_LENGTH_BYTES], "big")
+    if length > len(data) - PACKED_LENGTH_BYTES:
+        raise ValueError("the length prefix does not match the packed blocks")
+    return data[PACKED_LENGTH_BYTES:PACKED_LENGTH_BYTES + length].decode("utf-8")
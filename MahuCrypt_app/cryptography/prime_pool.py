@@ -0,0 +1,114 @@
+"""
+Background pool of ready-made primes.
+
+Key generation at 512, 1024 and 2048 bits spends nearly all of its time in
+the prime search. A PrimePool keeps up to `capacity` primes per size in a
+queue, and one daemon thread per size refills its queue whenever a prime
+is taken. take(bits) never waits: an empty queue counts as a miss and the
+caller searches synchronously, as it did before the pool existed.
+
+The refill threads run in the web process, and a prime search holds the
+GIL while it runs, so every refill competes with the request threads for
+the interpreter. Refills are therefore throttled: only one search runs at
+a time across all sizes, and a search of t seconds is followed by a pause
+of t (1 - d) / d, so the pool uses at most a share d (duty_cycle) of one
+core. The trade-off is the refill rate: at d = 0.25 a size whose search
+takes 1 s gets a new prime every 4 s at best, so a burst of keys of that
+size drains the pool and the extra requests fall back to the synchronous
+search. A search never runs in another process, since a pool worker
+started by forkserver or spawn re-runs the main script of whatever
+program imported this module.
+
+The refill thread of a size starts on the first take() of that size, so
+importing the module costs nothing and sizes nobody asks for are never
+generated.
+"""
+
+import os
+import queue
+import threading
+import time
+
+PRIME_POOL_SIZES = (512, 1024, 2048)
+#primes kept per size; MAHUCRYPT_PRIME_POOL_CAPACITY overrides it and 0 turns the pool off
+PRIME_POOL_CAPACITY = int(os.environ.get("MAHUCRYPT_PRIME_POOL_CAPACITY", 4))
+#share of one core the refill searches may take; MAHUCRYPT_PRIME_POOL_DUTY_CYCLE overrides it
+PRIME_POOL_DUTY_CYCLE = float(os.environ.get("MAHUCRYPT_PRIME_POOL_DUTY_CYCLE", 0.25))
+
+
+class PrimePool:
+    """ Pre-generated primes per bit size, refilled by throttled background threads. """
+
+    def __init__(self, generate, sizes=PRIME_POOL_SIZES, capacity=PRIME_POOL_CAPACITY,
+                 duty_cycle=PRIME_POOL_DUTY_CYCLE):
+        if not 0 < duty_cycle <= 1:
+            raise ValueError("duty_cycle must be in (0, 1]")
+        self.generate = generate
+        self.capacity = capacity
+        self.duty_cycle = duty_cycle
+        self._queues = {bits: queue.Queue(maxsize=capacity) for bits in sizes} if capacity > 0 else {}
+        self._workers = {}
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._search_lock = threading.Lock()
+        self._hits = dict.fromkeys(self._queues, 0)
+        self._misses = dict.fromkeys(self._queues, 0)
+
+    def start(self, bits=None):
+        """ Start the refill thread of one size, or of every size when bits is None. """
+        with self._lock:
+            self._stopped.clear()
+            for size in (self._queues if bits is None else [bits]):
+                worker = self._workers.get(size)
+                if worker is None or not worker.is_alive():
+                    worker = threading.Thread(target=self._refill, args=(size,), daemon=True,
+                                              name="prime-pool-%d" % size)
+                    self._workers[size] = worker
+                    worker.start()
+
+    def stop(self):
+        """ Ask the refill threads to exit; each finishes the prime it is working on. """
+        self._stopped.set()
+
+    def _refill(self, bits):
+        pool = self._queues[bits]
+        while not self._stopped.is_set():
+            with self._search_lock:
+                started = time.monotonic()
+                p = self.generate(bits)
+                #pause with the lock held, so that the budget covers the searches of every size
+                self._stopped.wait((time.monotonic() - started) * (1 - self.duty_cycle) / self.duty_cycle)
+            while not self._stopped.is_set():
+                try:
+                    pool.put(p, timeout=0.5)
+                    break
+                except queue.Full:
+                    continue
+
+    def take(self, bits):
+        """ A pooled prime of exactly `bits` bits, or None when the pool has none ready. """
+        if bits not in self._queues:
+            return None
+        if self._workers.get(bits) is None:
+            self.start(bits)
+        try:
+            p = self._queues[bits].get_nowait()
+        except queue.Empty:
+            with self._lock:
+                self._misses[bits] += 1
+            return None
+        with self._lock:
+            self._hits[bits] += 1
+        return p
+
+    def metrics(self):
+        """ Hits, misses, hit rate and primes ready, per size and in total. """
+        with self._lock:
+            sizes = {}
+            for bits, pool in self._queues.items():
+                hits, misses = self._hits[bits], self._misses[bits]
+                sizes[bits] = {"available": pool.qsize(), "capacity": self.capacity, "hits": hits,
+                               "misses": misses, "hit_rate": hits / (hits + misses) if hits + misses else 0.0}
+            hits, misses = sum(self._hits.values()), sum(self._misses.values())
+        return {"sizes": sizes, "hits": hits, "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0}
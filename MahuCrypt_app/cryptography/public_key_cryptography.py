@@ -1,80 +1,240 @@
 from MahuCrypt_app.cryptography.algos import *
 from MahuCrypt_app.cryptography.pre_process import *
+from MahuCrypt_app.cryptography.point_counting import count_points
+from MahuCrypt_app.cryptography.prime_pool import PrimePool
+from MahuCrypt_app.cryptography.parallel_keygen import parallel_primes
+from MahuCrypt_app.cryptography.curves import get_curve
 from numpy import *
 import secrets
 import re
+from functools import lru_cache
 
-def get_prime_number(bits):
+def search_prime_number(bits, incremental=True, should_stop=None):
+    """
+    Random prime with exactly `bits` bits, searched now. The incremental search draws one odd start
+    point, sieves a window of odd candidates after it and only tests the survivors; incremental=False
+    draws every candidate independently. should_stop is checked before each window (each candidate
+    when not incremental); once it returns True the search gives up and returns None.
+    """
+    if not incremental or bits <= 16:
+        while True:
+            if should_stop is not None and should_stop():
+                return None
+            p = secrets.randbits(bits)
+            if p >= 2**(bits - 1) and p < 2**bits and is_probable_prime(p):
+                return p
+    #about 3 times the expected gap between primes of this size, sieving bound growing with the test cost
+    window = 2 * bits if bits > 32 else 64
+    limit = bits * bits if bits < 181 else 1 << 15
     while True:
-        p = secrets.randbits(bits)
-        if p >= 2**(bits - 1) and p < 2**bits and miller_rabin_test(p, 10000):
-            return p
+        if should_stop is not None and should_stop():
+            return None
+        start = secrets.randbits(bits - 1) | (1 << (bits - 1)) | 1
+        mask = sieve_odd_window(start, window, limit)
+        i = mask.find(1)
+        while i != -1:
+            p = start + 2 * i
+            if p >= 2**bits:
+                break
+            if is_probable_prime(p):
+                return p
+            i = mask.find(1, i + 1)
+
+def get_safe_prime(bits):
+    """
+    Random safe prime p = 2q + 1 (q prime) with exactly `bits` bits and p = 3 (mod 8), so that 2 is a
+    quadratic non-residue and therefore generates Z_p*. One sieve pass removes every q for which q or
+    2q + 1 has a small factor; q then gets a base-2 test, p a single Fermat test (Pocklington: with q
+    prime and q > sqrt(p), 2^(p-1) = 1 (mod p) proves p prime) and q the full probable-prime test.
+    """
+    if bits < 6:
+        #11 is the only one below 32
+        raise ValueError("safe primes p = 3 (mod 8) need at least 6 bits")
+    if bits <= 16:
+        while True:
+            q = secrets.randbits(bits - 1)
+            p = 2 * q + 1
+            if p >> (bits - 1) == 1 and p % 8 == 3 and is_probable_prime(q) and is_probable_prime(p):
+                return p
+    window = 8 * bits
+    limit = bits * bits if bits < 181 else 1 << 15
+    while True:
+        #q in [2^(bits-2), 2^(bits-1)), q = 1 (mod 4)
+        start = (secrets.randbits(bits - 2) | (1 << (bits - 2))) & ~3 | 1
+        mask = sieve_safe_prime_window(start, window, limit)
+        i = mask.find(1)
+        while i != -1:
+            q = start + 4 * i
+            if q >= 2**(bits - 1):
+                break
+            p = 2 * q + 1
+            if (is_strong_probable_prime(q, 2) and modular_exponentiation(2, p - 1, p) == 1
+                    and is_probable_prime(q)):
+                return p
+            i = mask.find(1, i + 1)
+
+#primes for the common key sizes, refilled in the background
+PRIME_POOL = PrimePool(search_prime_number)
+
+def get_prime_number(bits, incremental=True):
+    """
+    Random prime with exactly `bits` bits: taken from PRIME_POOL when it has one of that size ready,
+    searched synchronously otherwise.
+    """
+    p = PRIME_POOL.take(bits) if incremental else None
+    if p is None:
+        p = search_prime_number(bits, incremental)
+    return p
 
 #Create RSA keys
 
-def create_RSA_keys(bits):
-    p = get_prime_number(bits)
-    q = get_prime_number(bits)
+#worker processes for create_RSA_keys(bits, parallel=True), None means os.cpu_count()
+RSA_KEYGEN_WORKERS = None
+
+def create_RSA_keys(bits, parallel=False, workers=None):
+    """
+    RSA keys with p, q of `bits` bits and e of bits - 1 bits. With parallel=True the primes that
+    PRIME_POOL cannot supply are searched together on a process pool (see parallel_primes), on
+    `workers` processes, None falling back to RSA_KEYGEN_WORKERS.
+    """
+    if workers is None:
+        workers = RSA_KEYGEN_WORKERS
+    if parallel:
+        sizes = [bits, bits, bits - 1]
+        primes = [PRIME_POOL.take(size) for size in sizes]
+        missing = [i for i, prime in enumerate(primes) if prime is None]
+        if missing:
+            found = parallel_primes(search_prime_number, [sizes[i] for i in missing], workers)
+            for i, prime in zip(missing, found):
+                primes[i] = prime
+        p, q, e = primes
+    else:
+        p = get_prime_number(bits)
+        q = get_prime_number(bits)
+        e = get_prime_number(bits - 1)
     n = p * q
     phi_n = (p - 1) * (q - 1)
-    e = get_prime_number(bits - 1)
     d = Ext_Euclide(e, phi_n)[1] % phi_n
     return {"public_key": { "n" : str(n), "e": str(e)}, "private_key": {"d": str(d), "p": str(p), "q": str(q)}}
 
 #Create El Gamal keys
 
-def create_ELGAMAL_keys(bits):
-    p = get_prime_number(bits)
+#group parameters kept for create_ELGAMAL_keys(bits, reuse_group=True), one entry per key size
+ELGAMAL_GROUP_CACHE_SIZE = 8
+
+def generate_elgamal_group(bits):
+    """
+    (p, alpha) with alpha = 2 a verified generator of Z_p*. From 6 bits on p is a safe prime and the
+    check costs one exponentiation; below 6 bits there is no such prime and 2 is tested against the
+    factors of p - 1 instead. Below 3 bits the only primes are 2 and 3, whose groups Z_2* = {1} and
+    Z_3* = {1, 2} leave nothing to hide, so those sizes are refused.
+    """
     alpha = 2
+    if bits < 3:
+        raise ValueError("ElGamal groups need at least 3 bits")
+    if bits < 6:
+        while True:
+            p = get_prime_number(bits)
+            if is_primitive_root(p, alpha):
+                return p, alpha
+    p = get_safe_prime(bits)
+    if not is_safe_prime_generator(alpha, p):
+        raise ValueError("2 does not generate Z_p* for the generated safe prime")
+    return p, alpha
+
+@lru_cache(maxsize=ELGAMAL_GROUP_CACHE_SIZE)
+def elgamal_group(bits):
+    """ Cached generate_elgamal_group: keys of the same size share p and alpha. """
+    return generate_elgamal_group(bits)
+
+def create_ELGAMAL_keys(bits, reuse_group=False):
+    p, alpha = elgamal_group(bits) if reuse_group else generate_elgamal_group(bits)
     a = secrets.randbelow(p - 1) + 1
     beta = modular_exponentiation(alpha, a, p)
     return {"public_key": {"p": str(p), "alpha" : str(alpha), "beta": str(beta)}, "private_key - a": str(a)}
 
 #Create ECC keys
-def create_ECC_keys(bits):
+
+#largest prime for a random curve: counting its points (Schoof, pure Python) takes about 2 s at 96 bits,
+#40 s at 128 bits and several minutes at 160 bits, so larger keys use a named curve instead
+ECC_RANDOM_CURVE_MAX_BITS = 96
+
+def create_ECC_keys(bits, curve=None):
+    """
+    ECC keys on a random curve over a `bits`-bit prime, or on the named curve `curve` (see curves.py),
+    whose order and base point are already known. Random curves are limited to ECC_RANDOM_CURVE_MAX_BITS.
+    """
+    if curve is not None:
+        curve = get_curve(curve)
+        s = secrets.randbelow(curve.n - 1) + 1
+        B = fixed_base_mul(curve.G, s, curve.a, curve.p)
+        return {"public_key": {"p": str(curve.p), "a": str(curve.a), "b": str(curve.b), "P": str(curve.G), "B": str(B)}, "private_key": str(s), "public_details": {"number_of_points": str(curve.n * curve.h), "curve": curve.name}}
+    if bits > ECC_RANDOM_CURVE_MAX_BITS:
+        raise ValueError("random curves are limited to %d bits, use a named curve (e.g. P-256) for larger keys"
+                         % ECC_RANDOM_CURVE_MAX_BITS)
     p = get_prime_number(bits)
     while True:
         a = secrets.randbelow(20 - 1) + 1
         b = secrets.randbelow(20 - 1) + 1
-        if 4*a**3 + 27*b**2 != 0:
+        if (4*a**3 + 27*b**2) % p != 0:
             break
-    l = 0
-    #points_on_curve=[]
-    quadratic_residue = find_quadratic_residue(p)
-    for x in range(0, p):
-        y_pow_2 = (x**3 + a*x + b) % p
-        if (y_pow_2 == 0):
-            #oints_on_curve.append((x,0))
-            l += 1
-        if (str(y_pow_2) in quadratic_residue):
-            #y_1, y_2 = quadratic_residue[str(y_pow_2)]
-            #points_on_curve.append((x,y_1))
-            #points_on_curve.append((x,y_2))
-            l += 2
-    l += 1
+    #Schoof + baby-step giant-step instead of walking every x in [0, p)
+    l = count_points(p, a, b)
     P = find_point_on_curve(p, a, b)
     s = secrets.randbelow(p - 1) + 1
     B = double_and_add(P, s, a, p)
     return {"public_key": {"p": str(p), "a": str(a), "b": str(b), "P": str(P), "B":str(B)}, "private_key": str(s), "public_details": {"number_of_points": str(l)}}
 
-def create_ECDSA_keys(p, a, b, n):
+def create_ECDSA_keys(p=None, a=None, b=None, n=None, curve=None):
+    """
+    ECDSA keys on the curve (p, a, b) with n points, or on the named curve `curve`, whose subgroup
+    order q and generator G are taken from the registry.
+    """
+    if curve is not None:
+        curve = get_curve(curve)
+        d = secrets.randbelow(curve.n - 1) + 1
+        Q = fixed_base_mul(curve.G, d, curve.a, curve.p)
+        return {"public_key": {"p": str(curve.p), "q": str(curve.n), "a": str(curve.a), "b": str(curve.b), "G": str(curve.G), "Q": str(Q)}, "private_key": str(d)}
     q = largest_prime_factor(n)
     h = n // q
     P = find_point_on_curve(p, a, b)
     G = double_and_add(P, h, a, p)
     d = secrets.randbelow(q - 1) + 1
-    Q = double_and_add(G, d, a, p)
+    Q = fixed_base_mul(G, d, a, p)
     return {"public_key": {"p": str(p), "q": str(q), "a": str(a), "b": str(b), "G": str(G), "Q": str(Q)}, "private_key": str(d)}
 
+#"fixed" packs 4 base-26 characters per block, "modulus" packs as many bytes as the modulus allows
+PACKING_MODES = ("fixed", "modulus")
+
+def encode_blocks(string, modulus, packing):
+    """
+    The plaintext blocks of the string: 4 characters in base 26 each, or the UTF-8 bytes of the whole
+    message with a length prefix in blocks as large as the modulus allows (see pack_blocks)
+    """
+    if packing == "fixed":
+        return [convert_str_to_int(sub_string) for sub_string in sub_string(pre_solve(string), 4)]
+    if packing == "modulus":
+        return pack_blocks(string, int(modulus))
+    raise ValueError("Unknown packing %r, expected one of: %s" % (packing, ", ".join(PACKING_MODES)))
+
+def decode_blocks(blocks, modulus, packing):
+    """
+    Inverse of encode_blocks
+    """
+    if packing == "fixed":
+        return "".join([convert_int_to_str(sub_str) for sub_str in blocks])
+    if packing == "modulus":
+        return unpack_blocks(blocks, int(modulus))
+    raise ValueError("Unknown packing %r, expected one of: %s" % (packing, ", ".join(PACKING_MODES)))
+
 #Encrypt message using RSA system
 
-def EN_RSA(string, public_key):
+def EN_RSA(string, public_key, packing="fixed"):
     """
     Encrypts the string using the RSA algorithm
     """
     n, e = public_key
-    sub_strings = sub_string(pre_solve(string), 4)
-    sub_str_bas26 = [convert_str_to_int(sub_string) for sub_string in sub_strings]
+    sub_str_bas26 = encode_blocks(string, n, packing)
     encrypted = []
     for sub_str in sub_str_bas26:
         encrypted.append(modular_exponentiation(sub_str, e, n))
@@ -82,42 +242,42 @@ def EN_RSA(string, public_key):
 
 #Decrypt message using RSA system
 
-def DE_RSA(encrypted, private_key):
+def DE_RSA(encrypted, private_key, packing="fixed"):
     """
     Decrypts the string using the RSA algorithm
     """
     p = private_key["p"]
     q = private_key["q"]
-    n = p * q
     d = private_key["d"]
     decrypted = []
     encrypted = encrypted.strip("[]")
     encrypted_message = [int(sub_str) for sub_str in encrypted.split(",")]
     for sub_str in encrypted_message:
-        decrypted.append(modular_exponentiation(sub_str, d, n))
-    decrypted_str = "".join([convert_int_to_str(sub_str) for sub_str in decrypted])
+        decrypted.append(rsa_crt_exp(sub_str, p, q, d))
+    decrypted_str = decode_blocks(decrypted, p * q, packing)
     return {"Decrypted": decrypted_str}
 
 #Encrypt message using El Gamal system
 
-def EN_ELGAMAL(string, public_key):
+def EN_ELGAMAL(string, public_key, packing="fixed"):
     """
     Encrypts the string using the El Gamal algorithm
     """
     p, alpha, beta = public_key["p"], public_key["alpha"], public_key["beta"]
     k = secrets.randbelow(p // 10 - 1) + 1
-    sub_strings = sub_string(pre_solve(string), 4)
-    sub_str_base10 = [convert_str_to_int(sub_string) for sub_string in sub_strings]
+    sub_str_base10 = encode_blocks(string, p, packing)
     encrypted = []
+    #k is the same for every block, so alpha^k and beta^k are computed once
+    y1 = modular_exponentiation(alpha, k, p)
+    mask = modular_exponentiation(beta, k, p)
     for sub_str in sub_str_base10:
-        y1 = modular_exponentiation(alpha, k, p) 
-        y2 = (sub_str * modular_exponentiation(beta, k, p)) % p
+        y2 = (sub_str * mask) % p
         encrypted.append((y1, y2))
     return {"Encrypted": str(encrypted)}
 
 #Decrypt message using El Gamal system
 
-def DE_ELGAMAL(encrypted_message_str, p , private_key):
+def DE_ELGAMAL(encrypted_message_str, p , private_key, packing="fixed"):
     """
     Decrypts the string using the El Gamal algorithm
     """
@@ -135,7 +295,7 @@ def DE_ELGAMAL(encrypted_message_str, p , private_key):
     for y1, y2 in encrypted:
         sub_str = (y2 * modular_exponentiation(y1, p - 1 - a, p)) % p
         decrypted.append(sub_str)
-    decrypted_str = "".join([convert_int_to_str(sub_str) for sub_str in decrypted])
+    decrypted_str = decode_blocks(decrypted, p, packing)
     return {"Decrypted": decrypted_str}
 
 #Encrypt message using Elliptic Curve system
@@ -145,15 +305,17 @@ def EN_ECC(string, public_key):
     Encrypts the string using the Elliptic Curve algorithm
     """
     a, p, P, B = public_key["a"], public_key["p"], public_key["P"], public_key["B"]
-    k = secrets.randbelow(p//10 - 1) + 1
+    #p//10 - 1 is 0 on the smallest curves (toy-17), there k ranges over 1..p-1
+    k = secrets.randbelow(p//10 - 1) + 1 if p > 20 else 1 + secrets.randbelow(p - 1)
     encrypted = []
     sub_strings = sub_string(pre_solve(string), 3)
     sub_string_int = [convert_str_to_int(sub_string) for sub_string in sub_strings]
-    message_points = [double_and_add(P, sub_str_int, a, p ) for sub_str_int in sub_string_int]
-    for point in message_points:
-        C1 = double_and_add(P, k, a, p)
-        M = double_and_add(B, k, a, p)
-        C2 = add_points(point, M, a, p)
+    #the message points and the C2 additions each share one inversion over all blocks
+    message_points = from_jacobian_many([fixed_base_mul(P, sub_str_int, a, p, jacobian=True) for sub_str_int in sub_string_int], p)
+    #k is the same for every block, so C1 = kP and kB are computed once
+    C1 = fixed_base_mul(P, k, a, p)
+    M = double_and_add(B, k, a, p)
+    for C2 in add_points_many(message_points, [M] * len(message_points), a, p):
         encrypted.append((C1, C2))
     return ({"Message points" : str(message_points), "Encrypted": str(encrypted)})
 
@@ -166,11 +328,13 @@ def DE_ECC(encrypted_message_str, public_key, private_key):
     encrypted_message = []
     for i in range(0, len(int_list) - 1, 4):
         encrypted_message.append(((int_list[i], int_list[i + 1]), (int_list[i + 2], int_list[i + 3])))
-    decrypted_points = []
-    for en in encrypted_message:
-        C1, C2 = en
-        sC1 = double_and_add(C1, s, a, p)
-        tmp = (sC1[0], -sC1[1])
-        decrypted_point = add_points(C2, tmp, a, p)
-        decrypted_points.append(decrypted_point)
+    #EN_ECC uses one C1 for every block, so s*C1 is computed once per distinct C1
+    shared = {}
+    negated = []
+    for C1, C2 in encrypted_message:
+        if C1 not in shared:
+            sC1 = double_and_add(C1, s, a, p)
+            shared[C1] = (sC1[0], -sC1[1])
+        negated.append(shared[C1])
+    decrypted_points = add_points_many([C2 for C1, C2 in encrypted_message], negated, a, p)
     return {"Decrypted": str(decrypted_points)}
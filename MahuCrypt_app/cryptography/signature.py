@@ -1,18 +1,50 @@
 from MahuCrypt_app.cryptography.algos import *
 from MahuCrypt_app.cryptography.pre_process import *
 import secrets
+import hashlib
 #from numpy import *
 
-def sign_RSA(string, private_key):
+#"block" signs every 4-character block of the message, "digest" signs its SHA-256 once
+SIGNATURE_MODES = ("block", "digest")
+
+def message_digest(message, bits=256):
+    """
+    SHA-256 of the message as an integer. The message is a str (hashed as UTF-8), bytes, or an iterable
+    of str/bytes chunks that is hashed as it is read. bits < 256 keeps the leftmost bits (FIPS 186).
+    """
+    h = hashlib.sha256()
+    for chunk in ([message] if isinstance(message, (str, bytes)) else message):
+        h.update(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+    digest = int.from_bytes(h.digest(), "big")
+    return digest >> (256 - bits) if bits < 256 else digest
+
+def digest_bits(scheme, modulus=None):
+    """
+    Bits of the digest that `scheme` signs: one less than the RSA modulus n so that the digest is below n,
+    the whole SHA-256 for ElGamal, and the leftmost bitlen(q) bits for ECDSA with group order q (FIPS 186).
+    """
+    if scheme == "rsa":
+        return int(modulus).bit_length() - 1
+    if scheme == "ecdsa":
+        return int(modulus).bit_length()
+    return 256
+
+def _message_values(string, mode, bits=256):
+    """ The integers to sign: base-26 values of the 4-character blocks, or the single digest of `bits` bits. """
+    if mode == "block":
+        return [convert_str_to_int(sub_string) for sub_string in sub_string(pre_solve(string), 4)]
+    if mode == "digest":
+        return [message_digest(string, bits)]
+    raise ValueError("Unknown signature mode %r, expected one of: %s" % (mode, ", ".join(SIGNATURE_MODES)))
+
+def sign_RSA(string, private_key, mode="block"):
     p = private_key["p"]
     q = private_key["q"]
-    n = p * q
     d = private_key["d"]
-    sub_strings = sub_string(pre_solve(string), 4)
-    sub_str_base10 = [convert_str_to_int(sub_string) for sub_string in sub_strings]
+    sub_str_base10 = _message_values(string, mode, digest_bits("rsa", int(p) * int(q)) if mode == "digest" else 256)
     signed_x_RSA = []
     for sub_str in sub_str_base10:
-        signed_x_RSA.append(modular_exponentiation(sub_str, d, n))
+        signed_x_RSA.append(rsa_crt_exp(sub_str, p, q, d))
     return signed_x_RSA, sub_str_base10
 
 def verify_RSA(hash_message, signed, public_key):
@@ -22,9 +54,14 @@ def verify_RSA(hash_message, signed, public_key):
             return False
     return True
 
+def verify_RSA_digest(message, signed, public_key):
+    """ Digest-mode verification: the SHA-256 of the message is computed here, never taken from the caller. """
+    n, e = public_key
+    return len(signed) == 1 and verify_RSA([message_digest(message, digest_bits("rsa", n))], signed, public_key)
+
 
 
-def sign_ELGAMAL(string, public_key, private_key):
+def sign_ELGAMAL(string, public_key, private_key, mode="block"):
     p, alpha = public_key["p"], public_key["alpha"]
     a = private_key
     k = secrets.randbelow(p - 1) + 1
@@ -33,8 +70,7 @@ def sign_ELGAMAL(string, public_key, private_key):
             k = secrets.randbelow(p - 1) + 1
         else:
             break
-    sub_strings = sub_string(pre_solve(string), 4)
-    sub_str_base10 = [convert_str_to_int(sub_string) for sub_string in sub_strings]
+    sub_str_base10 = _message_values(string, mode)
     sign_x_Elgamal = []
     for i in range(len(sub_str_base10)):
         gamma = modular_exponentiation(alpha, k, p)
@@ -52,18 +88,21 @@ def verify_ELGAMAL(hash_message, sign_x_Elgamal, public_key):
             return False
     return True
 
+def verify_ELGAMAL_digest(message, sign_x_Elgamal, public_key):
+    """ As verify_RSA_digest: the single (gamma, delta) pair must sign the SHA-256 of `message`. """
+    return len(sign_x_Elgamal) == 1 and verify_ELGAMAL([message_digest(message)], sign_x_Elgamal, public_key)
+
 
-def sign_ECDSA(string, public_key, private_key):
+def sign_ECDSA(string, public_key, private_key, mode="block"):
     p,q, a, G = public_key["p"], public_key["q"], public_key["a"], public_key["G"]
     d = private_key
     #Sign the message
-    sub_strings = sub_string(pre_solve(string), 4)
-    sub_str_base10 = [convert_str_to_int(sub_string) for sub_string in sub_strings]
+    sub_str_base10 = _message_values(string, mode, digest_bits("ecdsa", q) if mode == "digest" else 256)
 
     check = False #Find r
     while (check != True):
         k = random.randint(1, q - 1)
-        kG = double_and_add(G, k, a, p)
+        kG = fixed_base_mul(G, k, a, p)
         r = kG[0] % q
         if (r != 0):
             check = True
@@ -73,7 +112,7 @@ def sign_ECDSA(string, public_key, private_key):
         check = False
         while (check != True):
             k = random.randint(1, q - 1)
-            kG_H = double_and_add(G, k, a, p)
+            kG_H = fixed_base_mul(G, k, a, p)
             r = kG_H[0] % q
             s = (Ext_Euclide(k, q)[1] * (x + d*r)) % q
             if (s != 0 and r != 0):
@@ -88,10 +127,134 @@ def verify_ECDSA(hash_message, signed_x, public_sign_key):
         w = Ext_Euclide(s, q)[1] % q
         u1 = (x * w) % q
         u2 = (r * w) % q
-        u1G = double_and_add(G, u1, a, p)
-        u2Q = double_and_add(Q, u2, a, p)
-        X = add_points(u1G, u2Q, a, p)
+        X = multi_scalar_mul([(u1, G), (u2, Q)], a, p)
         
         if X[0] % q != r:
             return False
-    return True
\ No newline at end of file
+    return True
+
+def verify_ECDSA_digest(message, signed_x, public_sign_key):
+    """ As verify_RSA_digest, for the single (r, s) pair over the leftmost bitlen(q) bits of the SHA-256. """
+    x = message_digest(message, digest_bits("ecdsa", public_sign_key["q"]))
+    return len(signed_x) == 1 and verify_ECDSA([x], signed_x, public_sign_key)
+
+#Batch verification: one randomized linear combination of the verification equations of many signatures
+#under the same key. An equation that fails by a factor of order l survives a combination with uniform
+#randomizers of BATCH_RANDOMIZER_BITS bits with probability about max(1/l, 2^-BATCH_RANDOMIZER_BITS), so
+#each scheme has to rule out factors of small order before the combination means anything:
+#- RSA: -1 mod n has order 2 (a negated signature n - s) and no test can tell it apart without an
+#  exponentiation by e, so BATCH_SUBSET_ROUNDS random subsets are checked, each missing any failure with
+#  probability at most 1/2.
+#- ElGamal: on a safe prime p the only small subgroup is {1, -1}, so the Legendre symbol of every equation
+#  is checked exactly first; other p are verified one by one.
+#- ECDSA: only curves whose group order is the prime q are batched, their groups have no small subgroup.
+BATCH_RANDOMIZER_BITS = 64
+BATCH_SUBSET_ROUNDS = 64
+#ECDSA signatures whose unknown R signs are searched together: 2^(size - 1) sign patterns per group
+ECDSA_BATCH_GROUP_SIZE = 8
+
+def _randomizers(count):
+    return [secrets.randbits(BATCH_RANDOMIZER_BITS) for _ in range(count)]
+
+def batch_verify_RSA(hash_message, signed, public_key):
+    """
+    All s_i^e = x_i (mod n) at once: (prod s_i)^e = prod x_i over BATCH_SUBSET_ROUNDS random subsets, one
+    exponentiation by e per round instead of one per signature. Swapping a failing equation in or out of a
+    subset changes the product, so a round misses a batch with an invalid signature at most half of the time.
+    Batches no larger than the number of rounds are cheaper to verify one by one.
+    """
+    n, e = public_key
+    if len(hash_message) != len(signed) or any(x < 0 or x >= n for x in hash_message):
+        return False
+    if len(signed) <= BATCH_SUBSET_ROUNDS:
+        return verify_RSA(hash_message, signed, public_key)
+    for _ in range(BATCH_SUBSET_ROUNDS):
+        subset = secrets.randbits(len(signed))
+        left, right = 1, 1
+        for i, (s, x) in enumerate(zip(signed, hash_message)):
+            if (subset >> i & 1):
+                left = left * s % n
+                right = right * x % n
+        if modular_exponentiation(left, e, n) != right:
+            return False
+    return True
+
+def _legendre_parity_holds(x, gamma, delta, beta_symbol, alpha_symbol, p):
+    """ beta^gamma gamma^delta alpha^-x is a quadratic residue mod p, from the Legendre symbols alone. """
+    odd = (beta_symbol < 0) * gamma + (jacobi_symbol(gamma, p) < 0) * delta + (alpha_symbol < 0) * x
+    return odd % 2 == 0
+
+def batch_verify_ELGAMAL(hash_message, sign_x_Elgamal, public_key):
+    """
+    All beta^gamma_i gamma_i^delta_i = alpha^x_i (mod p) at once: raised to random r_i and multiplied,
+    the beta and alpha powers collapse into one exponentiation each, the gamma powers share their squarings.
+    """
+    alpha, beta, p = public_key["alpha"], public_key["beta"], public_key["p"]
+    if len(hash_message) != len(sign_x_Elgamal) or any(gamma % p == 0 for gamma, delta in sign_x_Elgamal):
+        return False
+    beta_symbol, alpha_symbol = (jacobi_symbol(beta, p), jacobi_symbol(alpha, p)) if p % 2 else (0, 0)
+    if 0 in (beta_symbol, alpha_symbol) or not is_probable_prime((p - 1) // 2):
+        return verify_ELGAMAL(hash_message, sign_x_Elgamal, public_key)
+    #small-subgroup check: every equation must hold in Z_p* / {1, -1} before the combination below tests it
+    if not all(_legendre_parity_holds(x, gamma, delta, beta_symbol, alpha_symbol, p)
+               for x, (gamma, delta) in zip(hash_message, sign_x_Elgamal)):
+        return False
+    order = p - 1
+    r = _randomizers(len(hash_message))
+    beta_exponent = sum(r_i * gamma for r_i, (gamma, delta) in zip(r, sign_x_Elgamal)) % order
+    alpha_exponent = sum(r_i * x for r_i, x in zip(r, hash_message)) % order
+    left = multi_exponentiation([(beta, beta_exponent)] + [(gamma, r_i * delta % order) for r_i, (gamma, delta) in zip(r, sign_x_Elgamal)], p)
+    return left == modular_exponentiation(alpha, alpha_exponent, p)
+
+def _signed_sum_matches(target, points, a, p):
+    """ Is target = +-P_1 +- P_2 +- ... for some choice of signs? Walks the sign patterns in Gray-code order. """
+    total = (0,0)
+    for point in points:
+        total = add_points(total, point, a, p)
+    doubled = double_many(points, a, p)
+    signs = [1] * len(points)
+    for k in range(1 << (len(points) - 1)):
+        if k:
+            #flip the sign of P_j, j = lowest set bit of k; P_1 keeps its sign, -target covers the rest
+            j = (k & -k).bit_length()
+            D = doubled[j] if signs[j] < 0 else (doubled[j][0], -doubled[j][1] % p)
+            total = add_points(total, D, a, p)
+            signs[j] = -signs[j]
+        if total[0] == target[0] and (total[1] - target[1]) % p in (0, (-2 * target[1]) % p):
+            return True
+    return False
+
+def batch_verify_ECDSA(hash_message, signed_x, public_sign_key):
+    """
+    Batch ECDSA check with R recovery. For each (r, s), R = u1 G + u2 Q is recovered up to its sign as the
+    curve point with x = r; with random z_i, sum z_i R_i = (sum z_i u1_i) G + (sum z_i u2_i) Q, so every group
+    of signatures needs one double scalar multiplication plus short z_i R_i multiplications. Signatures whose
+    r does not determine x (r + q < p, possible on curves with a cofactor) are verified one by one, and so
+    is the whole batch when q is too small for the group order (at most p + 1 + 2 sqrt(p)) to be q itself.
+    """
+    p, q, a, b, G, Q = public_sign_key["p"], public_sign_key["q"], public_sign_key["a"], public_sign_key["b"], public_sign_key["G"], public_sign_key["Q"]
+    if len(hash_message) != len(signed_x):
+        return False
+    if 2 * q <= p + 1 + 2 * (integer_root(p, 2) + 1):
+        return verify_ECDSA(hash_message, signed_x, public_sign_key)
+    recovered = []
+    for x, (r, s) in zip(hash_message, signed_x):
+        if not (0 < r < q and s % q != 0 and r + q >= p):
+            if not verify_ECDSA([x], [(r, s)], public_sign_key):
+                return False
+            continue
+        y = sqrt_mod(r**3 + a*r + b, p)
+        if y is None:
+            return False
+        w = Ext_Euclide(s, q)[1] % q
+        recovered.append((x * w % q, r * w % q, (r, y)))
+    for start in range(0, len(recovered), ECDSA_BATCH_GROUP_SIZE):
+        group = recovered[start:start + ECDSA_BATCH_GROUP_SIZE]
+        z = _randomizers(len(group))
+        c1 = sum(z_i * u1 for z_i, (u1, u2, R) in zip(z, group)) % q
+        c2 = sum(z_i * u2 for z_i, (u1, u2, R) in zip(z, group)) % q
+        target = multi_scalar_mul([(c1, G), (c2, Q)], a, p)
+        points = [double_and_add(R, z_i, a, p) for z_i, (u1, u2, R) in zip(z, group)]
+        if not _signed_sum_matches(target, points, a, p):
+            return False
+    return True
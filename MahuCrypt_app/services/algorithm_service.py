@@ -3,8 +3,12 @@ Algorithm Service - Business logic for mathematical algorithms
 """
 
 from MahuCrypt_app.cryptography.algos import (
-    is_prime_aks, Ext_Euclide, modular_exponentiation
+    is_prime_aks, is_prime_bpsw, Ext_Euclide, modular_exponentiation
 )
+from MahuCrypt_app.cryptography.public_key_cryptography import PRIME_POOL
+
+#seconds an AKS proof may run before the request gives up; a ten-digit prime takes about 30 s on one core
+AKS_TIME_BUDGET = 60
 
 
 class AlgorithmService:
@@ -27,17 +31,34 @@ class AlgorithmService:
         return True, None
     
     @staticmethod
-    def check_prime(n):
-        """Check if number is prime using AKS"""
+    def check_prime(n, mode="bpsw"):
+        """
+        Check if number is prime
+
+        Args:
+            n (int): Number to check
+            mode (str): "bpsw" (Baillie-PSW, default) or "proof" (AKS, limited to AKS_TIME_BUDGET seconds)
+
+        Returns:
+            dict: "<n> - Prime" / "<n> - Composite" or error
+        """
         is_valid, error = AlgorithmService.validate_prime_check_input(n)
         if not is_valid:
             return {"Error": error} if error != "Enter Again" else error
         
+        if mode not in ("bpsw", "proof"):
+            return {"Error": "Mode must be bpsw or proof"}
+        
         try:
-            result = is_prime_aks(n)
+            if mode == "proof":
+                result = is_prime_aks(int(n), AKS_TIME_BUDGET)
+            else:
+                result = is_prime_bpsw(int(n))
             if result:
                 return {"": f"{n} - Prime"}
             return {"": f"{n} - Composite"}
+        except TimeoutError:
+            return {"Error": f"AKS proof did not finish within {AKS_TIME_BUDGET} seconds"}
         except Exception as e:
             return {"Error": str(e)}
     
@@ -137,3 +158,8 @@ class AlgorithmService:
             return {"Result": invmod}
         except Exception as e:
             return {"Error": str(e)}
+    
+    @staticmethod
+    def prime_pool_metrics():
+        """Hit rate and fill level of the background prime pool used by key generation"""
+        return PRIME_POOL.metrics()
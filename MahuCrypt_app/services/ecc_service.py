@@ -5,7 +5,7 @@ ECC Service - Business logic for Elliptic Curve Cryptography
 from MahuCrypt_app.cryptography.public_key_cryptography import (
     create_ECC_keys, EN_ECC, DE_ECC
 )
-from MahuCrypt_app.cryptography.algos import miller_rabin_test
+from MahuCrypt_app.cryptography.algos import is_probable_prime, is_singular_curve
 
 
 class ECCService:
@@ -28,14 +28,15 @@ class ECCService:
         return True, None
     
     @staticmethod
-    def generate_keys(bits):
-        """Generate ECC key pair"""
-        is_valid, error = ECCService.validate_key_generation_input(bits)
-        if not is_valid:
-            return {"Error": error}
+    def generate_keys(bits, curve=None):
+        """Generate ECC key pair, on the named curve when one is given (bits is then ignored)"""
+        if curve is None:
+            is_valid, error = ECCService.validate_key_generation_input(bits)
+            if not is_valid:
+                return {"Error": error}
         
         try:
-            key_ECC = create_ECC_keys(bits)
+            key_ECC = create_ECC_keys(bits, curve)
             return key_ECC
         except Exception as e:
             return {"Error": str(e)}
@@ -54,15 +55,20 @@ class ECCService:
         except (ValueError, TypeError):
             return False, "Invalid point format"
         
-        if a == 0 or p == 0 or P == (0, 0) or B == (0, 0):
+        if p == 0 or P == (0, 0) or B == (0, 0):
             return False, "NULL Value"
         
         if message == "":
             return False, "NULL Value"
         
-        if not miller_rabin_test(p, 1000):
+        if not is_probable_prime(p):
             return False, "p is not prime"
         
+        #a = 0 is a valid curve (secp256k1), only a singular one is rejected; b follows from P
+        b = (int(Py)**2 - int(Px)**3 - a * int(Px)) % p
+        if is_singular_curve(a, b, p):
+            return False, "The curve is singular"
+        
         return True, None
     
     @staticmethod
@@ -75,7 +81,7 @@ class ECCService:
             return {"Error": error}
         
         try:
-            result = EN_ECC(message, {"a": a, "p": p, "P": P, "B": B})
+            result = EN_ECC(message, {"a": int(a), "p": int(p), "P": P, "B": B})
             return result
         except Exception as e:
             return {"Error": str(e)}
@@ -96,10 +102,10 @@ class ECCService:
         except (ValueError, TypeError):
             return False, "a, p, s must be integers"
         
-        if a == 0 or p == 0 or s == 0:
+        if p == 0 or s == 0:
             return False, "NULL Value"
         
-        if not miller_rabin_test(p, 1000):
+        if not is_probable_prime(p):
             return False, "p is not prime"
         
         return True, None
@@ -114,7 +120,7 @@ class ECCService:
             return {"Error": error}
         
         try:
-            result = DE_ECC(encrypted_message, {"a": a, "p": p}, s)
+            result = DE_ECC(encrypted_message, {"a": int(a), "p": int(p)}, int(s))
             return result
         except Exception as e:
             return {"Error": str(e)}
@@ -5,7 +5,7 @@ ElGamal Service - Business logic for ElGamal cryptosystem
 from MahuCrypt_app.cryptography.public_key_cryptography import (
     create_ELGAMAL_keys, EN_ELGAMAL, DE_ELGAMAL
 )
-from MahuCrypt_app.cryptography.algos import miller_rabin_test, is_primitive_root
+from MahuCrypt_app.cryptography.algos import is_probable_prime, is_primitive_root
 
 
 class ElGamalService:
@@ -28,14 +28,14 @@ class ElGamalService:
         return True, None
     
     @staticmethod
-    def generate_keys(bits):
-        """Generate ElGamal key pair"""
+    def generate_keys(bits, reuse_group=False):
+        """Generate ElGamal key pair, reuse_group keeps p and alpha cached per key size"""
         is_valid, error = ElGamalService.validate_key_generation_input(bits)
         if not is_valid:
             return {"Error": error}
         
         try:
-            key_ElGamal = create_ELGAMAL_keys(bits)
+            key_ElGamal = create_ELGAMAL_keys(bits, reuse_group)
             return key_ElGamal
         except Exception as e:
             return {"Error": str(e)}
@@ -59,7 +59,7 @@ class ElGamalService:
         if message == "":
             return False, "NULL Value"
         
-        if not miller_rabin_test(p, 1000):
+        if not is_probable_prime(p):
             return False, "p is not prime"
         
         if not is_primitive_root(alpha, p):
@@ -68,8 +68,8 @@ class ElGamalService:
         return True, None
     
     @staticmethod
-    def encrypt(message, p, alpha, beta):
-        """Encrypt message using ElGamal"""
+    def encrypt(message, p, alpha, beta, packing="fixed"):
+        """Encrypt message using ElGamal, 4 characters per block or blocks as large as p allows (packing="modulus")"""
         is_valid, error = ElGamalService.validate_encryption_input(
             message, p, alpha, beta
         )
@@ -77,7 +77,7 @@ class ElGamalService:
             return {"Error": error}
         
         try:
-            encrypted_message = EN_ELGAMAL(message, {"p": p, "alpha": alpha, "beta": beta})
+            encrypted_message = EN_ELGAMAL(message, {"p": p, "alpha": alpha, "beta": beta}, packing)
             return encrypted_message
         except Exception as e:
             return {"Error": str(e)}
@@ -100,14 +100,14 @@ class ElGamalService:
         if p == 0 or a == 0:
             return False, "Enter Again"
         
-        if not miller_rabin_test(p, 1000):
+        if not is_probable_prime(p):
             return False, "p is not prime"
         
         return True, None
     
     @staticmethod
-    def decrypt(encrypted_message, p, a):
-        """Decrypt message using ElGamal"""
+    def decrypt(encrypted_message, p, a, packing="fixed"):
+        """Decrypt message using ElGamal with the packing used to encrypt it"""
         is_valid, error = ElGamalService.validate_decryption_input(
             encrypted_message, p, a
         )
@@ -115,7 +115,7 @@ class ElGamalService:
             return {"Error": error} if error != "Enter Again" else error
         
         try:
-            decrypted_message = DE_ELGAMAL(encrypted_message, p, a)
+            decrypted_message = DE_ELGAMAL(encrypted_message, p, a, packing)
             return decrypted_message
         except Exception as e:
             return {"Error": str(e)}
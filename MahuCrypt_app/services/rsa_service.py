@@ -6,7 +6,7 @@ Separated from API controllers for better testability
 from MahuCrypt_app.cryptography.public_key_cryptography import (
     create_RSA_keys, EN_RSA, DE_RSA
 )
-from MahuCrypt_app.cryptography.algos import miller_rabin_test
+from MahuCrypt_app.cryptography.algos import is_probable_prime
 
 
 class RSAService:
@@ -37,12 +37,13 @@ class RSAService:
         return True, None
     
     @staticmethod
-    def generate_keys(bits):
+    def generate_keys(bits, parallel=False):
         """
         Generate RSA key pair
         
         Args:
             bits (int): Number of bits for prime generation
+            parallel (bool): Search the primes on a process pool
             
         Returns:
             dict: RSA keys or error
@@ -52,7 +53,7 @@ class RSAService:
             return {"Error": error}
         
         try:
-            key_RSA = create_RSA_keys(bits)
+            key_RSA = create_RSA_keys(bits, parallel)
             return key_RSA
         except Exception as e:
             return {"Error": str(e)}
@@ -91,7 +92,7 @@ class RSAService:
         return True, None
     
     @staticmethod
-    def encrypt(message, n, e):
+    def encrypt(message, n, e, packing="fixed"):
         """
         Encrypt message using RSA
         
@@ -99,6 +100,7 @@ class RSAService:
             message (str): Message to encrypt
             n (int): RSA modulus
             e (int): Public exponent
+            packing (str): "fixed" for 4 characters per block, "modulus" for blocks as large as n allows
             
         Returns:
             dict: Encrypted message or error
@@ -108,7 +110,7 @@ class RSAService:
             return {"Error": error}
         
         try:
-            encrypted_message = EN_RSA(message, (n, e))
+            encrypted_message = EN_RSA(message, (n, e), packing)
             return encrypted_message
         except Exception as e:
             return {"Error": str(e)}
@@ -146,16 +148,16 @@ class RSAService:
         if d > p * q:
             return False, "Invalid d"
         
-        if not miller_rabin_test(p, 1000):
+        if not is_probable_prime(p):
             return False, "p or q is not prime"
         
-        if not miller_rabin_test(q, 1000):
+        if not is_probable_prime(q):
             return False, "p or q is not prime"
         
         return True, None
     
     @staticmethod
-    def decrypt(encrypted_message, p, q, d):
+    def decrypt(encrypted_message, p, q, d, packing="fixed"):
         """
         Decrypt message using RSA
         
@@ -164,6 +166,7 @@ class RSAService:
             p (int): Prime p
             q (int): Prime q
             d (int): Private exponent
+            packing (str): Packing used when the message was encrypted
             
         Returns:
             dict: Decrypted message or error
@@ -175,7 +178,7 @@ class RSAService:
             return {"Error": error}
         
         try:
-            decrypted_message = DE_RSA(encrypted_message, {"p": p, "q": q, "d": d})
+            decrypted_message = DE_RSA(encrypted_message, {"p": int(p), "q": int(q), "d": int(d)}, packing)
             return decrypted_message
         except Exception as e:
             return {"Error": str(e)}
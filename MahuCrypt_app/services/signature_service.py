@@ -2,15 +2,19 @@
 Digital Signature Service - Business logic for digital signatures
 """
 
+import re
+
 from MahuCrypt_app.cryptography.signature import (
-    sign_RSA, verify_RSA,
-    sign_ELGAMAL, verify_ELGAMAL,
-    sign_ECDSA, verify_ECDSA
+    sign_RSA, verify_RSA, verify_RSA_digest,
+    sign_ELGAMAL, verify_ELGAMAL, verify_ELGAMAL_digest,
+    sign_ECDSA, verify_ECDSA, verify_ECDSA_digest,
+    batch_verify_RSA, batch_verify_ELGAMAL, batch_verify_ECDSA,
+    message_digest, digest_bits, SIGNATURE_MODES
 )
 from MahuCrypt_app.cryptography.public_key_cryptography import (
     create_RSA_keys, create_ELGAMAL_keys, create_ECC_keys, create_ECDSA_keys
 )
-from MahuCrypt_app.cryptography.algos import miller_rabin_test, is_primitive_root, is_point_on_curve
+from MahuCrypt_app.cryptography.algos import is_probable_prime, is_primitive_root, is_point_on_curve, is_singular_curve
 
 
 class SignatureService:
@@ -39,23 +43,23 @@ class SignatureService:
         if d > p * q:
             return False, "Enter Again"
         
-        if not miller_rabin_test(p, 1000):
+        if not is_probable_prime(p):
             return False, "p or q is not prime"
         
-        if not miller_rabin_test(q, 1000):
+        if not is_probable_prime(q):
             return False, "p or q is not prime"
         
         return True, None
     
     @staticmethod
-    def sign_with_rsa(message, p, q, d):
-        """Sign message using RSA"""
+    def sign_with_rsa(message, p, q, d, mode="block"):
+        """Sign message using RSA, per 4-character block or once over its SHA-256 (mode="digest")"""
         is_valid, error = SignatureService.validate_rsa_sign_input(message, p, q, d)
         if not is_valid:
             return {"Error": error} if error != "Enter Again" else error
         
         try:
-            signed_message, hash_message = sign_RSA(message, {"p": p, "q": q, "d": d})
+            signed_message, hash_message = sign_RSA(message, {"p": int(p), "q": int(q), "d": int(d)}, mode)
             return {"Signed Message": str(signed_message), "Hashed Message": str(hash_message)}
         except Exception as e:
             return {"Error": str(e)}
@@ -87,10 +91,10 @@ class SignatureService:
         return True, None
     
     @staticmethod
-    def verify_rsa_signature(hash_message_str, signed_message_str, n, e):
-        """Verify RSA signature"""
+    def verify_rsa_signature(hash_message_str, signed_message_str, n, e, mode="block", message=None):
+        """Verify RSA signature; in digest mode the SHA-256 of message is recomputed and hash_message is not used"""
         is_valid, error = SignatureService.validate_rsa_verify_input(
-            hash_message_str, signed_message_str, n, e
+            message if mode == "digest" else hash_message_str, signed_message_str, n, e
         )
         if not is_valid:
             return {"Error": error} if error != "Enter Again" else error
@@ -100,9 +104,11 @@ class SignatureService:
             signed_message_str = signed_message_str.strip("[]")
             signed_message = [int(sub_str) for sub_str in signed_message_str.split(",")]
             
-            hash_message_str = hash_message_str.strip("[]")
-            hash_message = [int(sub_str) for sub_str in hash_message_str.split(",")]
+            if mode == "digest":
+                result = verify_RSA_digest(message, signed_message, (int(n), int(e)))
+                return {"Verification: ": str(result)}
             
+            hash_message = SignatureService._parse_hash_message(hash_message_str, mode)
             result = verify_RSA(hash_message, signed_message, (n, e))
             return {"Verification: ": str(result)}
         except Exception as e:
@@ -128,7 +134,7 @@ class SignatureService:
         if p == 0 or alpha == 0 or a == 0:
             return False, "NULL Value"
         
-        if not miller_rabin_test(p, 1000):
+        if not is_probable_prime(p):
             return False, "p is not prime"
         
         if not is_primitive_root(alpha, p):
@@ -137,14 +143,14 @@ class SignatureService:
         return True, None
     
     @staticmethod
-    def sign_with_elgamal(message, p, alpha, a):
-        """Sign message using ElGamal"""
+    def sign_with_elgamal(message, p, alpha, a, mode="block"):
+        """Sign message using ElGamal, per 4-character block or once over its SHA-256 (mode="digest")"""
         is_valid, error = SignatureService.validate_elgamal_sign_input(message, p, alpha, a)
         if not is_valid:
             return {"Error": error}
         
         try:
-            signed_message, hash_message = sign_ELGAMAL(message, {"p": p, "alpha": alpha}, a)
+            signed_message, hash_message = sign_ELGAMAL(message, {"p": p, "alpha": alpha}, a, mode)
             return {"Signed Message": str(signed_message), "Hashed Message": str(hash_message)}
         except Exception as e:
             return {"Error": str(e)}
@@ -171,7 +177,7 @@ class SignatureService:
         if p == 0 or alpha == 0 or beta == 0:
             return False, "NULL Value"
         
-        if not miller_rabin_test(p, 1000):
+        if not is_probable_prime(p):
             return False, "p is not prime"
         
         if not is_primitive_root(alpha, p):
@@ -180,19 +186,16 @@ class SignatureService:
         return True, None
     
     @staticmethod
-    def verify_elgamal_signature(hash_message_str, signed_message_str, p, alpha, beta):
-        """Verify ElGamal signature"""
+    def verify_elgamal_signature(hash_message_str, signed_message_str, p, alpha, beta, mode="block", message=None):
+        """Verify ElGamal signature; in digest mode the SHA-256 of message is recomputed and hash_message is not used"""
         is_valid, error = SignatureService.validate_elgamal_verify_input(
-            hash_message_str, signed_message_str, p, alpha, beta
+            message if mode == "digest" else hash_message_str, signed_message_str, p, alpha, beta
         )
         if not is_valid:
             return {"Error": error}
         
         try:
             # Parse arrays
-            hash_message_str = hash_message_str.strip("[]")
-            hash_message = [int(sub_str) for sub_str in hash_message_str.split(",")]
-            
             signed_message_str = signed_message_str.strip("[]")
             signed_message_str_list = signed_message_str.replace("(", "").replace(")", "").split("),(")
             signed_message_tmp = [int(sub_str) for sub_str in signed_message_str_list[0].split(",")]
@@ -200,15 +203,27 @@ class SignatureService:
             for i in range(0, len(signed_message_tmp) - 1, 2):
                 signed_message.append((signed_message_tmp[i], signed_message_tmp[i + 1]))
             
-            result = verify_ELGAMAL(hash_message, signed_message, {"p": p, "alpha": alpha, "beta": beta})
+            public_key = {"p": p, "alpha": alpha, "beta": beta}
+            if mode == "digest":
+                result = verify_ELGAMAL_digest(message, signed_message, {k: int(v) for k, v in public_key.items()})
+                return {"Verification: ": str(result)}
+            
+            hash_message = SignatureService._parse_hash_message(hash_message_str, mode)
+            result = verify_ELGAMAL(hash_message, signed_message, public_key)
             return {"Verification: ": str(result)}
         except Exception as e:
             return {"Error": str(e)}
     
     # ECDSA
     @staticmethod
-    def create_ecdsa_keys(bits):
-        """Create ECDSA keys from ECC keys"""
+    def create_ecdsa_keys(bits, curve=None):
+        """Create ECDSA keys from ECC keys, or on the named curve when one is given"""
+        if curve is not None:
+            try:
+                return create_ECDSA_keys(curve=curve)
+            except Exception as e:
+                return {"Error": str(e)}
+        
         try:
             bits = int(bits)
         except (ValueError, TypeError):
@@ -234,41 +249,46 @@ class SignatureService:
         if message is None or message == "":
             return False, "Enter Again"
         
-        if p is None or q is None or a is None or G is None or d is None:
+        if p is None or q is None or a is None or b is None or G is None or d is None:
             return False, "Enter Again"
         
         try:
             p = int(p)
             q = int(q)
             a = int(a)
+            b = int(b)
             d = int(d)
             Gx, Gy = G
         except (ValueError, TypeError):
             return False, "Invalid input format"
         
-        if p == 0 or q == 0 or a == 0 or G == (0, 0) or d == 0:
+        if p == 0 or q == 0 or G == (0, 0) or d == 0:
             return False, "Enter Again"
         
-        if not miller_rabin_test(p, 1000):
+        if not is_probable_prime(p):
             return False, "p or q is not prime"
         
-        if not miller_rabin_test(q, 1000):
+        if not is_probable_prime(q):
             return False, "p or q is not prime"
         
-        if not is_point_on_curve(G, a, p):
+        if is_singular_curve(a, b, p):
+            return False, "The curve is singular"
+        
+        if not is_point_on_curve(G, a, b, p):
             return False, "G is not on the curve"
         
         return True, None
     
     @staticmethod
-    def sign_with_ecdsa(message, p, q, a, b, G, d):
-        """Sign message using ECDSA"""
+    def sign_with_ecdsa(message, p, q, a, b, G, d, mode="block"):
+        """Sign message using ECDSA, per 4-character block or once over its SHA-256 (mode="digest")"""
         is_valid, error = SignatureService.validate_ecdsa_sign_input(message, p, q, a, b, G, d)
         if not is_valid:
             return {"Error": error} if error != "Enter Again" else error
         
         try:
-            signed_message, hash_message = sign_ECDSA(message, {"p": p, "q": q, "a": a, "G": G}, d)
+            public_key = {"p": int(p), "q": int(q), "a": int(a), "G": G}
+            signed_message, hash_message = sign_ECDSA(message, public_key, int(d), mode)
             return {"Signed Message": str(signed_message), "Hashed Message": str(hash_message)}
         except Exception as e:
             return {"Error": str(e)}
@@ -295,37 +315,37 @@ class SignatureService:
         except (ValueError, TypeError):
             return False, "Invalid input format"
         
-        if p == 0 or q == 0 or a == 0 or b == 0 or G == (0, 0) or Q == (0, 0):
+        if p == 0 or q == 0 or G == (0, 0) or Q == (0, 0):
             return False, "Enter Again"
         
-        if not miller_rabin_test(p, 1000):
+        if not is_probable_prime(p):
             return False, "p or q is not prime"
         
-        if not miller_rabin_test(q, 1000):
+        if not is_probable_prime(q):
             return False, "p or q is not prime"
         
-        if not is_point_on_curve(G, a, p):
+        if is_singular_curve(a, b, p):
+            return False, "The curve is singular"
+        
+        if not is_point_on_curve(G, a, b, p):
             return False, "G is not on the curve"
         
-        if not is_point_on_curve(Q, a, p):
+        if not is_point_on_curve(Q, a, b, p):
             return False, "Q is not on the curve"
         
         return True, None
     
     @staticmethod
-    def verify_ecdsa_signature(hash_message_str, signed_message_str, p, q, a, b, G, Q):
-        """Verify ECDSA signature"""
+    def verify_ecdsa_signature(hash_message_str, signed_message_str, p, q, a, b, G, Q, mode="block", message=None):
+        """Verify ECDSA signature; in digest mode the SHA-256 of message is recomputed and hash_message is not used"""
         is_valid, error = SignatureService.validate_ecdsa_verify_input(
-            hash_message_str, signed_message_str, p, q, a, b, G, Q
+            message if mode == "digest" else hash_message_str, signed_message_str, p, q, a, b, G, Q
         )
         if not is_valid:
             return {"Error": error} if error != "Enter Again" else error
         
         try:
             # Parse arrays
-            hash_message_str = hash_message_str.strip("[]")
-            hash_message = [int(sub_str) for sub_str in hash_message_str.split(",")]
-            
             signed_message_str = signed_message_str.strip("[]")
             signed_message_str_list = signed_message_str.replace("(", "").replace(")", "").split("),(")
             signed_message_tmp = [int(sub_str) for sub_str in signed_message_str_list[0].split(",")]
@@ -333,7 +353,85 @@ class SignatureService:
             for i in range(0, len(signed_message_tmp) - 1, 2):
                 signed_message.append((signed_message_tmp[i], signed_message_tmp[i + 1]))
             
-            result = verify_ECDSA(hash_message, signed_message, {"p": p, "q": q, "a": a, "b": b, "G": G, "Q": Q})
+            public_key = {"p": int(p), "q": int(q), "a": int(a), "b": int(b), "G": G, "Q": Q}
+            if mode == "digest":
+                result = verify_ECDSA_digest(message, signed_message, public_key)
+                return {"Verification: ": str(result)}
+            
+            hash_message = SignatureService._parse_hash_message(hash_message_str, mode)
+            result = verify_ECDSA(hash_message, signed_message, public_key)
             return {"Verification: ": str(result)}
         except Exception as e:
             return {"Error": str(e)}
+    
+    @staticmethod
+    def _parse_hash_message(hash_message_str, mode):
+        """Block-mode hash values as the sign endpoints return them"""
+        if mode not in SIGNATURE_MODES:
+            raise ValueError("mode must be one of: %s" % ", ".join(SIGNATURE_MODES))
+        return [int(sub_str) for sub_str in hash_message_str.strip("[]").split(",")]
+    
+    # Batch verification
+    @staticmethod
+    def _parse_batch_public_key(scheme, public_key):
+        """Public key of the scheme as the core verify functions take it"""
+        if scheme == "rsa":
+            return int(public_key["n"]), int(public_key["e"])
+        if scheme == "elgamal":
+            return {k: int(public_key[k]) for k in ("p", "alpha", "beta")}
+        key = {k: int(public_key[k]) for k in ("p", "q", "a", "b")}
+        for k in ("G", "Q"):
+            key[k] = tuple(int(c) for c in re.findall(r'-?\d+', str(public_key[k])))
+        return key
+    
+    @staticmethod
+    def _parse_batch_item(scheme, item, mode, key):
+        """
+        (hash values, signatures) of one {"hash_message", "signed"} pair in the sign endpoints' format;
+        in digest mode the pair is {"message", "signed"} and the hash is the message's SHA-256, computed here
+        """
+        if mode == "digest":
+            modulus = key[0] if scheme == "rsa" else key["q"] if scheme == "ecdsa" else None
+            hash_message = [message_digest(item["message"], digest_bits(scheme, modulus))]
+        else:
+            hash_message = [int(v) for v in re.findall(r'-?\d+', str(item["hash_message"]))]
+        values = [int(v) for v in re.findall(r'-?\d+', str(item["signed"]))]
+        if scheme == "rsa":
+            signed = values
+        else:
+            signed = [(values[i], values[i + 1]) for i in range(0, len(values) - 1, 2)]
+        if len(signed) != len(hash_message):
+            raise ValueError("hash_message and signed have different lengths")
+        return hash_message, signed
+    
+    @staticmethod
+    def batch_verify_signatures(scheme, items, public_key, mode="block"):
+        """
+        Verify many (hash_message, signed) pairs under one public key with a single batch check, or in
+        digest mode (message, signed) pairs with the hashes recomputed from the messages.
+        When the batch fails, the pairs are checked one by one to report which are invalid.
+        """
+        batch_verify, verify = {
+            "rsa": (batch_verify_RSA, verify_RSA),
+            "elgamal": (batch_verify_ELGAMAL, verify_ELGAMAL),
+            "ecdsa": (batch_verify_ECDSA, verify_ECDSA),
+        }.get(str(scheme).lower(), (None, None))
+        if batch_verify is None:
+            return {"Error": "scheme must be rsa, elgamal or ecdsa"}
+        if not items:
+            return {"Error": "Enter Again"}
+        if mode not in SIGNATURE_MODES:
+            return {"Error": "mode must be one of: %s" % ", ".join(SIGNATURE_MODES)}
+        
+        try:
+            scheme = scheme.lower()
+            key = SignatureService._parse_batch_public_key(scheme, public_key)
+            pairs = [SignatureService._parse_batch_item(scheme, item, mode, key) for item in items]
+            hash_message = [x for xs, ss in pairs for x in xs]
+            signed = [s for xs, ss in pairs for s in ss]
+            if batch_verify(hash_message, signed, key):
+                return {"Verification: ": "True", "Invalid": []}
+            invalid = [i for i, (xs, ss) in enumerate(pairs) if not verify(xs, ss, key)]
+            return {"Verification: ": str(not invalid), "Invalid": invalid}
+        except Exception as e:
+            return {"Error": str(e)}
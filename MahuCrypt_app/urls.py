@@ -8,6 +8,7 @@ urlpatterns = [
     path('algorithm/', HandleSubmitCryptoSystem.get_all_algorithm, name='get_all_algorithm'),
     
     path('algorithm/check_for_primality/', HandleSubmitCryptoSystem.prime_check, name='prime_check'),
+    path('algorithm/prime_pool_metrics/', HandleSubmitCryptoSystem.prime_pool_metrics, name='prime_pool_metrics'),
     path('algorithm/greatest_common_divisor/', HandleSubmitCryptoSystem.gcd, name='gcd'),
     path('algorithm/modular_exponentiation/', HandleSubmitCryptoSystem.modular_exponentiation, name='modular_exponentiation'),
     path('algorithm/find_modular_multiplicative_inverse/', HandleSubmitCryptoSystem.extended_euclidean_algorithm, name='extended_euclidean_algorithm'),
@@ -42,5 +43,6 @@ urlpatterns = [
     path('digitalsignature/ecdsa/create_key/', HandleSubmitCryptoSystem.create_key_sign_ECDSA, name='create_key_sign_ECDSA'),
     path('digitalsignature/ecdsa/sign/', HandleSubmitCryptoSystem.sign_ECDSA, name='sign_ECDSA'),
     path('digitalsignature/ecdsa/verify/', HandleSubmitCryptoSystem.verify_ECDSA, name='verify_ECDSA'),
+    path('digitalsignature/batch_verify/', HandleSubmitCryptoSystem.batch_verify, name='batch_verify'),
 ]
 
@@ -14,7 +14,8 @@ class HandleSubmitCryptoSystem(APIView):
     @api_view(['POST'])
     def gen_RSA_key(request):
         bits = request.data.get('bits')
-        result = RSAService.generate_keys(bits)
+        parallel = str(request.data.get('parallel')).lower() == "true"
+        result = RSAService.generate_keys(bits, parallel)
         return Response(result)
     
     @api_view(['POST'])
@@ -23,7 +24,8 @@ class HandleSubmitCryptoSystem(APIView):
         message = data.get('message')
         n = data.get('n')
         e = data.get('e')
-        result = RSAService.encrypt(message, n, e)
+        packing = data.get('packing') or "fixed"
+        result = RSAService.encrypt(message, n, e, packing)
         return Response(result)
     
     @api_view(['POST'])
@@ -33,14 +35,16 @@ class HandleSubmitCryptoSystem(APIView):
         p = data.get('p')
         q = data.get('q')
         d = data.get('d')
-        result = RSAService.decrypt(encrypted_message, p, q, d)
+        packing = data.get('packing') or "fixed"
+        result = RSAService.decrypt(encrypted_message, p, q, d, packing)
         return Response(result)
         
     # ElGamal Operations
     @api_view(['POST'])
     def gen_ElGamal_key(request):
         bits = request.data.get('bits')
-        result = ElGamalService.generate_keys(bits)
+        reuse_group = str(request.data.get('reuse_group')).lower() == "true"
+        result = ElGamalService.generate_keys(bits, reuse_group)
         return Response(result)
     
     @api_view(['POST'])
@@ -50,7 +54,8 @@ class HandleSubmitCryptoSystem(APIView):
         p = data.get('p')
         alpha = data.get('alpha')
         beta = data.get('beta')
-        result = ElGamalService.encrypt(message, p, alpha, beta)
+        packing = data.get('packing') or "fixed"
+        result = ElGamalService.encrypt(message, p, alpha, beta, packing)
         return Response(result)
     
     @api_view(['POST'])
@@ -59,14 +64,16 @@ class HandleSubmitCryptoSystem(APIView):
         encrypted_message = data.get('encrypted_message')
         p = data.get('p')
         a = data.get('a')
-        result = ElGamalService.decrypt(encrypted_message, p, a)
+        packing = data.get('packing') or "fixed"
+        result = ElGamalService.decrypt(encrypted_message, p, a, packing)
         return Response(result)
     
     # ECC Operations
     @api_view(['POST'])
     def gen_ECC_key(request):
         bits = request.data.get('bits')
-        result = ECCService.generate_keys(bits)
+        curve = request.data.get('curve') or None
+        result = ECCService.generate_keys(bits, curve)
         return Response(result)
     
     @api_view(['POST'])
@@ -161,7 +168,8 @@ class HandleSubmitCryptoSystem(APIView):
     @api_view(['POST'])
     def create_key_sign_RSA(request):
         bits = request.data.get('bits')
-        result = RSAService.generate_keys(bits)
+        parallel = str(request.data.get('parallel')).lower() == "true"
+        result = RSAService.generate_keys(bits, parallel)
         return Response(result)
     
     @api_view(['POST'])
@@ -171,7 +179,8 @@ class HandleSubmitCryptoSystem(APIView):
         p = data.get('p')
         q = data.get('q')
         d = data.get('d')
-        result = SignatureService.sign_with_rsa(message, p, q, d)
+        mode = data.get('mode') or "block"
+        result = SignatureService.sign_with_rsa(message, p, q, d, mode)
         return Response(result)
 
     @api_view(['POST'])
@@ -181,7 +190,9 @@ class HandleSubmitCryptoSystem(APIView):
         signed_message_str = data.get('signed')
         n = data.get('n')
         e = data.get('e')
-        result = SignatureService.verify_rsa_signature(hash_message_str, signed_message_str, n, e)
+        mode = data.get('mode') or "block"
+        message = data.get('message')
+        result = SignatureService.verify_rsa_signature(hash_message_str, signed_message_str, n, e, mode, message)
         return Response(result)
     
     # Digital Signatures - ElGamal
@@ -198,7 +209,8 @@ class HandleSubmitCryptoSystem(APIView):
         p = data.get('p')
         alpha = data.get('alpha')
         a = data.get('a')
-        result = SignatureService.sign_with_elgamal(message, p, alpha, a)
+        mode = data.get('mode') or "block"
+        result = SignatureService.sign_with_elgamal(message, p, alpha, a, mode)
         return Response(result)
     
     @api_view(['POST'])
@@ -209,8 +221,10 @@ class HandleSubmitCryptoSystem(APIView):
         p = data.get('p')
         alpha = data.get('alpha')
         beta = data.get('beta')
+        mode = data.get('mode') or "block"
+        message = data.get('message')
         result = SignatureService.verify_elgamal_signature(
-            hash_message_str, signed_message_str, p, alpha, beta
+            hash_message_str, signed_message_str, p, alpha, beta, mode, message
         )
         return Response(result)
     
@@ -218,7 +232,8 @@ class HandleSubmitCryptoSystem(APIView):
     @api_view(['POST'])
     def create_key_sign_ECDSA(request):
         bits = request.data.get('bits')
-        result = SignatureService.create_ecdsa_keys(bits)
+        curve = request.data.get('curve') or None
+        result = SignatureService.create_ecdsa_keys(bits, curve)
         return Response(result)
     
     @api_view(['POST'])
@@ -231,7 +246,8 @@ class HandleSubmitCryptoSystem(APIView):
         b = data.get('b')
         G = (int(data.get('Gx', 0)), int(data.get('Gy', 0)))
         d = data.get('d')
-        result = SignatureService.sign_with_ecdsa(message, p, q, a, b, G, d)
+        mode = data.get('mode') or "block"
+        result = SignatureService.sign_with_ecdsa(message, p, q, a, b, G, d, mode)
         return Response(result)
 
     @api_view(['POST'])
@@ -245,16 +261,37 @@ class HandleSubmitCryptoSystem(APIView):
         b = data.get('b')
         G = (int(data.get('Gx', 0)), int(data.get('Gy', 0)))
         Q = (int(data.get('Qx', 0)), int(data.get('Qy', 0)))
+        mode = data.get('mode') or "block"
+        message = data.get('message')
         result = SignatureService.verify_ecdsa_signature(
-            hash_message_str, signed_message_str, p, q, a, b, G, Q
+            hash_message_str, signed_message_str, p, q, a, b, G, Q, mode, message
         )
         return Response(result)
+    
+    # Digital Signatures - batch verification
+    @api_view(['POST'])
+    def batch_verify(request):
+        data = request.data
+        scheme = data.get('scheme')
+        items = data.get('items')
+        public_key = {k: data.get(k) for k in ('n', 'e', 'p', 'alpha', 'beta', 'q', 'a', 'b')}
+        public_key['G'] = (data.get('Gx', 0), data.get('Gy', 0))
+        public_key['Q'] = (data.get('Qx', 0), data.get('Qy', 0))
+        mode = data.get('mode') or "block"
+        result = SignatureService.batch_verify_signatures(scheme, items, public_key, mode)
+        return Response(result)
 
     # Algorithm Operations
     @api_view(['POST'])
     def prime_check(request):
         n = request.data.get('num')
-        result = AlgorithmService.check_prime(n)
+        mode = request.data.get('mode') or "bpsw"
+        result = AlgorithmService.check_prime(n, mode)
+        return Response(result)
+    
+    @api_view(['GET'])
+    def prime_pool_metrics(request):
+        result = AlgorithmService.prime_pool_metrics()
         return Response(result)
     
     @api_view(['POST'])
@@ -0,0 +1,45 @@
+"""
+Benchmark for the modular_exponentiation backends.
+
+Times b^e mod m with full-size b, e and odd m for every installed backend
+and prints the mean time per call and the speed-up over the reference loop.
+
+Usage (from the repository root):
+    python benchmarks/bench_modular_exponentiation.py [bits ...]
+"""
+
+import os
+import secrets
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from MahuCrypt_app.cryptography.algos import MODULAR_EXPONENTIATION_BACKENDS
+
+DEFAULT_BITS = [256, 512, 1024, 2048, 4096]
+
+
+def bench(bits, backend, calls):
+    m = secrets.randbits(bits) | (1 << (bits - 1)) | 1
+    b = secrets.randbelow(m)
+    e = secrets.randbits(bits) | (1 << (bits - 1))
+    function = MODULAR_EXPONENTIATION_BACKENDS[backend]
+    return timeit.timeit(lambda: function(b, e, m), number=calls) / calls
+
+
+def main(sizes):
+    backends = sorted(MODULAR_EXPONENTIATION_BACKENDS, key=lambda name: name != "reference")
+    print("%6s" % "bits" + "".join("%16s" % name for name in backends) + "   speed-up vs reference")
+    for bits in sizes:
+        # keep each cell around a second even for the slow reference loop
+        calls = max(1, 2 ** 20 // bits ** 2 * 16)
+        times = {name: bench(bits, name, calls) for name in backends}
+        row = "%6d" % bits + "".join("%13.3f ms" % (times[name] * 1e3) for name in backends)
+        gains = ", ".join("%s x%.1f" % (name, times["reference"] / times[name])
+                          for name in backends if name != "reference")
+        print(row + "   " + gains)
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_BITS)
@@ -0,0 +1,45 @@
+"""
+Benchmark for the sieve of Eratosthenes.
+
+Compares, per limit, the original list-of-bools sieve with the segmented
+odd-only sieve behind sieve_of_eratosthenes / iter_primes.
+
+Usage (from the repository root):
+    python benchmarks/bench_sieve.py [limit ...]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from MahuCrypt_app.cryptography.algos import sieve_of_eratosthenes
+
+DEFAULT_LIMITS = [10**4, 10**5, 10**6, 10**7]
+
+
+def list_sieve(limit):
+    is_prime = [True] * (limit + 1)
+    p = 2
+    while (p * p <= limit):
+        if (is_prime[p] == True):
+            for i in range(p * p, limit + 1, p):
+                is_prime[i] = False
+        p += 1
+    return [p for p in range(2, limit + 1) if is_prime[p]]
+
+
+def main(limits):
+    print("%10s%14s%14s%10s" % ("limit", "list", "segmented", "speedup"))
+    for limit in limits:
+        calls = max(1, 10**6 // limit)
+        times = []
+        for function in (list_sieve, sieve_of_eratosthenes):
+            #best of five runs, the other four absorb scheduler noise
+            times.append(min(timeit.repeat(lambda: function(limit), number=calls, repeat=5)) / calls)
+        print("%10d%11.3f ms%11.3f ms%9.1fx" % (limit, times[0] * 1e3, times[1] * 1e3, times[0] / times[1]))
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_LIMITS)
@@ -0,0 +1,98 @@
+"""
+Unit Test for the AKS polynomial congruence - Black Box Testing
+Module: MahuCrypt_app.cryptography.aks
+Functions: polynomial_power(a, n, r), aks_congruence_holds(a, n, r), is_prime_aks(n, time_budget, workers)
+
+Test Strategy: Equivalence Partitioning & Comparison with schoolbook arithmetic and BPSW
+Purpose: (X + a)^n mod (X^r - 1, n) must match repeated multiplication by X + a, and the
+         proof must agree with BPSW on both the sequential and the process-pool path
+"""
+
+import unittest
+from unittest import mock
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography import aks
+from MahuCrypt_app.cryptography.aks import polynomial_power, aks_congruence_holds, is_prime_aks
+from MahuCrypt_app.cryptography.algos import is_prime_bpsw, find_smallest_r
+
+
+def schoolbook_power(a, n, r):
+    coefficients = [1] + [0] * (r - 1)
+    for _ in range(n):
+        coefficients = [(coefficients[i - 1] + a * coefficients[i]) % n for i in range(r)]
+    return coefficients
+
+
+class TestPolynomialPower(unittest.TestCase):
+    """Black Box Testing for polynomial_power(a, n, r) and aks_congruence_holds(a, n, r)"""
+
+    # TC01: Schoolbook agreement
+    def test_tc01_matches_schoolbook(self):
+        """Test case TC01: primes, composites and Carmichael numbers with several r"""
+        for n in [7, 15, 97, 561, 1105]:
+            for r in [2, 3, 5, 11, 17]:
+                for a in [1, 2, 5]:
+                    self.assertEqual(polynomial_power(a, n, r), schoolbook_power(a, n, r), (a, n, r))
+
+    # TC02: The congruence separates primes from composites
+    def test_tc02_congruence(self):
+        """Test case TC02: holds for the prime 1000003, fails for 1009 * 1013 already at a = 1, where 1^n = 1 passes trivially"""
+        n = 1000003
+        r = find_smallest_r(n)
+        for a in [1, 2, 3]:
+            self.assertTrue(aks_congruence_holds(a, n, r))
+        n = 1009 * 1013
+        self.assertFalse(aks_congruence_holds(1, n, find_smallest_r(n)))
+
+
+class TestIsPrimeAKS(unittest.TestCase):
+    """Black Box Testing for is_prime_aks(n, time_budget, workers)"""
+
+    # TC03: Sequential path
+    def test_tc03_matches_bpsw(self):
+        """Test case TC03: every n < 400 with workers = 1"""
+        for n in range(400):
+            self.assertEqual(is_prime_aks(n, workers=1), is_prime_bpsw(n), n)
+
+    # TC04: Process pool path
+    def test_tc04_process_pool(self):
+        """Test case TC04: 1000003 needs about 400 congruences, checked on two workers"""
+        self.assertTrue(is_prime_aks(1000003, workers=2))
+        self.assertFalse(is_prime_aks(1009 * 1013, workers=2))
+
+    # TC05: Time budget
+    def test_tc05_time_budget(self):
+        """Test case TC05: the pool is abandoned once the budget is spent"""
+        with self.assertRaises(TimeoutError):
+            is_prime_aks(2**61 - 1, time_budget=1, workers=2)
+
+    # TC06: NumPy and to_bytes paths agree
+    def test_tc06_numpy_path(self):
+        """Test case TC06: at the largest 32-bit prime the NumPy path matches the to_bytes path"""
+        n = 2**32 - 5
+        r = find_smallest_r(n)
+        expected = polynomial_power(5, n, r)
+        with mock.patch.object(aks, "AKS_NUMPY_MAX_BITS", 0):
+            self.assertEqual(polynomial_power(5, n, r), expected)
+
+    # TC07: A ten-digit prime
+    def test_tc07_ten_digits(self):
+        """Test case TC07: 1000000007 is proved prime, about 900 congruences with r = 911"""
+        self.assertTrue(is_prime_aks(1000000007))
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestPolynomialPower))
+    suite.addTest(unittest.makeSuite(TestIsPrimeAKS))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
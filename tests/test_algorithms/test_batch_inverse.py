@@ -0,0 +1,103 @@
+"""
+Unit Test for batch inversion and vectorised point operations - Black Box Testing
+Module: MahuCrypt_app.cryptography.algos
+Functions: batch_inverse(values, p), add_points_many(points1, points2, a, p),
+           double_many(points, a, p), from_jacobian_many(points, p)
+
+Test Strategy: Equivalence Partitioning & Comparison with the one-at-a-time functions
+Purpose: Montgomery's trick must give the same results as one inversion per element
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.algos import (
+    batch_inverse, add_points_many, double_many, from_jacobian_many,
+    add_points, double, from_jacobian, jacobian_double, to_jacobian
+)
+
+
+class TestBatchInverse(unittest.TestCase):
+    """
+    Black Box Testing for batch_inverse(values, p)
+
+    Test Plan:
+    - PE1: Every non-zero residue
+    - PE2: Values larger than p and negative values
+    - PE3: A non-invertible value
+    - Boundary: empty list
+    """
+
+    # TC01: PE1 - All residues
+    def test_tc01_all_residues(self):
+        """Test case TC01: every v in [1, 101) times its batch inverse is 1"""
+        p = 101
+        values = list(range(1, p))
+        for v, inv in zip(values, batch_inverse(values, p)):
+            self.assertEqual((v * inv) % p, 1)
+
+    # TC02: PE2 - Unreduced values
+    def test_tc02_unreduced_values(self):
+        """Test case TC02: negative and oversized values"""
+        p = 2**127 - 1
+        values = [-5, p + 3, 2**200, -(2**130)]
+        self.assertEqual(batch_inverse(values, p), [pow(v, -1, p) for v in values])
+
+    # TC03: PE3 - Zero
+    def test_tc03_not_invertible(self):
+        """Test case TC03: a multiple of p raises ValueError"""
+        with self.assertRaises(ValueError):
+            batch_inverse([3, 97, 5], 97)
+
+    # TC04: Boundary - Empty
+    def test_tc04_empty(self):
+        """Test case TC04: no values, no inversion"""
+        self.assertEqual(batch_inverse([], 97), [])
+
+
+class TestPointsMany(unittest.TestCase):
+    """add_points_many / double_many / from_jacobian_many match the single-point functions"""
+
+    p = 97
+    a = 2
+    b = 3
+
+    def setUp(self):
+        self.points = [(0, 0)] + [(x, y) for x in range(self.p) for y in range(self.p)
+                                  if (y * y - (x**3 + self.a * x + self.b)) % self.p == 0]
+
+    # TC05: Every pair of points, including P + P, P + (-P) and the point at infinity
+    def test_tc05_add_points_many(self):
+        """Test case TC05: all pairs on y^2 = x^3 + 2x + 3 (mod 97)"""
+        points1 = [P for P in self.points for _ in self.points]
+        points2 = [Q for _ in self.points for Q in self.points]
+        expected = [add_points(P, Q, self.a, self.p) for P, Q in zip(points1, points2)]
+        self.assertEqual(add_points_many(points1, points2, self.a, self.p), expected)
+
+    # TC06: Doubling
+    def test_tc06_double_many(self):
+        """Test case TC06: every affine point"""
+        points = self.points[1:]
+        self.assertEqual(double_many(points, self.a, self.p), [double(P, self.a, self.p) for P in points])
+
+    # TC07: Normalizing Jacobian points
+    def test_tc07_from_jacobian_many(self):
+        """Test case TC07: doubled points with Z != 1 and the point at infinity"""
+        jacobian = [jacobian_double(to_jacobian(P, self.p), self.a, self.p) for P in self.points]
+        self.assertEqual(from_jacobian_many(jacobian, self.p), [from_jacobian(J, self.p) for J in jacobian])
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestBatchInverse))
+    suite.addTest(unittest.makeSuite(TestPointsMany))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
@@ -0,0 +1,145 @@
+"""
+Unit Test for the Baillie-PSW primality test - Black Box Testing
+Module: MahuCrypt_app.cryptography.algos, MahuCrypt_app.services.algorithm_service
+Functions: jacobi_symbol(a, n), is_strong_lucas_probable_prime(n), is_prime_bpsw(n),
+           is_prime_aks(n, time_budget), AlgorithmService.check_prime(n, mode)
+
+Test Strategy: Equivalence Partitioning & Comparison with a sieve
+Purpose: BPSW must agree with the sieve, reject the pseudoprimes of each half of the test,
+         answer for RSA-size primes within a second, and the primality endpoint must keep
+         AKS as a time-limited proof mode
+"""
+
+import unittest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.algos import (
+    jacobi_symbol, is_strong_lucas_probable_prime, is_strong_probable_prime,
+    is_prime_bpsw, is_prime_aks, sieve_of_eratosthenes
+)
+from MahuCrypt_app.cryptography.public_key_cryptography import search_prime_number
+from MahuCrypt_app.services.algorithm_service import AlgorithmService
+
+
+class TestJacobiSymbol(unittest.TestCase):
+    """Black Box Testing for jacobi_symbol(a, n)"""
+
+    # TC01: Agrees with Euler's criterion for primes
+    def test_tc01_matches_euler_criterion(self):
+        """Test case TC01: (a/p) = a^((p-1)/2) mod p for p = 101"""
+        p = 101
+        for a in range(p):
+            expected = pow(a, (p - 1) // 2, p)
+            expected = -1 if expected == p - 1 else expected
+            self.assertEqual(jacobi_symbol(a, p), expected)
+
+    # TC02: Composite modulus
+    def test_tc02_composite_modulus(self):
+        """Test case TC02: (2/15) = 1 and (7/15) = -1"""
+        self.assertEqual(jacobi_symbol(2, 15), 1)
+        self.assertEqual(jacobi_symbol(7, 15), -1)
+        self.assertEqual(jacobi_symbol(5, 15), 0)
+
+
+class TestBPSW(unittest.TestCase):
+    """
+    Black Box Testing for is_prime_bpsw(n)
+
+    Test Plan:
+    - PE1: Agrees with the sieve below 10^5
+    - PE2: Strong Lucas pseudoprimes pass Lucas but fail base 2
+    - PE3: Strong base-2 pseudoprimes fail Lucas
+    - PE4: Large primes and composites
+    - PE5: RSA-size primes in bounded time
+    """
+
+    # TC03: PE1 - Sieve agreement
+    def test_tc03_matches_sieve(self):
+        """Test case TC03: every n < 100000"""
+        primes = set(sieve_of_eratosthenes(100000))
+        for n in range(100000):
+            if is_prime_bpsw(n) != (n in primes):
+                self.fail("is_prime_bpsw(%d) is wrong" % n)
+
+    # TC04: PE2 - Strong Lucas pseudoprimes
+    def test_tc04_strong_lucas_pseudoprimes(self):
+        """Test case TC04: every strong Lucas pseudoprime below 10^5"""
+        for n in [5459, 5777, 10877, 16109, 18971, 22499, 24569, 25199, 40309, 58519, 75077, 97439]:
+            with self.subTest(n=n):
+                self.assertTrue(is_strong_lucas_probable_prime(n))
+                self.assertFalse(is_strong_probable_prime(n, 2))
+                self.assertFalse(is_prime_bpsw(n))
+
+    # TC05: PE3 - Strong base-2 pseudoprimes
+    def test_tc05_strong_base_2_pseudoprimes(self):
+        """Test case TC05: 2047, 3277, 4033, 4681, 8321, 3215031751"""
+        for n in [2047, 3277, 4033, 4681, 8321, 3215031751]:
+            with self.subTest(n=n):
+                self.assertTrue(is_strong_probable_prime(n, 2))
+                self.assertFalse(is_strong_lucas_probable_prime(n))
+                self.assertFalse(is_prime_bpsw(n))
+
+    # TC06: PE4 - Large numbers
+    def test_tc06_large_numbers(self):
+        """Test case TC06: Mersenne primes, their products, and a prime square"""
+        for e in [127, 521, 2203]:
+            with self.subTest(e=e):
+                self.assertTrue(is_prime_bpsw(2**e - 1))
+        self.assertFalse(is_prime_bpsw((2**127 - 1) * (2**521 - 1)))
+        self.assertFalse(is_prime_bpsw((2**89 - 1) ** 2))
+
+    # TC11: PE5 - RSA-size primes
+    def test_tc11_rsa_size_time(self):
+        """Test case TC11: a 2048-bit prime (a factor of an RSA-4096 modulus) passes in under a second,
+        and the Mersenne prime 2^4423 - 1 passes the Lucas half"""
+        p = search_prime_number(2048)
+        started = time.monotonic()
+        self.assertTrue(is_prime_bpsw(p))
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertTrue(is_strong_lucas_probable_prime(2**4423 - 1))
+
+
+class TestPrimalityModes(unittest.TestCase):
+    """AlgorithmService.check_prime: BPSW by default, AKS as a proof mode"""
+
+    # TC07: Default mode
+    def test_tc07_default_bpsw(self):
+        """Test case TC07: a 183-digit prime answers without AKS"""
+        n = 2**607 - 1
+        self.assertEqual(AlgorithmService.check_prime(n), {"": f"{n} - Prime"})
+        self.assertEqual(AlgorithmService.check_prime(1), {"": "1 - Composite"})
+
+    # TC08: Proof mode
+    def test_tc08_proof_mode(self):
+        """Test case TC08: AKS still answers small inputs"""
+        self.assertEqual(AlgorithmService.check_prime(97, "proof"), {"": "97 - Prime"})
+        self.assertEqual(AlgorithmService.check_prime(91, "proof"), {"": "91 - Composite"})
+
+    # TC09: Unknown mode
+    def test_tc09_unknown_mode(self):
+        """Test case TC09: mode must be bpsw or proof"""
+        self.assertIn("Error", AlgorithmService.check_prime(97, "fast"))
+
+    # TC10: Time budget
+    def test_tc10_time_budget(self):
+        """Test case TC10: is_prime_aks gives up once the budget is spent"""
+        with self.assertRaises(TimeoutError):
+            is_prime_aks(2**127 - 1, time_budget=0)
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestJacobiSymbol))
+    suite.addTest(unittest.makeSuite(TestBPSW))
+    suite.addTest(unittest.makeSuite(TestPrimalityModes))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
@@ -0,0 +1,93 @@
+"""
+Unit Test for the extended Euclidean engine - Black Box Testing
+Module: MahuCrypt_app.cryptography.euclid
+Functions: ext_gcd(a, b), ext_gcd_classic(a, b), inverse_mod(a, m)
+
+Test Strategy: Equivalence Partitioning & Comparison with the classic division loop
+Purpose: Lehmer's algorithm must return exactly the classic coefficients and
+         inverse_mod must agree with them modulo m
+"""
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.euclid import ext_gcd, ext_gcd_classic, inverse_mod, LEHMER_THRESHOLD
+from MahuCrypt_app.cryptography.algos import Ext_Euclide
+
+
+class TestExtGcd(unittest.TestCase):
+    """
+    Black Box Testing for ext_gcd(a, b)
+
+    Test Plan:
+    - PE1: Operands above LEHMER_THRESHOLD (Lehmer path)
+    - PE2: Large common factor, a < b, a multiple of b
+    - PE3: Small and signed operands (classic path)
+    """
+
+    # TC01: PE1 - Lehmer agrees with the classic loop
+    def test_tc01_lehmer_matches_classic(self):
+        """Test case TC01: random operands from LEHMER_THRESHOLD to 6000 bits"""
+        rng = random.Random(12)
+        for bits in [LEHMER_THRESHOLD + 1, 1024, 3000, 6000]:
+            for _ in range(10):
+                a = rng.getrandbits(bits) | (1 << (bits - 1))
+                b = rng.getrandbits(bits - rng.randrange(0, 200)) | (1 << (LEHMER_THRESHOLD + 1))
+                with self.subTest(bits=bits):
+                    self.assertEqual(ext_gcd(a, b), ext_gcd_classic(a, b))
+                    self.assertEqual(ext_gcd(b, a), ext_gcd_classic(b, a))
+
+    # TC02: PE2 - Structured operands
+    def test_tc02_structured_operands(self):
+        """Test case TC02: common factor, equal operands, one a multiple of the other"""
+        g = 2**521 - 1
+        x = 3**700
+        y = 5**500
+        for a, b in [(g * x, g * y), (x, x), (x * y, y), (y, x * y)]:
+            with self.subTest(a=a % 1000, b=b % 1000):
+                d, u, v = ext_gcd(a, b)
+                self.assertEqual((d, u, v), ext_gcd_classic(a, b))
+                self.assertEqual(a * u + b * v, d)
+
+    # TC03: PE3 - Small and signed operands
+    def test_tc03_small_operands(self):
+        """Test case TC03: Ext_Euclide keeps its results for small and negative inputs"""
+        for a, b in [(240, 46), (10, 0), (0, 15), (-48, 18), (48, -18), (1, 1)]:
+            with self.subTest(a=a, b=b):
+                self.assertEqual(Ext_Euclide(a, b), ext_gcd_classic(a, b))
+
+
+class TestInverseMod(unittest.TestCase):
+    """Black Box Testing for inverse_mod(a, m)"""
+
+    # TC04: Agrees with the coefficient mode
+    def test_tc04_matches_coefficient(self):
+        """Test case TC04: inverse_mod(a, p) = Ext_Euclide(a, p)[1] mod p"""
+        p = 2**255 - 19
+        for a in [1, 2, 12345, p - 1, 3**100]:
+            with self.subTest(a=a):
+                self.assertEqual(inverse_mod(a, p), Ext_Euclide(a, p)[1] % p)
+                self.assertEqual((inverse_mod(a, p) * a) % p, 1)
+
+    # TC05: Not invertible
+    def test_tc05_not_invertible(self):
+        """Test case TC05: gcd(a, m) != 1 raises ValueError"""
+        with self.assertRaises(ValueError):
+            inverse_mod(6, 9)
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestExtGcd))
+    suite.addTest(unittest.makeSuite(TestInverseMod))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
@@ -0,0 +1,120 @@
+"""
+Unit Test for integer factorization - Black Box Testing
+Module: MahuCrypt_app.cryptography.factorization
+Functions: factorize(n), pollard_brent(n), largest_prime_factor(n)
+
+Test Strategy: Equivalence Partitioning & Comparison with trial division
+Purpose: The factorization must multiply back to n with BPSW-prime factors, and
+         largest_prime_factor must stay exact beyond the float range of n**0.5
+"""
+
+import unittest
+import random
+import sys
+import os
+from math import prod
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.factorization import factorize, pollard_brent
+from MahuCrypt_app.cryptography.algos import largest_prime_factor, is_prime_bpsw
+
+
+class TestFactorize(unittest.TestCase):
+    """
+    Black Box Testing for factorize(n)
+
+    Test Plan:
+    - PE1: Every n below 20000
+    - PE2: Products of two large primes (rho path)
+    - PE3: Prime powers and repeated large factors
+    - PE4: Random 64 and 96-bit curve-order sized numbers
+    - Invalid: n < 1
+    """
+
+    def assertFactorization(self, n, factors):
+        self.assertEqual(prod(p**e for p, e in factors.items()), n)
+        self.assertEqual(list(factors), sorted(factors))
+        for p in factors:
+            self.assertTrue(is_prime_bpsw(p), p)
+
+    # TC01: PE1 - Small numbers
+    def test_tc01_small_numbers(self):
+        """Test case TC01: 1 <= n < 20000"""
+        self.assertEqual(factorize(1), {})
+        for n in range(2, 20000):
+            self.assertFactorization(n, factorize(n))
+
+    # TC02: PE2 - Semiprimes
+    def test_tc02_semiprimes(self):
+        """Test case TC02: (2^31 - 1)(2^61 - 1) and 1000003 * 999983"""
+        self.assertEqual(factorize((2**31 - 1) * (2**61 - 1)), {2**31 - 1: 1, 2**61 - 1: 1})
+        self.assertEqual(factorize(1000003 * 999983), {999983: 1, 1000003: 1})
+
+    # TC03: PE3 - Powers
+    def test_tc03_powers(self):
+        """Test case TC03: 1000003^3 * 999983^2 and 2^64"""
+        self.assertEqual(factorize(1000003**3 * 999983**2), {999983: 2, 1000003: 3})
+        self.assertEqual(factorize(2**64), {2: 64})
+
+    # TC04: PE4 - Random numbers
+    def test_tc04_random_numbers(self):
+        """Test case TC04: 64 and 96-bit random numbers"""
+        rng = random.Random(14)
+        for bits in [64, 96]:
+            for _ in range(10):
+                n = rng.getrandbits(bits) | (1 << (bits - 1))
+                with self.subTest(n=n):
+                    self.assertFactorization(n, factorize(n))
+
+    # TC05: Invalid input
+    def test_tc05_invalid(self):
+        """Test case TC05: n = 0 raises ValueError"""
+        with self.assertRaises(ValueError):
+            factorize(0)
+
+
+class TestPollardBrent(unittest.TestCase):
+    """Black Box Testing for pollard_brent(n)"""
+
+    # TC06: Non-trivial factor
+    def test_tc06_nontrivial_factor(self):
+        """Test case TC06: the factor divides n and is neither 1 nor n"""
+        for n in [8051, 10403, 1000003 * 999983, (2**31 - 1) * (2**61 - 1)]:
+            with self.subTest(n=n):
+                d = pollard_brent(n)
+                self.assertTrue(1 < d < n)
+                self.assertEqual(n % d, 0)
+
+
+class TestLargestPrimeFactor(unittest.TestCase):
+    """Black Box Testing for largest_prime_factor(n)"""
+
+    # TC07: Known values
+    def test_tc07_known_values(self):
+        """Test case TC07: 30, a prime, 1 and 0"""
+        self.assertEqual(largest_prime_factor(30), 5)
+        self.assertEqual(largest_prime_factor(29), 29)
+        self.assertEqual(largest_prime_factor(1), 0)
+        self.assertEqual(largest_prime_factor(0), 0)
+
+    # TC08: Beyond 2^53
+    def test_tc08_beyond_float_precision(self):
+        """Test case TC08: a large prime times a small cofactor"""
+        q = 2**89 - 1
+        self.assertEqual(largest_prime_factor(12 * q), q)
+        self.assertEqual(largest_prime_factor(q * q), q)
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestFactorize))
+    suite.addTest(unittest.makeSuite(TestPollardBrent))
+    suite.addTest(unittest.makeSuite(TestLargestPrimeFactor))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
@@ -0,0 +1,109 @@
+"""
+Unit Test for fixed-base scalar multiplication - Black Box Testing
+Module: MahuCrypt_app.cryptography.algos
+Functions: fixed_base_mul(point, n, a, p), fixed_base_table(point, a, p, length)
+
+Test Strategy: Equivalence Partitioning & Comparison with double_and_add
+Purpose: Cached 2^i*P tables must give the same n*P and be evicted in LRU order
+"""
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography import algos
+from MahuCrypt_app.cryptography.algos import (
+    fixed_base_mul, fixed_base_table, clear_fixed_base_cache, double_and_add
+)
+
+
+class TestFixedBaseMul(unittest.TestCase):
+    """
+    Black Box Testing for fixed_base_mul(point, n, a, p)
+
+    Test Plan:
+    - PE1: Matches double_and_add on a small curve
+    - PE2: Matches double_and_add on a large prime
+    - PE3: n = 0 gives the point at infinity
+    - PE4: Multiplying by the group order gives the point at infinity
+    """
+
+    def setUp(self):
+        clear_fixed_base_cache()
+
+    # TC01: PE1 - Small curve
+    def test_tc01_small_curve(self):
+        """Test case TC01: every n < 150 on y^2 = x^3 + 2x + 3 (mod 97)"""
+        for n in range(1, 150):
+            with self.subTest(n=n):
+                self.assertEqual(fixed_base_mul((3, 6), n, 2, 97), double_and_add((3, 6), n, 2, 97))
+
+    # TC02: PE2 - Large prime
+    def test_tc02_large_prime(self):
+        """Test case TC02: random scalars modulo 2^127 - 1"""
+        p = 2**127 - 1
+        point = (12345, 67890)
+        rng = random.Random(7)
+        for _ in range(10):
+            n = rng.randrange(p)
+            with self.subTest(n=n):
+                self.assertEqual(fixed_base_mul(point, n, 5, p), double_and_add(point, n, 5, p))
+
+    # TC03: PE3 - Zero scalar
+    def test_tc03_zero_scalar(self):
+        """Test case TC03: 0 * P = O"""
+        self.assertEqual(fixed_base_mul((3, 6), 0, 2, 97), (0, 0))
+
+    # TC04: PE4 - Group order
+    def test_tc04_group_order(self):
+        """Test case TC04: y^2 = x^3 + 2x + 2 (mod 17) has order 19"""
+        self.assertEqual(fixed_base_mul((5, 1), 19, 2, 17), (0, 0))
+        self.assertEqual(fixed_base_mul((5, 1), 21, 2, 17), double_and_add((5, 1), 2, 2, 17))
+
+
+class TestFixedBaseCache(unittest.TestCase):
+    """Black Box Testing for the table cache behind fixed_base_mul"""
+
+    def setUp(self):
+        clear_fixed_base_cache()
+        self.cache_size = algos.FIXED_BASE_CACHE_SIZE
+
+    def tearDown(self):
+        algos.FIXED_BASE_CACHE_SIZE = self.cache_size
+        clear_fixed_base_cache()
+
+    # TC05: Table is reused and extended in place
+    def test_tc05_table_reused(self):
+        """Test case TC05: the same base point returns the same (growing) table"""
+        table = fixed_base_table((3, 6), 2, 97, 4)
+        self.assertEqual(len(table), 4)
+        fixed_base_mul((3, 6), 2**20, 2, 97)
+        self.assertIs(fixed_base_table((3, 6), 2, 97, 1), table)
+        self.assertGreaterEqual(len(table), 21)
+
+    # TC06: LRU eviction
+    def test_tc06_lru_eviction(self):
+        """Test case TC06: the least recently used base point is evicted first"""
+        algos.FIXED_BASE_CACHE_SIZE = 2
+        first = fixed_base_table((3, 6), 2, 97, 2)
+        fixed_base_table((4, 7), 2, 97, 2)
+        fixed_base_table((3, 6), 2, 97, 2)
+        fixed_base_table((10, 15), 2, 97, 2)
+        self.assertIs(fixed_base_table((3, 6), 2, 97, 2), first)
+        self.assertNotIn(((4, 7), 2, 97), algos._fixed_base_tables)
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestFixedBaseMul))
+    suite.addTest(unittest.makeSuite(TestFixedBaseCache))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
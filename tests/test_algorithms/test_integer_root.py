@@ -0,0 +1,107 @@
+"""
+Unit Test for exact integer roots and perfect powers - Black Box Testing
+Module: MahuCrypt_app.cryptography.algos
+Functions: integer_root(n, k), perfect_power(n), is_perfect_power(n)
+
+Test Strategy: Equivalence Partitioning & Boundary Value Analysis
+Purpose: Roots must be exact far beyond the float range, and perfect-power detection
+         must agree with brute force on small n and stay correct on large n
+"""
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.algos import integer_root, perfect_power, is_perfect_power
+
+
+class TestIntegerRoot(unittest.TestCase):
+    """
+    Black Box Testing for integer_root(n, k)
+
+    Test Plan:
+    - PE1: Small n and k, checked against r^k <= n < (r+1)^k
+    - PE2: Random n up to 4000 bits
+    - PE3: Exact powers and their neighbours
+    - Invalid: n < 0, k < 1
+    """
+
+    def assertRoot(self, n, k):
+        r = integer_root(n, k)
+        self.assertTrue(r**k <= n < (r + 1)**k, (n, k, r))
+
+    # TC01: PE1 - Small values
+    def test_tc01_small_values(self):
+        """Test case TC01: 0 <= n < 3000, 1 <= k < 12"""
+        for n in range(3000):
+            for k in range(1, 12):
+                self.assertRoot(n, k)
+
+    # TC02: PE2 - Large random values
+    def test_tc02_large_values(self):
+        """Test case TC02: random n up to 4000 bits, k up to 300"""
+        rng = random.Random(17)
+        for _ in range(300):
+            self.assertRoot(rng.getrandbits(rng.randrange(1, 4000)), rng.randrange(1, 300))
+
+    # TC03: PE3 - Exact powers
+    def test_tc03_exact_powers(self):
+        """Test case TC03: (2^521 - 1)^k - 1, (2^521 - 1)^k and (2^521 - 1)^k + 1"""
+        r = 2**521 - 1
+        for k in [2, 3, 5, 8]:
+            with self.subTest(k=k):
+                self.assertEqual(integer_root(r**k, k), r)
+                self.assertEqual(integer_root(r**k - 1, k), r - 1)
+                self.assertEqual(integer_root(r**k + 1, k), r)
+
+    # TC04: Invalid input
+    def test_tc04_invalid(self):
+        """Test case TC04: negative n and k = 0"""
+        with self.assertRaises(ValueError):
+            integer_root(-8, 3)
+        with self.assertRaises(ValueError):
+            integer_root(8, 0)
+
+
+class TestPerfectPower(unittest.TestCase):
+    """Black Box Testing for perfect_power(n) and is_perfect_power(n)"""
+
+    # TC05: Brute force agreement
+    def test_tc05_matches_brute_force(self):
+        """Test case TC05: every n < 100000"""
+        powers = {b**e for b in range(2, 317) for e in range(2, 17) if b**e < 100000}
+        for n in range(100000):
+            if is_perfect_power(n) != (n in powers):
+                self.fail("is_perfect_power(%d) is wrong" % n)
+
+    # TC06: Prime exponent returned
+    def test_tc06_prime_exponent(self):
+        """Test case TC06: r^k = n with k prime"""
+        for n, expected in [(3**77, (3**11, 7)), (2**64, (2**32, 2)), (10**9, (10**3, 3))]:
+            with self.subTest(n=n):
+                self.assertEqual(perfect_power(n), expected)
+
+    # TC07: Beyond the float range
+    def test_tc07_large_inputs(self):
+        """Test case TC07: powers of Mersenne primes past 2^1024"""
+        m = 2**607 - 1
+        self.assertEqual(perfect_power(m**3), (m, 3))
+        self.assertEqual(perfect_power((2**127 - 1)**13), (2**127 - 1, 13))
+        self.assertIsNone(perfect_power(m**3 + 2))
+        self.assertFalse(is_perfect_power((2**521 - 1) * (2**607 - 1)))
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestIntegerRoot))
+    suite.addTest(unittest.makeSuite(TestPerfectPower))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
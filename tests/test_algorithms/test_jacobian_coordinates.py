@@ -0,0 +1,138 @@
+"""
+Unit Test for Jacobian Point Operations - Black Box Testing
+Module: MahuCrypt_app.cryptography.algos
+Functions: to_jacobian(point, p), from_jacobian(point, p), jacobian_double(point, a, p),
+           jacobian_add(point1, point2, a, p), double_and_add(point, n, a, p)
+
+Test Strategy: Equivalence Partitioning & Comparison with the affine formulas
+Purpose: Jacobian arithmetic must give the same affine results as double/add_points
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.algos import (
+    double, add_points, double_and_add,
+    to_jacobian, from_jacobian, jacobian_double, jacobian_add, JACOBIAN_INFINITY
+)
+
+
+class TestJacobianConversion(unittest.TestCase):
+    """
+    Black Box Testing for to_jacobian / from_jacobian
+
+    Test Plan:
+    - PE1: Affine point round trip
+    - PE2: Point at infinity (0, 0)
+    - PE3: Scaled representative (X*Z^2, Y*Z^3, Z) maps to the same affine point
+    """
+
+    # TC01: PE1 - Round trip
+    def test_tc01_round_trip(self):
+        """Test case TC01: from_jacobian(to_jacobian(P)) == P"""
+        point = (3, 6)
+        p = 97
+        self.assertEqual(from_jacobian(to_jacobian(point, p), p), point)
+
+    # TC02: PE2 - Point at infinity
+    def test_tc02_infinity(self):
+        """Test case TC02: (0, 0) maps to Z = 0 and back"""
+        p = 97
+        self.assertEqual(to_jacobian((0, 0), p), JACOBIAN_INFINITY)
+        self.assertEqual(from_jacobian(JACOBIAN_INFINITY, p), (0, 0))
+
+    # TC03: PE3 - Scaled representative
+    def test_tc03_scaled_representative(self):
+        """Test case TC03: (X*Z^2, Y*Z^3, Z) is the same point for any Z != 0"""
+        x, y = 3, 6
+        p = 97
+        for z in [2, 5, 96]:
+            with self.subTest(z=z):
+                point = ((x * z**2) % p, (y * z**3) % p, z)
+                self.assertEqual(from_jacobian(point, p), (x, y))
+
+
+class TestJacobianArithmetic(unittest.TestCase):
+    """
+    Black Box Testing for jacobian_double / jacobian_add
+
+    Test Plan:
+    - PE1: Doubling matches affine double
+    - PE2: Addition matches affine add_points
+    - PE3: P + (-P) is the point at infinity
+    - PE4: P + P falls back to doubling
+    """
+
+    a = 2
+    p = 97
+
+    # TC04: PE1 - Doubling
+    def test_tc04_double_matches_affine(self):
+        """Test case TC04: jacobian_double agrees with double"""
+        for point in [(3, 6), (4, 7), (10, 15)]:
+            with self.subTest(point=point):
+                result = from_jacobian(jacobian_double(to_jacobian(point, self.p), self.a, self.p), self.p)
+                self.assertEqual(result, double(point, self.a, self.p))
+
+    # TC05: PE2 - Addition
+    def test_tc05_add_matches_affine(self):
+        """Test case TC05: jacobian_add agrees with add_points"""
+        point1 = (3, 6)
+        point2 = (80, 10)
+        J1 = to_jacobian(point1, self.p)
+        J2 = jacobian_double(to_jacobian(point2, self.p), self.a, self.p)
+        result = from_jacobian(jacobian_add(J1, J2, self.a, self.p), self.p)
+        expected = add_points(point1, double(point2, self.a, self.p), self.a, self.p)
+        self.assertEqual(result, expected)
+
+    # TC06: PE3 - Inverse points
+    def test_tc06_add_inverse_points(self):
+        """Test case TC06: P + (-P) = O"""
+        J1 = to_jacobian((3, 6), self.p)
+        J2 = to_jacobian((3, self.p - 6), self.p)
+        self.assertEqual(jacobian_add(J1, J2, self.a, self.p)[2], 0)
+
+    # TC07: PE4 - Adding a point to itself
+    def test_tc07_add_point_to_itself(self):
+        """Test case TC07: P + P = 2P"""
+        J = to_jacobian((3, 6), self.p)
+        self.assertEqual(from_jacobian(jacobian_add(J, J, self.a, self.p), self.p),
+                         double((3, 6), self.a, self.p))
+
+
+class TestJacobianScalarMultiplication(unittest.TestCase):
+    """double_and_add must agree with repeated affine addition"""
+
+    def test_tc08_matches_repeated_addition(self):
+        """Test case TC08: n*P equals P + P + ... + P for n < 60"""
+        point = (3, 6)
+        a = 2
+        p = 97
+        expected = (0, 0)
+        for n in range(1, 60):
+            expected = add_points(expected, point, a, p)
+            with self.subTest(n=n):
+                self.assertEqual(double_and_add(point, n, a, p), expected)
+
+    def test_tc09_group_order(self):
+        """Test case TC09: multiplying by the group order gives the point at infinity"""
+        # y^2 = x^3 + 2x + 2 (mod 17) has 19 points, generated by (5, 1)
+        self.assertEqual(double_and_add((5, 1), 19, 2, 17), (0, 0))
+        self.assertEqual(double_and_add((5, 1), 20, 2, 17), (5, 1))
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestJacobianConversion))
+    suite.addTest(unittest.makeSuite(TestJacobianArithmetic))
+    suite.addTest(unittest.makeSuite(TestJacobianScalarMultiplication))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
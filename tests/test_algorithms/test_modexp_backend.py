@@ -0,0 +1,78 @@
+"""
+Unit Test for the modular exponentiation backends - Black Box Testing
+Module: MahuCrypt_app.cryptography.algos
+Functions: modular_exponentiation(b, n, m, backend), set_modular_exponentiation_backend(name)
+
+Test Strategy: Comparison between backends
+Purpose: Every backend must give the same b^n mod m and switching must be reversible
+"""
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography import algos
+from MahuCrypt_app.cryptography.algos import (
+    modular_exponentiation, set_modular_exponentiation_backend, MODULAR_EXPONENTIATION_BACKENDS
+)
+
+
+class TestModularExponentiationBackends(unittest.TestCase):
+    """
+    Black Box Testing for the backend layer
+
+    Test Plan:
+    - PE1: All installed backends agree on random inputs
+    - PE2: Switching the process-wide backend
+    - PE3: Unknown backend name
+    """
+
+    def setUp(self):
+        self.previous = algos.MODULAR_EXPONENTIATION_BACKEND
+
+    def tearDown(self):
+        set_modular_exponentiation_backend(self.previous)
+
+    # TC01: PE1 - Agreement
+    def test_tc01_backends_agree(self):
+        """Test case TC01: builtin, reference (and gmpy2 if installed) give the same result"""
+        rng = random.Random(8)
+        for bits in [8, 64, 521, 2048]:
+            m = rng.getrandbits(bits) | 1
+            b = rng.getrandbits(bits + 3)
+            n = rng.getrandbits(bits)
+            expected = pow(b, n, m)
+            for name in MODULAR_EXPONENTIATION_BACKENDS:
+                with self.subTest(bits=bits, backend=name):
+                    self.assertEqual(modular_exponentiation(b, n, m, backend=name), expected)
+
+    # TC02: PE2 - Switching
+    def test_tc02_switch_backend(self):
+        """Test case TC02: the selected backend is used by default"""
+        set_modular_exponentiation_backend("reference")
+        self.assertEqual(algos.MODULAR_EXPONENTIATION_BACKEND, "reference")
+        self.assertEqual(modular_exponentiation(3, 200, 1000003), pow(3, 200, 1000003))
+        set_modular_exponentiation_backend("builtin")
+        self.assertEqual(algos.MODULAR_EXPONENTIATION_BACKEND, "builtin")
+
+    # TC03: PE3 - Unknown name
+    def test_tc03_unknown_backend(self):
+        """Test case TC03: unknown names raise ValueError and keep the current backend"""
+        with self.assertRaises(ValueError):
+            set_modular_exponentiation_backend("no-such-backend")
+        self.assertEqual(algos.MODULAR_EXPONENTIATION_BACKEND, self.previous)
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestModularExponentiationBackends))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
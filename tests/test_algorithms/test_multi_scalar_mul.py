@@ -0,0 +1,101 @@
+"""
+Unit Test for multi_scalar_mul function - Black Box Testing
+Module: MahuCrypt_app.cryptography.algos
+Function: multi_scalar_mul(pairs, a, p, w)
+
+Test Strategy: Equivalence Partitioning & Comparison with separate multiplications
+Purpose: k1*P1 + k2*P2 + ... with a shared doubling chain (Straus-Shamir)
+"""
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.algos import multi_scalar_mul, double_and_add, add_points
+
+
+def naive_sum(pairs, a, p):
+    total = (0, 0)
+    for k, point in pairs:
+        total = add_points(total, double_and_add(point, k, a, p), a, p)
+    return total
+
+
+class TestMultiScalarMul(unittest.TestCase):
+    """
+    Black Box Testing for multi_scalar_mul(pairs, a, p)
+
+    Test Plan:
+    - PE1: Two scalars (ECDSA verification shape)
+    - PE2: Three or more scalars
+    - PE3: Zero scalars and points at infinity are skipped
+    - PE4: Negative scalars negate the point
+    - Boundary: Empty input
+    """
+
+    a = 2
+    p = 97
+    P1 = (3, 6)
+    P2 = double_and_add((3, 6), 5, 2, 97)
+    P3 = double_and_add((3, 6), 11, 2, 97)
+
+    # TC01: PE1 - Two scalars, small curve
+    def test_tc01_two_scalars(self):
+        """Test case TC01: k1*P1 + k2*P2 for small k1, k2"""
+        for k1 in range(0, 30, 3):
+            for k2 in range(0, 30, 4):
+                pairs = [(k1, self.P1), (k2, self.P2)]
+                with self.subTest(k1=k1, k2=k2):
+                    self.assertEqual(multi_scalar_mul(pairs, self.a, self.p), naive_sum(pairs, self.a, self.p))
+
+    # TC02: PE2 - Three scalars
+    def test_tc02_three_scalars(self):
+        """Test case TC02: k1*P1 + k2*P2 + k3*P3"""
+        pairs = [(17, self.P1), (40, self.P2), (93, self.P3)]
+        self.assertEqual(multi_scalar_mul(pairs, self.a, self.p), naive_sum(pairs, self.a, self.p))
+
+    # TC03: PE3 - Zero scalar and infinity
+    def test_tc03_zero_and_infinity(self):
+        """Test case TC03: 0*P1 + 7*P2 + 5*O == 7*P2"""
+        pairs = [(0, self.P1), (7, self.P2), (5, (0, 0))]
+        self.assertEqual(multi_scalar_mul(pairs, self.a, self.p), double_and_add(self.P2, 7, self.a, self.p))
+
+    # TC04: PE4 - Negative scalar
+    def test_tc04_negative_scalar(self):
+        """Test case TC04: 9*P1 + (-9)*P1 == O"""
+        self.assertEqual(multi_scalar_mul([(9, self.P1), (-9, self.P1)], self.a, self.p), (0, 0))
+
+    # TC05: Boundary - Empty input
+    def test_tc05_empty(self):
+        """Test case TC05: empty sum is the point at infinity"""
+        self.assertEqual(multi_scalar_mul([], self.a, self.p), (0, 0))
+
+    # TC06: Large prime, random scalars, every window
+    def test_tc06_large_prime(self):
+        """Test case TC06: random 127-bit scalars modulo 2^127 - 1"""
+        p = 2**127 - 1
+        a = 5
+        G = (12345, 67890)
+        Q = double_and_add(G, 987654321, a, p)
+        rng = random.Random(11)
+        for _ in range(5):
+            pairs = [(rng.randrange(p), G), (rng.randrange(p), Q)]
+            expected = naive_sum(pairs, a, p)
+            for w in [None, 2, 3, 5]:
+                with self.subTest(w=w):
+                    self.assertEqual(multi_scalar_mul(pairs, a, p, w=w), expected)
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestMultiScalarMul))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
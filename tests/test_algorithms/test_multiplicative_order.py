@@ -0,0 +1,107 @@
+"""
+Unit Test for the multiplicative order - Black Box Testing
+Module: MahuCrypt_app.cryptography.algos
+Functions: multiplicative_order(a, r), find_smallest_r(n, deadline)
+
+Test Strategy: Equivalence Partitioning & Comparison with brute force
+Purpose: The order computed from phi(r) must match the smallest k with a^k = 1 (mod r),
+         and find_smallest_r must keep returning the same r as the k-by-k search
+"""
+
+import unittest
+import sys
+import os
+from math import gcd, ceil, log
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.algos import multiplicative_order, find_smallest_r
+
+
+def brute_force_order(a, r):
+    if r == 1:
+        return 1
+    if gcd(a, r) != 1:
+        return None
+    return next(k for k in range(1, r + 1) if pow(a, k, r) == 1)
+
+
+def brute_force_smallest_r(n):
+    max_k = ceil(log(n, 2)**2)
+    for r in range(2, n):
+        for k in range(1, max_k):
+            if pow(n, k, r) == 1 or gcd(n, r) > 1:
+                break
+        else:
+            return r
+    return n
+
+
+class TestMultiplicativeOrder(unittest.TestCase):
+    """
+    Black Box Testing for multiplicative_order(a, r)
+
+    Test Plan:
+    - PE1: Prime, prime power and composite moduli
+    - PE2: a not coprime to r
+    - PE3: Large prime modulus with known order
+    """
+
+    # TC01: PE1 - Brute force agreement
+    def test_tc01_matches_brute_force(self):
+        """Test case TC01: 1 <= r < 600, 0 <= a < 40"""
+        for r in range(1, 600):
+            for a in range(40):
+                self.assertEqual(multiplicative_order(a, r), brute_force_order(a, r), (a, r))
+
+    # TC02: PE2 - Not coprime
+    def test_tc02_not_coprime(self):
+        """Test case TC02: gcd(a, r) != 1 gives None"""
+        self.assertIsNone(multiplicative_order(6, 9))
+        self.assertIsNone(multiplicative_order(0, 7))
+
+    # TC03: PE3 - Large modulus
+    def test_tc03_large_modulus(self):
+        """Test case TC03: 2 has order 61 modulo 2^61 - 1, the order of 7 modulo 2^31 - 1 divides p - 1"""
+        p = 2**61 - 1
+        self.assertEqual(multiplicative_order(2, p), 61)
+        q = 2**31 - 1
+        k = multiplicative_order(7, q)
+        self.assertEqual(pow(7, k, q), 1)
+        self.assertEqual((q - 1) % k, 0)
+
+
+class TestFindSmallestR(unittest.TestCase):
+    """Black Box Testing for find_smallest_r(n, deadline)"""
+
+    # TC04: Agreement with the k-by-k search
+    def test_tc04_matches_brute_force(self):
+        """Test case TC04: 1 <= n < 1500 and a few larger n"""
+        for n in list(range(1, 1500)) + [10**9 + 7, 2**31 - 1]:
+            self.assertEqual(find_smallest_r(n), brute_force_smallest_r(n), n)
+
+    # TC05: Large input
+    def test_tc05_large_input(self):
+        """Test case TC05: the r for 2^521 - 1 has ord_r(n) >= log2(n)^2"""
+        n = 2**521 - 1
+        r = find_smallest_r(n)
+        self.assertGreaterEqual(multiplicative_order(n, r), ceil(log(n, 2)**2))
+
+    # TC06: Deadline
+    def test_tc06_deadline(self):
+        """Test case TC06: an expired deadline raises TimeoutError"""
+        with self.assertRaises(TimeoutError):
+            find_smallest_r(2**127 - 1, deadline=0)
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestMultiplicativeOrder))
+    suite.addTest(unittest.makeSuite(TestFindSmallestR))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
@@ -0,0 +1,101 @@
+"""
+Unit Test for Elliptic Curve Point Counting - Black Box Testing
+Module: MahuCrypt_app.cryptography.point_counting
+Functions: count_points(p, a, b), crt_combine(r1, m1, r2, m2)
+
+Test Strategy: Equivalence Partitioning & Comparison with a brute-force count
+Purpose: Schoof + BSGS must give the exact group order #E(F_p)
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.point_counting import count_points, crt_combine, NAIVE_LIMIT
+from MahuCrypt_app.cryptography.algos import double_and_add
+
+
+def brute_force_count(p, a, b):
+    """1 + sum over x of (1 + Legendre symbol of x^3 + ax + b)"""
+    total = 1
+    for x in range(p):
+        rhs = (x**3 + a*x + b) % p
+        if rhs == 0:
+            total += 1
+        elif pow(rhs, (p - 1) // 2, p) == 1:
+            total += 2
+    return total
+
+
+class TestCountPoints(unittest.TestCase):
+    """
+    Black Box Testing for count_points(p, a, b)
+
+    Test Plan:
+    - PE1: Small p (direct count)
+    - PE2: p above NAIVE_LIMIT (Schoof + BSGS) agrees with brute force
+    - PE3: 64-bit p, N * P = O and N lies in the Hasse interval
+    - PE4: Singular curve
+    """
+
+    # TC01: PE1 - Small prime
+    def test_tc01_small_prime(self):
+        """Test case TC01: y^2 = x^3 + 2x + 2 (mod 17) has 19 points"""
+        self.assertEqual(count_points(17, 2, 2), 19)
+
+    # TC02: PE2 - Above the naive limit
+    def test_tc02_matches_brute_force(self):
+        """Test case TC02: several curves over primes just above NAIVE_LIMIT"""
+        for p in [65537, 65539, 65543]:
+            self.assertGreater(p, NAIVE_LIMIT)
+            for a, b in [(1, 1), (3, 5), (0, 7), (7, 0)]:
+                with self.subTest(p=p, a=a, b=b):
+                    self.assertEqual(count_points(p, a, b), brute_force_count(p, a, b))
+
+    # TC03: PE3 - 64-bit prime
+    def test_tc03_64_bit_group_order(self):
+        """Test case TC03: p = 2^64 - 189, the order kills random points"""
+        p = 2**64 - 189
+        a, b = 3, 5
+        n = count_points(p, a, b)
+        self.assertLessEqual((p + 1 - n)**2, 4 * p)
+        for x in [1, 2, 12345, 987654321]:
+            rhs = (x**3 + a*x + b) % p
+            if pow(rhs, (p - 1) // 2, p) != 1:
+                continue
+            # p = 3 (mod 4) so the square root is a single exponentiation
+            point = (x, pow(rhs, (p + 1) // 4, p))
+            with self.subTest(x=x):
+                self.assertEqual(double_and_add(point, n, a, p), (0, 0))
+
+    # TC04: PE4 - Singular curve
+    def test_tc04_singular_curve(self):
+        """Test case TC04: 4a^3 + 27b^2 = 0 (mod p) is rejected"""
+        p = 100003
+        # a = -3, b = 2 gives 4*(-27) + 27*4 = 0
+        with self.assertRaises(ValueError):
+            count_points(p, p - 3, 2)
+
+
+class TestCrtCombine(unittest.TestCase):
+    """Black Box Testing for crt_combine(r1, m1, r2, m2)"""
+
+    # TC05: Coprime moduli
+    def test_tc05_combine(self):
+        """Test case TC05: x = 2 (mod 3), x = 3 (mod 5) gives x = 8 (mod 15)"""
+        self.assertEqual(crt_combine(2, 3, 3, 5), (8, 15))
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestCountPoints))
+    suite.addTest(unittest.makeSuite(TestCrtCombine))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
@@ -0,0 +1,83 @@
+"""
+Unit Test for the sieve-assisted prime search - Black Box Testing
+Module: MahuCrypt_app.cryptography.algos, MahuCrypt_app.cryptography.public_key_cryptography
+Functions: sieve_odd_window(start, count, limit), get_prime_number(bits, incremental)
+
+Test Strategy: Equivalence Partitioning & Comparison with trial division
+Purpose: The window sieve must keep exactly the candidates without small factors and
+         both search modes must return primes of the requested size
+"""
+
+import unittest
+import secrets
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.algos import sieve_odd_window, sieve_of_eratosthenes, is_probable_prime
+from MahuCrypt_app.cryptography.public_key_cryptography import get_prime_number
+
+
+class TestSieveOddWindow(unittest.TestCase):
+    """
+    Black Box Testing for sieve_odd_window(start, count, limit)
+
+    Test Plan:
+    - PE1: Mask matches trial division by the odd primes below limit
+    - PE2: Smaller limit keeps more candidates
+    """
+
+    # TC01: PE1 - Trial division agreement
+    def test_tc01_matches_trial_division(self):
+        """Test case TC01: 200-bit start, every odd prime below 2^15"""
+        odd_primes = sieve_of_eratosthenes(1 << 15)[1:]
+        start = secrets.randbits(200) | (1 << 199) | 1
+        mask = sieve_odd_window(start, 500)
+        for i, keep in enumerate(mask):
+            n = start + 2 * i
+            self.assertEqual(bool(keep), all(n % q for q in odd_primes), "candidate %d" % i)
+
+    # TC02: PE2 - Limit
+    def test_tc02_limit(self):
+        """Test case TC02: limit = 100 only removes multiples of 3..97"""
+        start = 10**30 + 1
+        mask = sieve_odd_window(start, 300, 100)
+        odd_primes = sieve_of_eratosthenes(100)[1:]
+        for i, keep in enumerate(mask):
+            self.assertEqual(bool(keep), all((start + 2 * i) % q for q in odd_primes))
+
+
+class TestGetPrimeNumber(unittest.TestCase):
+    """Both search modes return a prime with exactly `bits` bits"""
+
+    # TC03: Incremental search
+    def test_tc03_incremental(self):
+        """Test case TC03: bits from 2 to 24 and several larger sizes"""
+        for bits in list(range(2, 25)) + [64, 128, 512]:
+            with self.subTest(bits=bits):
+                p = get_prime_number(bits)
+                self.assertEqual(p.bit_length(), bits)
+                self.assertTrue(is_probable_prime(p))
+
+    # TC04: Independent draws
+    def test_tc04_independent_draws(self):
+        """Test case TC04: incremental=False keeps the old behaviour"""
+        for bits in [8, 64, 256]:
+            with self.subTest(bits=bits):
+                p = get_prime_number(bits, incremental=False)
+                self.assertEqual(p.bit_length(), bits)
+                self.assertTrue(is_probable_prime(p))
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestSieveOddWindow))
+    suite.addTest(unittest.makeSuite(TestGetPrimeNumber))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
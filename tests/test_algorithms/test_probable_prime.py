@@ -0,0 +1,103 @@
+"""
+Unit Test for the adaptive primality test - Black Box Testing
+Module: MahuCrypt_app.cryptography.algos
+Functions: is_probable_prime(n), is_strong_probable_prime(n, a), miller_rabin_rounds(bits)
+
+Test Strategy: Equivalence Partitioning & Comparison with a sieve
+Purpose: Trial division, deterministic witnesses and FIPS 186 round counts must agree on primality
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.algos import (
+    is_probable_prime, is_strong_probable_prime, miller_rabin_rounds,
+    sieve_of_eratosthenes, DETERMINISTIC_LIMIT
+)
+
+
+class TestIsProbablePrime(unittest.TestCase):
+    """
+    Black Box Testing for is_probable_prime(n)
+
+    Test Plan:
+    - PE1: Small n (trial division only)
+    - PE2: Strong pseudoprimes to many bases below DETERMINISTIC_LIMIT
+    - PE3: Large primes and composites (random bases)
+    - Boundary: n < 2
+    """
+
+    # TC01: PE1 - Agrees with the sieve
+    def test_tc01_matches_sieve(self):
+        """Test case TC01: every n < 200000"""
+        limit = 200000
+        primes = set(sieve_of_eratosthenes(limit))
+        for n in range(limit):
+            if is_probable_prime(n) != (n in primes):
+                self.fail("is_probable_prime(%d) is wrong" % n)
+
+    # TC02: PE2 - Strong pseudoprimes
+    def test_tc02_strong_pseudoprimes(self):
+        """Test case TC02: composites that fool the first bases are still rejected"""
+        # 2047 fools base 2, 3215031751 fools 2, 3, 5, 7,
+        # 3825123056546413051 fools all primes up to 23, 318665857834031151167461 up to 37
+        for n in [2047, 3215031751, 3825123056546413051, 318665857834031151167461]:
+            with self.subTest(n=n):
+                self.assertLess(n, DETERMINISTIC_LIMIT)
+                self.assertFalse(is_probable_prime(n))
+        self.assertTrue(is_strong_probable_prime(2047, 2))
+        self.assertTrue(is_strong_probable_prime(3825123056546413051, 23))
+
+    # TC03: PE2 - Carmichael numbers
+    def test_tc03_carmichael_numbers(self):
+        """Test case TC03: 561, 41041, 825265 and a large Carmichael number"""
+        for n in [561, 41041, 825265, 321197185, 5394826801]:
+            with self.subTest(n=n):
+                self.assertFalse(is_probable_prime(n))
+
+    # TC04: PE3 - Large primes
+    def test_tc04_large_primes(self):
+        """Test case TC04: Mersenne primes 2^89 - 1, 2^127 - 1, 2^521 - 1, 2^1279 - 1"""
+        for e in [89, 127, 521, 1279]:
+            with self.subTest(e=e):
+                self.assertTrue(is_probable_prime(2**e - 1))
+
+    # TC05: PE3 - Large composites
+    def test_tc05_large_composites(self):
+        """Test case TC05: products of large primes and 2^e - 1 with composite e"""
+        self.assertFalse(is_probable_prime((2**127 - 1) * (2**89 - 1)))
+        self.assertFalse(is_probable_prime((2**521 - 1) * (2**607 - 1)))
+        self.assertFalse(is_probable_prime(2**1000 - 1))
+
+    # TC06: Boundary - n < 2
+    def test_tc06_below_two(self):
+        """Test case TC06: 0, 1 and negative numbers are not prime"""
+        for n in [-7, -1, 0, 1]:
+            self.assertFalse(is_probable_prime(n))
+
+
+class TestMillerRabinRounds(unittest.TestCase):
+    """Round counts shrink as the candidates grow"""
+
+    # TC07: Monotone table
+    def test_tc07_rounds_non_increasing(self):
+        """Test case TC07: miller_rabin_rounds never increases with the bit length"""
+        rounds = [miller_rabin_rounds(bits) for bits in range(64, 4097, 64)]
+        self.assertEqual(rounds, sorted(rounds, reverse=True))
+        self.assertGreaterEqual(min(rounds), 3)
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestIsProbablePrime))
+    suite.addTest(unittest.makeSuite(TestMillerRabinRounds))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
@@ -0,0 +1,89 @@
+"""
+Unit Test for CRT RSA Exponentiation - Black Box Testing
+Module: MahuCrypt_app.cryptography.algos
+Functions: rsa_crt_params(p, q, d), rsa_crt_exp(c, p, q, d)
+
+Test Strategy: Equivalence Partitioning & Comparison with pow(c, d, p*q)
+Purpose: Garner recombination must give exactly c^d mod n for every input
+"""
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.algos import rsa_crt_params, rsa_crt_exp
+
+
+class TestRsaCrt(unittest.TestCase):
+    """
+    Black Box Testing for rsa_crt_exp(c, p, q, d)
+
+    Test Plan:
+    - PE1: Valid key, random ciphertexts
+    - PE2: Ciphertexts divisible by p or q, c >= n
+    - PE3: Arbitrary (wrong) d, including multiples of p - 1
+    - PE4: p = q falls back to the plain exponentiation
+    """
+
+    p = 1000003
+    q = 998244353
+    e = 65537
+
+    def setUp(self):
+        phi = (self.p - 1) * (self.q - 1)
+        self.n = self.p * self.q
+        self.d = pow(self.e, -1, phi)
+
+    # TC01: PE1 - Round trip
+    def test_tc01_matches_pow(self):
+        """Test case TC01: rsa_crt_exp(c) == pow(c, d, n) and decrypts m^e"""
+        rng = random.Random(7)
+        for _ in range(50):
+            m = rng.randrange(self.n)
+            c = pow(m, self.e, self.n)
+            with self.subTest(m=m):
+                self.assertEqual(rsa_crt_exp(c, self.p, self.q, self.d), m)
+
+    # TC02: PE2 - Special ciphertexts
+    def test_tc02_special_ciphertexts(self):
+        """Test case TC02: 0, 1, multiples of p and q, c >= n"""
+        for c in [0, 1, self.p, 5 * self.q, self.n - 1, self.n + 12345]:
+            with self.subTest(c=c):
+                self.assertEqual(rsa_crt_exp(c, self.p, self.q, self.d), pow(c, self.d, self.n))
+
+    # TC03: PE3 - Arbitrary exponents
+    def test_tc03_arbitrary_exponents(self):
+        """Test case TC03: d + 1 and d = lcm-style multiples of p - 1"""
+        for d in [self.d + 1, (self.p - 1) * 3, (self.p - 1) * (self.q - 1)]:
+            for c in [0, self.p * 7, 123456789]:
+                with self.subTest(d=d, c=c):
+                    self.assertEqual(rsa_crt_exp(c, self.p, self.q, d), pow(c, d, self.n))
+
+    # TC04: PE4 - p = q
+    def test_tc04_equal_primes(self):
+        """Test case TC04: p = q has no CRT split"""
+        self.assertIsNone(rsa_crt_params(101, 101, 7))
+        self.assertEqual(rsa_crt_exp(5, 101, 101, 7), pow(5, 7, 101 * 101))
+
+    # TC05: Parameters
+    def test_tc05_params(self):
+        """Test case TC05: dp, dq and q^-1 mod p"""
+        dp, dq, q_inv = rsa_crt_params(self.p, self.q, self.d)
+        self.assertEqual(dp, self.d % (self.p - 1))
+        self.assertEqual(dq, self.d % (self.q - 1))
+        self.assertEqual((q_inv * self.q) % self.p, 1)
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestRsaCrt))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
@@ -0,0 +1,93 @@
+"""
+Unit Test for the segmented sieve - Black Box Testing
+Module: MahuCrypt_app.cryptography.algos
+Functions: sieve_of_eratosthenes(limit), iter_primes(limit, segment_size)
+
+Test Strategy: Boundary Value Analysis & Comparison with trial division
+Purpose: The odd-only segmented sieve must return exactly the primes up to limit,
+         whatever the segment size and wherever the segment boundaries fall
+"""
+
+import unittest
+import sys
+import os
+from itertools import islice
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.algos import sieve_of_eratosthenes, iter_primes, SIEVE_SEGMENT_SIZE
+
+
+def trial_division_primes(limit):
+    return [n for n in range(2, limit + 1) if all(n % d for d in range(2, int(n**0.5) + 1))]
+
+
+class TestSieve(unittest.TestCase):
+    """
+    Black Box Testing for sieve_of_eratosthenes(limit) and iter_primes(limit, segment_size)
+
+    Test Plan:
+    - Boundary: limit < 2, limit = 2, limit prime and limit + 1 prime
+    - PE1: Small segments so that every prime crosses a segment boundary
+    - PE2: Limits around the default segment size
+    - PE3: Known prime counts
+    """
+
+    # TC01: Boundary - Tiny limits
+    def test_tc01_tiny_limits(self):
+        """Test case TC01: limit = -1, 0, 1, 2, 3"""
+        self.assertEqual(sieve_of_eratosthenes(-1), [])
+        self.assertEqual(sieve_of_eratosthenes(0), [])
+        self.assertEqual(sieve_of_eratosthenes(1), [])
+        self.assertEqual(sieve_of_eratosthenes(2), [2])
+        self.assertEqual(sieve_of_eratosthenes(3), [2, 3])
+
+    # TC02: Boundary - Every limit below 3000
+    def test_tc02_matches_trial_division(self):
+        """Test case TC02: 0 <= limit < 3000"""
+        expected = trial_division_primes(3000)
+        for limit in range(3000):
+            count = sum(1 for p in expected if p <= limit)
+            self.assertEqual(sieve_of_eratosthenes(limit), expected[:count], limit)
+
+    # TC03: PE1 - Small segments
+    def test_tc03_small_segments(self):
+        """Test case TC03: segment sizes 1, 2, 7 and 64"""
+        expected = sieve_of_eratosthenes(20000)
+        for segment_size in [1, 2, 7, 64]:
+            with self.subTest(segment_size=segment_size):
+                self.assertEqual(list(iter_primes(20000, segment_size)), expected)
+
+    # TC04: PE2 - Around the default segment size
+    def test_tc04_segment_boundary(self):
+        """Test case TC04: limits next to 2 * SIEVE_SEGMENT_SIZE"""
+        edge = 2 * SIEVE_SEGMENT_SIZE
+        expected = list(iter_primes(edge + 10, 1000))
+        for limit in range(edge - 3, edge + 10):
+            with self.subTest(limit=limit):
+                self.assertEqual(sieve_of_eratosthenes(limit), [p for p in expected if p <= limit])
+
+    # TC05: PE3 - Prime counts
+    def test_tc05_prime_counts(self):
+        """Test case TC05: pi(10^6) = 78498 and the primes are plain ints"""
+        primes = sieve_of_eratosthenes(10**6)
+        self.assertEqual(len(primes), 78498)
+        self.assertEqual(primes[-1], 999983)
+        self.assertIs(type(primes[-1]), int)
+
+    # TC06: Generator
+    def test_tc06_lazy_generator(self):
+        """Test case TC06: the first primes of a huge limit come out without sieving all of it"""
+        self.assertEqual(list(islice(iter_primes(10**12), 10)), [2, 3, 5, 7, 11, 13, 17, 19, 23, 29])
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestSieve))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
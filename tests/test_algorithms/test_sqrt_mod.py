@@ -0,0 +1,97 @@
+"""
+Unit Test for Modular Square Root - Black Box Testing
+Module: MahuCrypt_app.cryptography.algos
+Functions: sqrt_mod(n, p), find_point_on_curve(p, a, b)
+
+Test Strategy: Equivalence Partitioning & Boundary Value Analysis
+Purpose: Tonelli-Shanks must return a root for every residue on both the p = 3 (mod 4)
+         fast path and the general path, and None for non-residues
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.algos import sqrt_mod, find_point_on_curve, is_point_on_curve
+
+
+class TestSqrtMod(unittest.TestCase):
+    """
+    Black Box Testing for sqrt_mod(n, p)
+
+    Test Plan:
+    - PE1: p = 3 (mod 4)
+    - PE2: p = 1 (mod 4), including a large power of two in p - 1
+    - PE3: Non-residues return None
+    - Boundary: n = 0 and n >= p
+    """
+
+    # TC01: PE1 - p = 3 (mod 4), every residue
+    def test_tc01_p_3_mod_4(self):
+        """Test case TC01: p = 103, r^2 = n for every square n"""
+        p = 103
+        for n in {(i * i) % p for i in range(1, p)}:
+            with self.subTest(n=n):
+                self.assertEqual(pow(sqrt_mod(n, p), 2, p), n)
+
+    # TC02: PE2 - p = 1 (mod 4), every residue
+    def test_tc02_p_1_mod_4(self):
+        """Test case TC02: p = 257 = 2^8 + 1, r^2 = n for every square n"""
+        p = 257
+        for n in {(i * i) % p for i in range(1, p)}:
+            with self.subTest(n=n):
+                self.assertEqual(pow(sqrt_mod(n, p), 2, p), n)
+
+    # TC03: PE2 - Large prime
+    def test_tc03_large_prime(self):
+        """Test case TC03: p = 2^255 - 19 (p = 5 mod 8)"""
+        p = 2**255 - 19
+        for x in [2, 12345678901234567890, p - 5]:
+            with self.subTest(x=x):
+                n = (x * x) % p
+                self.assertEqual(pow(sqrt_mod(n, p), 2, p), n)
+
+    # TC04: PE3 - Non-residues
+    def test_tc04_non_residue(self):
+        """Test case TC04: 3 is not a square mod 7 and 5 is not a square mod 13"""
+        self.assertIsNone(sqrt_mod(3, 7))
+        self.assertIsNone(sqrt_mod(5, 13))
+
+    # TC05: Boundary - Zero and reduction
+    def test_tc05_boundary(self):
+        """Test case TC05: sqrt(0) = 0 and n is reduced mod p first"""
+        self.assertEqual(sqrt_mod(0, 13), 0)
+        self.assertEqual(pow(sqrt_mod(13 + 4, 13), 2, 13), 4)
+
+
+class TestFindPointOnCurve(unittest.TestCase):
+    """find_point_on_curve must return a valid point without scanning y"""
+
+    # TC06: Small curve keeps the smaller root
+    def test_tc06_small_curve(self):
+        """Test case TC06: y^2 = x^3 + 2x + 3 (mod 97)"""
+        point = find_point_on_curve(97, 2, 3)
+        self.assertTrue(is_point_on_curve(point, 2, 3, 97))
+        self.assertLessEqual(point[1], 97 // 2)
+
+    # TC07: Large prime
+    def test_tc07_large_prime(self):
+        """Test case TC07: 127-bit prime finishes immediately"""
+        p = 2**127 - 1
+        point = find_point_on_curve(p, 3, 5)
+        self.assertTrue(is_point_on_curve(point, 3, 5, p))
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestSqrtMod))
+    suite.addTest(unittest.makeSuite(TestFindPointOnCurve))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
@@ -0,0 +1,109 @@
+"""
+Unit Test for width-w NAF scalar multiplication - Black Box Testing
+Module: MahuCrypt_app.cryptography.algos
+Functions: wnaf(n, w), choose_window(n), double_and_add(point, n, a, p, w)
+
+Test Strategy: Equivalence Partitioning & Comparison with the binary method
+Purpose: Every window width must give the same n*P as the plain double-and-add
+"""
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.algos import wnaf, choose_window, double_and_add
+
+
+class TestWNAF(unittest.TestCase):
+    """
+    Black Box Testing for wnaf(n, w)
+
+    Test Plan:
+    - PE1: Digits reconstruct n
+    - PE2: Non-zero digits are odd and |d| < 2^(w-1)
+    - PE3: Any w consecutive digits contain at most one non-zero digit
+    - Boundary: n = 0
+    """
+
+    # TC01: PE1 - Reconstruction
+    def test_tc01_digits_reconstruct_n(self):
+        """Test case TC01: sum(d_i * 2^i) == n"""
+        for w in range(2, 7):
+            for n in [1, 2, 7, 255, 1000003, 2**127 - 1]:
+                with self.subTest(n=n, w=w):
+                    self.assertEqual(sum(d << i for i, d in enumerate(wnaf(n, w))), n)
+
+    # TC02: PE2 - Digit range
+    def test_tc02_digit_range(self):
+        """Test case TC02: non-zero digits are odd and bounded by 2^(w-1)"""
+        w = 4
+        for d in wnaf(987654321987654321, w):
+            if d != 0:
+                self.assertEqual(d % 2, 1)
+                self.assertLess(abs(d), 1 << (w - 1))
+
+    # TC03: PE3 - Sparsity
+    def test_tc03_sparsity(self):
+        """Test case TC03: at most one non-zero digit in any window of w digits"""
+        w = 3
+        digits = wnaf(2**200 - 12345, w)
+        for i in range(len(digits) - w + 1):
+            self.assertLessEqual(sum(1 for d in digits[i:i + w] if d != 0), 1)
+
+    # TC04: Boundary - n = 0
+    def test_tc04_zero(self):
+        """Test case TC04: 0 has no digits"""
+        self.assertEqual(wnaf(0, 4), [])
+
+    # TC05: Window choice grows with the scalar size
+    def test_tc05_choose_window(self):
+        """Test case TC05: larger scalars never get a smaller window"""
+        widths = [choose_window(1 << bits) for bits in range(0, 1024, 8)]
+        self.assertEqual(widths, sorted(widths))
+        self.assertEqual(choose_window(5), 1)
+
+
+class TestWindowedDoubleAndAdd(unittest.TestCase):
+    """double_and_add with every w must agree with the binary method (w = 1)"""
+
+    # TC06: Small curve, every scalar
+    def test_tc06_small_curve_all_scalars(self):
+        """Test case TC06: y^2 = x^3 + 2x + 3 (mod 97), n in [0, 200)"""
+        point = (3, 6)
+        a = 2
+        p = 97
+        for n in range(200):
+            expected = double_and_add(point, n, a, p, w=1)
+            for w in [None, 2, 3, 4, 5]:
+                with self.subTest(n=n, w=w):
+                    self.assertEqual(double_and_add(point, n, a, p, w=w), expected)
+
+    # TC07: Large prime, random scalars
+    def test_tc07_large_prime_random_scalars(self):
+        """Test case TC07: p = 2^127 - 1 with random 127-bit scalars"""
+        p = 2**127 - 1
+        a = 5
+        point = (12345, 67890)
+        rng = random.Random(2024)
+        for _ in range(10):
+            n = rng.randrange(p)
+            expected = double_and_add(point, n, a, p, w=1)
+            for w in [None, 2, 4, 6]:
+                with self.subTest(n=n, w=w):
+                    self.assertEqual(double_and_add(point, n, a, p, w=w), expected)
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestWNAF))
+    suite.addTest(unittest.makeSuite(TestWindowedDoubleAndAdd))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
@@ -0,0 +1,89 @@
+"""
+Unit Test for modulus-sized block packing - Black Box Testing
+Module: MahuCrypt_app.cryptography.pre_process, MahuCrypt_app.cryptography.public_key_cryptography
+Functions: pack_blocks(string, modulus), unpack_blocks(blocks, modulus), EN_RSA / DE_RSA and
+           EN_ELGAMAL / DE_ELGAMAL with packing="modulus"
+
+Test Strategy: Equivalence Partitioning & Boundary Value Analysis
+Purpose: Packed blocks must stay below the modulus, use as few blocks as the modulus allows, and
+         decrypt back to exactly the original message, including case, spaces and non-ASCII text
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.pre_process import pack_blocks, unpack_blocks, PACKED_LENGTH_BYTES
+from MahuCrypt_app.cryptography.public_key_cryptography import (
+    create_RSA_keys, create_ELGAMAL_keys, EN_RSA, DE_RSA, EN_ELGAMAL, DE_ELGAMAL
+)
+
+MESSAGE = "Hello, World! Xin chào thế giới. " * 30
+
+
+class TestPackBlocks(unittest.TestCase):
+    """Black Box Testing for pack_blocks(string, modulus) and unpack_blocks(blocks, modulus)"""
+
+    # TC01: Round trip and block size
+    def test_tc01_round_trip(self):
+        """Test case TC01: blocks below the modulus, ceil((length + prefix) / size) of them, exact round trip"""
+        for modulus in [2**8 + 1, 2**16 + 1, 2**64 - 59, 2**521 - 1]:
+            blocks = pack_blocks(MESSAGE, modulus)
+            size = (modulus.bit_length() - 1) // 8
+            length = len(MESSAGE.encode("utf-8")) + PACKED_LENGTH_BYTES
+            self.assertEqual(len(blocks), -(-length // size))
+            self.assertTrue(all(0 <= block < modulus for block in blocks))
+            self.assertEqual(unpack_blocks(blocks, modulus), MESSAGE)
+
+    # TC02: Boundary values
+    def test_tc02_boundaries(self):
+        """Test case TC02: empty message, leading zero bytes, and a modulus too small for one byte"""
+        self.assertEqual(unpack_blocks(pack_blocks("", 2**64 - 59), 2**64 - 59), "")
+        self.assertEqual(unpack_blocks(pack_blocks("\x00\x00A", 2**64 - 59), 2**64 - 59), "\x00\x00A")
+        with self.assertRaises(ValueError):
+            pack_blocks("A", 2**8 - 1)
+
+
+class TestPackedEncryption(unittest.TestCase):
+    """Black Box Testing for EN_RSA, DE_RSA, EN_ELGAMAL and DE_ELGAMAL with packing="modulus" """
+
+    # TC03: RSA
+    def test_tc03_rsa(self):
+        """Test case TC03: a 512-bit modulus packs the message into far fewer blocks than the 4-character mode"""
+        keys = create_RSA_keys(256)
+        n, e = int(keys["public_key"]["n"]), int(keys["public_key"]["e"])
+        private_key = {k: int(v) for k, v in keys["private_key"].items()}
+        packed = EN_RSA(MESSAGE, (n, e), packing="modulus")["Encrypted"]
+        fixed = EN_RSA(MESSAGE, (n, e))["Encrypted"]
+        self.assertLess(len(packed.split(",")) * 5, len(fixed.split(",")))
+        self.assertEqual(DE_RSA(packed, private_key, packing="modulus")["Decrypted"], MESSAGE)
+
+    # TC04: ElGamal
+    def test_tc04_elgamal(self):
+        """Test case TC04: packed ElGamal round trip on a 64-bit group"""
+        keys = create_ELGAMAL_keys(64)
+        public_key = {k: int(v) for k, v in keys["public_key"].items()}
+        a = int(keys["private_key - a"])
+        encrypted = EN_ELGAMAL(MESSAGE, public_key, packing="modulus")["Encrypted"]
+        self.assertEqual(DE_ELGAMAL(encrypted, public_key["p"], a, packing="modulus")["Decrypted"], MESSAGE)
+
+    # TC05: Unknown packing
+    def test_tc05_unknown_packing(self):
+        """Test case TC05: a packing other than fixed or modulus raises ValueError"""
+        with self.assertRaises(ValueError):
+            EN_RSA("ABC", (3233, 17), packing="bytes")
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestPackBlocks))
+    suite.addTest(unittest.makeSuite(TestPackedEncryption))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
@@ -0,0 +1,133 @@
+"""
+Unit Test for the named curve registry - Black Box Testing
+Module: MahuCrypt_app.cryptography.curves, MahuCrypt_app.cryptography.public_key_cryptography
+Functions: get_curve(name), create_ECC_keys(bits, curve), create_ECDSA_keys(curve=...),
+           ECCService.generate_keys / encrypt / decrypt and SignatureService.create_ecdsa_keys /
+           sign_with_ecdsa / verify_ecdsa_signature on every named curve
+
+Test Strategy: Equivalence Partitioning & Verification of the group parameters
+Purpose: Every registered curve must be non-singular with G on the curve and n * G = O, keys
+         made on a named curve must use its parameters unchanged, and those keys must work end to
+         end through the services, a = 0 (secp256k1) included
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.curves import CURVES, get_curve
+from MahuCrypt_app.cryptography.public_key_cryptography import create_ECC_keys, create_ECDSA_keys, EN_ECC, DE_ECC
+from MahuCrypt_app.cryptography.algos import double_and_add, is_point_on_curve, is_probable_prime
+from MahuCrypt_app.cryptography.point_counting import count_points
+from MahuCrypt_app.services.ecc_service import ECCService
+from MahuCrypt_app.services.signature_service import SignatureService
+
+
+class TestCurveRegistry(unittest.TestCase):
+    """Black Box Testing for CURVES and get_curve(name)"""
+
+    # TC01: Group parameters
+    def test_tc01_parameters(self):
+        """Test case TC01: non-singular, G on the curve, n prime and n * G = O for every curve"""
+        for curve in CURVES.values():
+            p, a, b = curve.p, curve.a, curve.b
+            self.assertNotEqual((4 * a**3 + 27 * b**2) % p, 0, curve.name)
+            self.assertTrue(is_point_on_curve(curve.G, a, b, p), curve.name)
+            self.assertTrue(is_probable_prime(curve.n), curve.name)
+            self.assertEqual(double_and_add(curve.G, curve.n, a, p), (0, 0), curve.name)
+
+    # TC02: Orders of the toy curves
+    def test_tc02_toy_orders(self):
+        """Test case TC02: n * h equals the point count of the small curves"""
+        for name in ["toy-17", "toy-1009", "toy-31"]:
+            curve = CURVES[name]
+            self.assertEqual(count_points(curve.p, curve.a, curve.b), curve.n * curve.h, name)
+
+    # TC03: Lookup
+    def test_tc03_lookup(self):
+        """Test case TC03: names are case-insensitive, aliases resolve, unknown names raise ValueError"""
+        self.assertIs(get_curve("p-256"), CURVES["P-256"])
+        self.assertIs(get_curve("secp256r1"), CURVES["P-256"])
+        self.assertIs(get_curve("SECP256K1"), CURVES["secp256k1"])
+        with self.assertRaises(ValueError):
+            get_curve("P-521")
+
+
+class TestNamedCurveKeys(unittest.TestCase):
+    """Black Box Testing for create_ECC_keys and create_ECDSA_keys on named curves"""
+
+    # TC04: ECC keys
+    def test_tc04_ecc_keys(self):
+        """Test case TC04: the public key carries the curve parameters, B = s G, and a round trip works"""
+        curve = CURVES["toy-31"]
+        keys = create_ECC_keys(None, curve="toy-31")
+        public = keys["public_key"]
+        self.assertEqual((int(public["p"]), int(public["a"]), int(public["b"])), (curve.p, curve.a, curve.b))
+        self.assertEqual(eval(public["P"]), curve.G)
+        s = int(keys["private_key"])
+        self.assertEqual(eval(public["B"]), double_and_add(curve.G, s, curve.a, curve.p))
+        self.assertEqual(int(keys["public_details"]["number_of_points"]), curve.n * curve.h)
+        result = EN_ECC("HELLO", {"a": curve.a, "p": curve.p, "P": curve.G, "B": eval(public["B"])})
+        decrypted = DE_ECC(result["Encrypted"], {"a": curve.a, "p": curve.p}, s)
+        self.assertEqual(decrypted["Decrypted"], result["Message points"])
+
+    # TC05: ECDSA keys
+    def test_tc05_ecdsa_keys(self):
+        """Test case TC05: q = n, G is the registered base point and Q = d G on P-256"""
+        curve = CURVES["P-256"]
+        keys = create_ECDSA_keys(curve="P-256")
+        public = keys["public_key"]
+        self.assertEqual((int(public["p"]), int(public["q"])), (curve.p, curve.n))
+        self.assertEqual(eval(public["G"]), curve.G)
+        d = int(keys["private_key"])
+        self.assertTrue(1 <= d < curve.n)
+        self.assertEqual(eval(public["Q"]), double_and_add(curve.G, d, curve.a, curve.p))
+
+
+
+class TestNamedCurveServices(unittest.TestCase):
+    """Black Box Testing for ECCService and SignatureService with keys on the named curves"""
+
+    # TC06: ECC through ECCService
+    def test_tc06_ecc_service(self):
+        """Test case TC06: generate_keys, encrypt and decrypt round trip on every named curve"""
+        for name in CURVES:
+            with self.subTest(curve=name):
+                keys = ECCService.generate_keys(None, name)
+                public = keys["public_key"]
+                P, B = eval(public["P"]), eval(public["B"])
+                encrypted = ECCService.encrypt("HELLO", public["a"], public["p"], P, B)
+                self.assertIn("Encrypted", encrypted)
+                decrypted = ECCService.decrypt(encrypted["Encrypted"], public["a"], public["p"], keys["private_key"])
+                self.assertEqual(decrypted, {"Decrypted": encrypted["Message points"]})
+
+    # TC07: ECDSA through SignatureService
+    def test_tc07_ecdsa_service(self):
+        """Test case TC07: create_ecdsa_keys, sign_with_ecdsa and verify_ecdsa_signature on every named curve"""
+        for name in CURVES:
+            with self.subTest(curve=name):
+                keys = SignatureService.create_ecdsa_keys(None, name)
+                public = keys["public_key"]
+                G, Q = eval(public["G"]), eval(public["Q"])
+                curve = (public["p"], public["q"], public["a"], public["b"])
+                for mode in ["block", "digest"]:
+                    signed = SignatureService.sign_with_ecdsa("HELLO", *curve, G, keys["private_key"], mode)
+                    self.assertIn("Signed Message", signed, mode)
+                    result = SignatureService.verify_ecdsa_signature(
+                        signed["Hashed Message"], signed["Signed Message"], *curve, G, Q, mode, "HELLO")
+                    self.assertEqual(result, {"Verification: ": "True"}, mode)
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestCurveRegistry))
+    suite.addTest(unittest.makeSuite(TestNamedCurveKeys))
+    suite.addTest(unittest.makeSuite(TestNamedCurveServices))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
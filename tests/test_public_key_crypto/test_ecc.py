@@ -65,13 +65,13 @@ class TestCreateECCKeys(unittest.TestCase):
         
         self.assertIn("public_key", result)
     
-    # TC05: PE3 - bits=128 (skip - extremely slow)
-    @unittest.skip("Extremely slow for testing")
+    # TC05: PE3 - bits=128, above the random-curve limit
     def test_tc05_bits_128(self):
-        """Test case TC05: 128-bit keys"""
-        result = create_ECC_keys(128)
+        """Test case TC05: 128-bit random curves are refused, named curves cover that size"""
+        with self.assertRaises(ValueError):
+            create_ECC_keys(128)
         
-        self.assertIsInstance(result, dict)
+        self.assertIsInstance(create_ECC_keys(128, curve="P-256"), dict)
     
     # TC06: PE4 - bits=2 (may hang)
     @unittest.skip("May hang - too small")
@@ -73,14 +73,13 @@ class TestCreateELGAMALKeys(unittest.TestCase):
         
         self.assertIsInstance(result, dict)
     
-    # TC06: PE4 - bits=2 (may hang)
-    @unittest.skip("May hang - too small")
+    # TC06: PE4 - bits=2, too small for a group
     def test_tc06_bits_2(self):
         """Test case TC06: 2 bits - too small"""
-        result = create_ELGAMAL_keys(2)
+        with self.assertRaises(ValueError):
+            create_ELGAMAL_keys(2)
     
     # TC07: PE5 - bits=0
-    @unittest.skip("Hangs - skip invalid bits")
     def test_tc07_bits_zero(self):
         """Test case TC07: Zero bits - invalid"""
         try:
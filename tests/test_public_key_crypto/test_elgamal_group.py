@@ -0,0 +1,119 @@
+"""
+Unit Test for ElGamal group generation - Black Box Testing
+Module: MahuCrypt_app.cryptography.public_key_cryptography, MahuCrypt_app.cryptography.algos
+Functions: get_safe_prime(bits), generate_elgamal_group(bits), elgamal_group(bits),
+           create_ELGAMAL_keys(bits, reuse_group), sieve_safe_prime_window(start, count, limit),
+           is_safe_prime_generator(g, p)
+
+Test Strategy: Equivalence Partitioning & Boundary Value Analysis
+Purpose: p must be a safe prime of the requested size, alpha = 2 must generate Z_p*,
+         and reuse_group must share p and alpha while drawing a fresh secret
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.public_key_cryptography import (
+    get_safe_prime, generate_elgamal_group, elgamal_group, create_ELGAMAL_keys
+)
+from MahuCrypt_app.cryptography.algos import (
+    is_probable_prime, is_primitive_root, sieve_safe_prime_window, is_safe_prime_generator
+)
+
+
+class TestSafePrime(unittest.TestCase):
+    """
+    Black Box Testing for get_safe_prime(bits) and sieve_safe_prime_window(start, count, limit)
+
+    Test Plan:
+    - PE1: Small sizes (direct search) and sieved sizes
+    - PE2: The sieve keeps every safe prime of the window
+    - Boundary: below 6 bits
+    """
+
+    # TC01: PE1 - Structure
+    def test_tc01_safe_prime_structure(self):
+        """Test case TC01: p = 2q + 1 with both prime, exactly bits bits, p = 3 (mod 8)"""
+        for bits in [6, 8, 16, 17, 32, 64, 128]:
+            with self.subTest(bits=bits):
+                p = get_safe_prime(bits)
+                self.assertEqual(p.bit_length(), bits)
+                self.assertEqual(p % 8, 3)
+                self.assertTrue(is_probable_prime(p))
+                self.assertTrue(is_probable_prime((p - 1) // 2))
+
+    # TC02: PE2 - Sieve keeps the safe primes
+    def test_tc02_sieve_window(self):
+        """Test case TC02: every q = 1 (mod 4) giving a safe prime survives, and survivors have no factor below limit"""
+        start, count, limit = 100001, 5000, 200
+        mask = sieve_safe_prime_window(start, count, limit)
+        for i in range(count):
+            q = start + 4 * i
+            if is_probable_prime(q) and is_probable_prime(2 * q + 1):
+                self.assertEqual(mask[i], 1, q)
+            if mask[i]:
+                for r in range(3, limit, 2):
+                    self.assertNotEqual(q % r, 0)
+                    self.assertNotEqual((2 * q + 1) % r, 0)
+
+    # TC03: Boundary - Too small
+    def test_tc03_too_small(self):
+        """Test case TC03: no safe prime = 3 (mod 8) with 5 bits"""
+        with self.assertRaises(ValueError):
+            get_safe_prime(5)
+
+
+class TestElGamalGroup(unittest.TestCase):
+    """Black Box Testing for generate_elgamal_group(bits) and create_ELGAMAL_keys(bits, reuse_group)"""
+
+    # TC04: Generator check
+    def test_tc04_generator(self):
+        """Test case TC04: alpha = 2 generates Z_p* for every size, including the small fallback"""
+        for bits in [3, 4, 5, 6, 10, 24, 64]:
+            with self.subTest(bits=bits):
+                p, alpha = generate_elgamal_group(bits)
+                self.assertEqual(p.bit_length(), bits)
+                self.assertEqual(alpha, 2)
+                self.assertTrue(is_primitive_root(p, alpha))
+
+    # TC05: Two-exponentiation check agrees with the full one
+    def test_tc05_safe_prime_generator_check(self):
+        """Test case TC05: is_safe_prime_generator = is_primitive_root for p = 1019 and p = 2579"""
+        for p in [1019, 2579]:
+            for g in range(p):
+                self.assertEqual(is_safe_prime_generator(g, p), g > 1 and is_primitive_root(p, g), (p, g))
+
+    # TC06: Cached group
+    def test_tc06_reuse_group(self):
+        """Test case TC06: reuse_group shares p and alpha, the secret is fresh"""
+        elgamal_group.cache_clear()
+        keys = [create_ELGAMAL_keys(48, reuse_group=True) for _ in range(3)]
+        self.assertEqual(len({k["public_key"]["p"] for k in keys}), 1)
+        self.assertEqual(len({k["private_key - a"] for k in keys}), 3)
+        p = int(keys[0]["public_key"]["p"])
+        for k in keys:
+            self.assertEqual(pow(2, int(k["private_key - a"]), p), int(k["public_key"]["beta"]))
+
+    # TC07: Boundary - Too small for a group
+    def test_tc07_too_small(self):
+        """Test case TC07: below 3 bits (p = 2 or 3) no group is generated"""
+        for bits in [0, 1, 2]:
+            with self.subTest(bits=bits):
+                with self.assertRaises(ValueError):
+                    generate_elgamal_group(bits)
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestSafePrime))
+    suite.addTest(unittest.makeSuite(TestElGamalGroup))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
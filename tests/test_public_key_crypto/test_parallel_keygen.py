@@ -0,0 +1,94 @@
+"""
+Unit Test for parallel RSA key generation - Black Box Testing
+Module: MahuCrypt_app.cryptography.parallel_keygen, MahuCrypt_app.cryptography.public_key_cryptography
+Functions: parallel_primes(search, sizes, workers), search_prime_number(bits, incremental, should_stop),
+           create_RSA_keys(bits, parallel, workers)
+
+Test Strategy: Equivalence Partitioning & Comparison with the sequential key generation
+Purpose: Every slot must get a prime of its own size whatever the number of workers, a stopped
+         search must give up, the executor must be kept between requests, and parallel keys must
+         encrypt and decrypt like sequential ones
+"""
+
+import unittest
+from unittest import mock
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography import parallel_keygen, public_key_cryptography
+from MahuCrypt_app.cryptography.parallel_keygen import parallel_primes
+from MahuCrypt_app.cryptography.public_key_cryptography import search_prime_number, create_RSA_keys
+from MahuCrypt_app.cryptography.algos import is_probable_prime
+
+
+class TestParallelPrimes(unittest.TestCase):
+    """Black Box Testing for parallel_primes(search, sizes, workers) and search_prime_number(should_stop)"""
+
+    # TC01: One prime per slot
+    def test_tc01_sizes(self):
+        """Test case TC01: each slot gets a prime of its own size, with fewer and more workers than slots"""
+        sizes = [512, 512, 511]
+        for workers in [1, 2, 4]:
+            primes = parallel_primes(search_prime_number, sizes, workers)
+            self.assertEqual([p.bit_length() for p in primes], sizes)
+            self.assertTrue(all(is_probable_prime(p) for p in primes))
+
+    # TC02: Stopped search
+    def test_tc02_should_stop(self):
+        """Test case TC02: a search told to stop returns None on both search paths"""
+        self.assertIsNone(search_prime_number(512, should_stop=lambda: True))
+        self.assertIsNone(search_prime_number(512, incremental=False, should_stop=lambda: True))
+        self.assertEqual(search_prime_number(64, should_stop=lambda: False).bit_length(), 64)
+
+    # TC04: Executor reuse
+    def test_tc04_pool_reuse(self):
+        """Test case TC04: a second request runs on the executor of the first, small sizes stay in process"""
+        parallel_primes(search_prime_number, [512, 512], 2)
+        pool = parallel_keygen._pool
+        primes = parallel_primes(search_prime_number, [512, 512], 2)
+        self.assertIs(parallel_keygen._pool, pool)
+        self.assertEqual([p.bit_length() for p in primes], [512, 512])
+        with mock.patch.object(parallel_keygen, "ProcessPoolExecutor") as executor:
+            primes = parallel_primes(search_prime_number, [64, 64, 63], 3)
+        executor.assert_not_called()
+        self.assertEqual([p.bit_length() for p in primes], [64, 64, 63])
+
+
+class TestParallelRSAKeys(unittest.TestCase):
+    """Black Box Testing for create_RSA_keys(bits, parallel=True)"""
+
+    # TC03: Key consistency
+    def test_tc03_keys(self):
+        """Test case TC03: n = p q, e d = 1 (mod phi(n)) and a round trip through pow"""
+        keys = create_RSA_keys(128, parallel=True, workers=2)
+        n, e = int(keys["public_key"]["n"]), int(keys["public_key"]["e"])
+        d, p, q = (int(keys["private_key"][k]) for k in ("d", "p", "q"))
+        self.assertEqual(n, p * q)
+        self.assertEqual((p.bit_length(), q.bit_length(), e.bit_length()), (128, 128, 127))
+        self.assertEqual(e * d % ((p - 1) * (q - 1)), 1)
+        self.assertEqual(pow(pow(123456789, e, n), d, n), 123456789)
+
+    # TC05: Worker count
+    def test_tc05_workers_default(self):
+        """Test case TC05: workers=None takes RSA_KEYGEN_WORKERS as it is at call time"""
+        with mock.patch.object(public_key_cryptography, "RSA_KEYGEN_WORKERS", 3), \
+                mock.patch.object(public_key_cryptography.PRIME_POOL, "take", return_value=None), \
+                mock.patch.object(public_key_cryptography, "parallel_primes",
+                                  side_effect=lambda search, sizes, workers: [11, 13, 7]) as primes:
+            create_RSA_keys(4, parallel=True)
+        self.assertEqual(primes.call_args.args[2], 3)
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestParallelPrimes))
+    suite.addTest(unittest.makeSuite(TestParallelRSAKeys))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
@@ -0,0 +1,128 @@
+"""
+Unit Test for the background prime pool - Black Box Testing
+Module: MahuCrypt_app.cryptography.prime_pool, MahuCrypt_app.cryptography.public_key_cryptography
+Functions: PrimePool(generate, sizes, capacity, duty_cycle), PrimePool.take(bits), PrimePool.metrics(),
+           PrimePool.start(bits), PrimePool.stop(), get_prime_number(bits)
+
+Test Strategy: Equivalence Partitioning & State Transition
+Purpose: A filled pool must hand out primes of the right size, an empty or disabled pool must
+         report a miss so the caller searches itself, the hit rate must follow both, and the refills
+         must stay within their duty cycle
+"""
+
+import unittest
+import time
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.prime_pool import PrimePool
+from MahuCrypt_app.cryptography.public_key_cryptography import search_prime_number, get_prime_number, PRIME_POOL
+from MahuCrypt_app.cryptography.algos import is_probable_prime
+
+
+def wait_until_full(pool, bits, timeout=30):
+    deadline = time.monotonic() + timeout
+    while pool.metrics()["sizes"][bits]["available"] < pool.capacity:
+        if time.monotonic() > deadline:
+            raise AssertionError("pool did not fill in time")
+        time.sleep(0.01)
+
+
+class TestPrimePool(unittest.TestCase):
+    """
+    Black Box Testing for PrimePool
+
+    Test Plan:
+    - State 1: full pool, every take is a hit
+    - State 2: drained pool, take is a miss, the thread refills it
+    - PE: sizes outside the pool and a disabled pool
+    """
+
+    def setUp(self):
+        self.pool = PrimePool(search_prime_number, sizes=(64, 128), capacity=3)
+
+    def tearDown(self):
+        self.pool.stop()
+
+    # TC01: State 1 - Hits from a full pool
+    def test_tc01_hits(self):
+        """Test case TC01: three takes from a filled 128-bit pool are primes of 128 bits"""
+        self.pool.start(128)
+        wait_until_full(self.pool, 128)
+        for _ in range(3):
+            p = self.pool.take(128)
+            self.assertEqual(p.bit_length(), 128)
+            self.assertTrue(is_probable_prime(p))
+        self.assertEqual(self.pool.metrics()["sizes"][128]["hits"], 3)
+
+    # TC02: State 2 - Miss, then refill
+    def test_tc02_miss_then_refill(self):
+        """Test case TC02: a miss on a drained pool, hit rate 3/4, the pool fills up again"""
+        self.pool.start(64)
+        wait_until_full(self.pool, 64)
+        self.pool.stop()
+        for _ in range(3):
+            self.assertIsNotNone(self.pool.take(64))
+        self.assertIsNone(self.pool.take(64))
+        metrics = self.pool.metrics()
+        self.assertEqual((metrics["hits"], metrics["misses"]), (3, 1))
+        self.assertAlmostEqual(metrics["hit_rate"], 0.75)
+        self.pool.start(64)
+        wait_until_full(self.pool, 64)
+
+    # TC03: PE - Sizes outside the pool and a disabled pool
+    def test_tc03_not_pooled(self):
+        """Test case TC03: other sizes and capacity 0 never start a thread and never count"""
+        self.assertIsNone(self.pool.take(96))
+        disabled = PrimePool(search_prime_number, sizes=(64,), capacity=0)
+        self.assertIsNone(disabled.take(64))
+        self.assertEqual(disabled.metrics(), {"sizes": {}, "hits": 0, "misses": 0, "hit_rate": 0.0})
+
+    # TC04: get_prime_number falls back to a synchronous search
+    def test_tc04_get_prime_number(self):
+        """Test case TC04: sizes outside PRIME_POOL are searched, and the result is the same kind of prime"""
+        before = PRIME_POOL.metrics()
+        p = get_prime_number(200)
+        self.assertEqual(p.bit_length(), 200)
+        self.assertTrue(is_probable_prime(p))
+        self.assertEqual(PRIME_POOL.metrics(), before)
+
+    # TC05: Throttled refills
+    def test_tc05_duty_cycle(self):
+        """Test case TC05: one search at a time across sizes, each followed by a pause as long as itself at d = 0.5"""
+        calls = []
+
+        def generate(bits):
+            started = time.monotonic()
+            p = search_prime_number(bits)
+            while time.monotonic() - started < 0.02:
+                pass
+            calls.append((started, time.monotonic()))
+            return p
+
+        pool = PrimePool(generate, sizes=(64, 128), capacity=2, duty_cycle=0.5)
+        try:
+            pool.start()
+            wait_until_full(pool, 64)
+            wait_until_full(pool, 128)
+        finally:
+            pool.stop()
+        calls.sort()
+        for (start, end), (next_start, _) in zip(calls, calls[1:]):
+            self.assertGreaterEqual(next_start - end, 0.9 * (end - start))
+        with self.assertRaises(ValueError):
+            PrimePool(generate, duty_cycle=0)
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestPrimePool))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
@@ -335,9 +335,9 @@ class TestECCService(unittest.TestCase):
         self.assertEqual(result, {"Error": "NULL Value"})
     
     def test_tc60_decrypt_a_zero(self):
-        """TC60: a=0"""
+        """TC60: a=0 is a valid coefficient (secp256k1), not a missing value"""
         result = ECCService.decrypt("123", 0, 23, 7)
-        self.assertEqual(result, {"Error": "NULL Value"})
+        self.assertNotEqual(result, {"Error": "NULL Value"})
 
 
 if __name__ == '__main__':
@@ -0,0 +1,177 @@
+"""
+Unit Test for batch signature verification - Black Box Testing
+Module: MahuCrypt_app.cryptography.signature, MahuCrypt_app.cryptography.algos
+Functions: batch_verify_RSA, batch_verify_ELGAMAL, batch_verify_ECDSA, multi_exponentiation(pairs, m),
+           SignatureService.batch_verify_signatures(scheme, items, public_key)
+
+Test Strategy: Equivalence Partitioning & Comparison with one-by-one verification
+Purpose: A batch of valid signatures must pass, one altered signature anywhere in the batch must make
+         it fail, including alterations by a factor of order 2 (a negated RSA signature, delta + (p-1)/2),
+         and the service must name the pairs that do not verify
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.signature import (
+    sign_RSA, sign_ELGAMAL, sign_ECDSA, verify_RSA, verify_ELGAMAL,
+    batch_verify_RSA, batch_verify_ELGAMAL, batch_verify_ECDSA
+)
+from MahuCrypt_app.cryptography.public_key_cryptography import create_RSA_keys, create_ELGAMAL_keys, create_ECDSA_keys
+from MahuCrypt_app.cryptography.algos import multi_exponentiation
+from MahuCrypt_app.services.signature_service import SignatureService
+
+MESSAGES = ["MESSAGE NUMBER %d" % i for i in range(20)]
+#more RSA signatures than BATCH_SUBSET_ROUNDS, so that the subset rounds run
+RSA_MESSAGES = ["MESSAGE NUMBER %d" % i for i in range(80)]
+
+
+def rsa_batch(bits=64):
+    keys = create_RSA_keys(bits)
+    private_key = {k: int(v) for k, v in keys["private_key"].items()}
+    signed, hashed = [], []
+    for message in RSA_MESSAGES:
+        s, x = sign_RSA(message, private_key, mode="digest")
+        signed += s
+        hashed += x
+    return keys, signed, hashed
+
+
+class TestMultiExponentiation(unittest.TestCase):
+    """Black Box Testing for multi_exponentiation(pairs, m)"""
+
+    # TC01: Agreement with pow
+    def test_tc01_matches_pow(self):
+        """Test case TC01: small, large and zero exponents against the product of pow calls"""
+        m = 2**127 - 1
+        pairs = [(3, 5), (12345, 2**100 + 7), (m - 2, 0), (2**90, 65537)]
+        expected = 1
+        for b, e in pairs:
+            expected = expected * pow(b, e, m) % m
+        self.assertEqual(multi_exponentiation(pairs, m), expected)
+        self.assertEqual(multi_exponentiation([], m), 1)
+
+
+class TestBatchVerify(unittest.TestCase):
+    """Black Box Testing for batch_verify_RSA, batch_verify_ELGAMAL and batch_verify_ECDSA"""
+
+    # TC02: RSA
+    def test_tc02_rsa(self):
+        """Test case TC02: 80 digest signatures pass, one altered signature fails"""
+        keys, signed, hashed = rsa_batch()
+        public_key = (int(keys["public_key"]["n"]), int(keys["public_key"]["e"]))
+        self.assertTrue(batch_verify_RSA(hashed, signed, public_key))
+        signed[7] += 1
+        self.assertFalse(batch_verify_RSA(hashed, signed, public_key))
+
+    # TC03: ElGamal
+    def test_tc03_elgamal(self):
+        """Test case TC03: block signatures of every message pass together, an altered delta fails"""
+        keys = create_ELGAMAL_keys(32)
+        public_key = {k: int(v) for k, v in keys["public_key"].items()}
+        signed, hashed = [], []
+        for message in MESSAGES:
+            s, x = sign_ELGAMAL(message, public_key, int(keys["private_key - a"]))
+            signed += s
+            hashed += x
+        self.assertTrue(batch_verify_ELGAMAL(hashed, signed, public_key))
+        gamma, delta = signed[3]
+        signed[3] = (gamma, delta + 1)
+        self.assertFalse(batch_verify_ELGAMAL(hashed, signed, public_key))
+
+    # TC04: ECDSA
+    def test_tc04_ecdsa(self):
+        """Test case TC04: 20 signatures on P-256 pass, a wrong hash value fails"""
+        keys = create_ECDSA_keys(curve="P-256")
+        public = keys["public_key"]
+        public_key = {k: int(public[k]) for k in ("p", "q", "a", "b")}
+        public_key.update(G=eval(public["G"]), Q=eval(public["Q"]))
+        signed, hashed = [], []
+        for message in MESSAGES:
+            s, x = sign_ECDSA(message, public_key, int(keys["private_key"]), mode="digest")
+            signed += eval(s)
+            hashed += eval(x)
+        self.assertTrue(batch_verify_ECDSA(hashed, signed, public_key))
+        hashed[19] += 1
+        self.assertFalse(batch_verify_ECDSA(hashed, signed, public_key))
+
+    # TC05: ECDSA on a curve where r does not fix the x-coordinate
+    def test_tc05_ecdsa_ambiguous_r(self):
+        """Test case TC05: on toy-1009 (q > p) R is recovered, on a random curve the check falls back"""
+        for curve in ["toy-1009", None]:
+            if curve is None:
+                keys = SignatureService.create_ecdsa_keys(16)
+            else:
+                keys = create_ECDSA_keys(curve=curve)
+            public = keys["public_key"]
+            public_key = {k: int(public[k]) for k in ("p", "q", "a", "b")}
+            public_key.update(G=eval(public["G"]), Q=eval(public["Q"]))
+            s, x = sign_ECDSA("HELLO WORLD", public_key, int(keys["private_key"]))
+            self.assertTrue(batch_verify_ECDSA(eval(x), eval(s), public_key), curve)
+
+    # TC08: Forgeries of order 2
+    def test_tc08_order_two_forgeries(self):
+        """Test case TC08: two negated RSA signatures, or two deltas shifted by (p-1)/2, never pass"""
+        keys, signed, hashed = rsa_batch()
+        n, e = int(keys["public_key"]["n"]), int(keys["public_key"]["e"])
+        signed[3], signed[40] = n - signed[3], n - signed[40]
+        self.assertFalse(verify_RSA(hashed[3:4], signed[3:4], (n, e)))
+        for _ in range(20):
+            self.assertFalse(batch_verify_RSA(hashed, signed, (n, e)))
+
+        keys = create_ELGAMAL_keys(64)
+        public_key = {k: int(v) for k, v in keys["public_key"].items()}
+        p = public_key["p"]
+        signed, hashed = [], []
+        for message in MESSAGES:
+            s, x = sign_ELGAMAL(message, public_key, int(keys["private_key - a"]), mode="digest")
+            signed += s
+            hashed += x
+        for i in [2, 9]:
+            signed[i] = (signed[i][0], signed[i][1] + (p - 1) // 2)
+        self.assertFalse(verify_ELGAMAL(hashed[2:3], signed[2:3], public_key))
+        for _ in range(20):
+            self.assertFalse(batch_verify_ELGAMAL(hashed, signed, public_key))
+
+
+class TestBatchVerifyService(unittest.TestCase):
+    """Black Box Testing for SignatureService.batch_verify_signatures(scheme, items, public_key)"""
+
+    # TC06: Invalid pairs are reported
+    def test_tc06_invalid_pairs(self):
+        """Test case TC06: the indices of the pairs that fail are returned, valid batches report none"""
+        keys, signed, hashed = rsa_batch()
+        items = [{"hash_message": str([x]), "signed": str([s])} for s, x in zip(signed, hashed)]
+        response = SignatureService.batch_verify_signatures("rsa", items, keys["public_key"])
+        self.assertEqual(response, {"Verification: ": "True", "Invalid": []})
+        items[1], items[4] = dict(items[1], signed=items[0]["signed"]), dict(items[4], signed=items[0]["signed"])
+        response = SignatureService.batch_verify_signatures("rsa", items, keys["public_key"])
+        self.assertEqual(response, {"Verification: ": "False", "Invalid": [1, 4]})
+        #negated signatures are caught by the batch check too, not only by the one-by-one pass
+        n = int(keys["public_key"]["n"])
+        items = [{"hash_message": str([x]), "signed": str([s])} for s, x in zip(signed, hashed)]
+        items[7], items[50] = dict(items[7], signed=str([n - signed[7]])), dict(items[50], signed=str([n - signed[50]]))
+        response = SignatureService.batch_verify_signatures("rsa", items, keys["public_key"])
+        self.assertEqual(response, {"Verification: ": "False", "Invalid": [7, 50]})
+
+    # TC07: Unknown scheme
+    def test_tc07_unknown_scheme(self):
+        """Test case TC07: a scheme other than rsa, elgamal or ecdsa is an error"""
+        self.assertIn("Error", SignatureService.batch_verify_signatures("dsa", [], {}))
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestMultiExponentiation))
+    suite.addTest(unittest.makeSuite(TestBatchVerify))
+    suite.addTest(unittest.makeSuite(TestBatchVerifyService))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
@@ -0,0 +1,187 @@
+"""
+Unit Test for hash-then-sign signatures - Black Box Testing
+Module: MahuCrypt_app.cryptography.signature
+Functions: message_digest(message, bits), sign_RSA(string, private_key, mode), sign_ELGAMAL(string, public_key,
+           private_key, mode), sign_ECDSA(string, public_key, private_key, mode), verify_RSA_digest,
+           verify_ELGAMAL_digest, verify_ECDSA_digest, SignatureService.verify_*_signature(..., mode, message)
+
+Test Strategy: Equivalence Partitioning & Comparison with hashlib
+Purpose: Digest mode must sign the SHA-256 of the whole message with exactly one signature that the
+         existing verify functions accept, a changed message must give a different digest, and digest
+         verification must hash the message itself instead of trusting a hash value from the client
+"""
+
+import unittest
+import hashlib
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from MahuCrypt_app.cryptography.signature import (
+    message_digest, sign_RSA, verify_RSA, sign_ELGAMAL, verify_ELGAMAL, sign_ECDSA, verify_ECDSA,
+    verify_RSA_digest, verify_ELGAMAL_digest, verify_ECDSA_digest
+)
+from MahuCrypt_app.cryptography.public_key_cryptography import create_RSA_keys, create_ELGAMAL_keys, create_ECDSA_keys
+from MahuCrypt_app.services.signature_service import SignatureService
+
+MESSAGE = "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG " * 50
+
+
+class TestMessageDigest(unittest.TestCase):
+    """Black Box Testing for message_digest(message, bits)"""
+
+    # TC01: Agreement with hashlib
+    def test_tc01_sha256(self):
+        """Test case TC01: str, bytes and a stream of chunks give the SHA-256 of the same bytes"""
+        expected = int.from_bytes(hashlib.sha256(MESSAGE.encode("utf-8")).digest(), "big")
+        self.assertEqual(message_digest(MESSAGE), expected)
+        self.assertEqual(message_digest(MESSAGE.encode("utf-8")), expected)
+        self.assertEqual(message_digest(iter([MESSAGE[:7], MESSAGE[7:].encode("utf-8")])), expected)
+
+    # TC02: Truncation
+    def test_tc02_truncation(self):
+        """Test case TC02: bits below 256 keep the leftmost bits"""
+        full = message_digest(MESSAGE)
+        self.assertEqual(message_digest(MESSAGE, 64), full >> 192)
+        self.assertLess(message_digest(MESSAGE, 20).bit_length(), 21)
+
+
+class TestDigestSignatures(unittest.TestCase):
+    """Black Box Testing for the digest mode of sign_RSA, sign_ELGAMAL and sign_ECDSA"""
+
+    # TC03: RSA
+    def test_tc03_rsa(self):
+        """Test case TC03: one signature for a long message, verified by verify_RSA"""
+        keys = create_RSA_keys(64)
+        private_key = {k: int(v) for k, v in keys["private_key"].items()}
+        n, e = int(keys["public_key"]["n"]), int(keys["public_key"]["e"])
+        signed, hashed = sign_RSA(MESSAGE, private_key, mode="digest")
+        self.assertEqual(len(signed), 1)
+        self.assertEqual(hashed, [message_digest(MESSAGE, n.bit_length() - 1)])
+        self.assertTrue(verify_RSA(hashed, signed, (n, e)))
+        self.assertFalse(verify_RSA([message_digest(MESSAGE + "!", n.bit_length() - 1)], signed, (n, e)))
+
+    # TC04: ElGamal
+    def test_tc04_elgamal(self):
+        """Test case TC04: one (gamma, delta) pair, verified by verify_ELGAMAL"""
+        keys = create_ELGAMAL_keys(32)
+        public_key = {k: int(v) for k, v in keys["public_key"].items()}
+        signed, hashed = sign_ELGAMAL(MESSAGE, public_key, int(keys["private_key - a"]), mode="digest")
+        self.assertEqual(len(signed), 1)
+        self.assertTrue(verify_ELGAMAL(hashed, signed, public_key))
+
+    # TC05: ECDSA
+    def test_tc05_ecdsa(self):
+        """Test case TC05: one (r, s) pair over the leftmost bitlen(q) bits, verified by verify_ECDSA"""
+        for curve in ["P-256", "toy-31"]:
+            keys = create_ECDSA_keys(curve=curve)
+            public = keys["public_key"]
+            public_key = {k: int(public[k]) for k in ("p", "q", "a", "b")}
+            public_key.update(G=eval(public["G"]), Q=eval(public["Q"]))
+            signed, hashed = sign_ECDSA(MESSAGE, public_key, int(keys["private_key"]), mode="digest")
+            self.assertEqual(len(eval(signed)), 1)
+            self.assertEqual(eval(hashed), [message_digest(MESSAGE, public_key["q"].bit_length())])
+            self.assertTrue(verify_ECDSA(eval(hashed), eval(signed), public_key))
+
+    # TC06: Unknown mode
+    def test_tc06_unknown_mode(self):
+        """Test case TC06: a mode other than block or digest raises ValueError"""
+        with self.assertRaises(ValueError):
+            sign_RSA("ABC", {"p": 11, "q": 13, "d": 7}, mode="sha1")
+
+
+class TestDigestVerify(unittest.TestCase):
+    """Black Box Testing for verify_RSA_digest, verify_ELGAMAL_digest, verify_ECDSA_digest and the verify services"""
+
+    # TC07: The digest is recomputed from the message
+    def test_tc07_recomputed_digest(self):
+        """Test case TC07: the signed message verifies, a changed message does not, whatever hash is presented"""
+        keys = create_RSA_keys(64)
+        private_key = {k: int(v) for k, v in keys["private_key"].items()}
+        n, e = int(keys["public_key"]["n"]), int(keys["public_key"]["e"])
+        signed, hashed = sign_RSA(MESSAGE, private_key, mode="digest")
+        self.assertTrue(verify_RSA_digest(MESSAGE, signed, (n, e)))
+        self.assertFalse(verify_RSA_digest(MESSAGE + "!", signed, (n, e)))
+        #a client can pair any signature s with the "hash" s^e mod n, the digest path never accepts it
+        forged = [12345]
+        self.assertTrue(verify_RSA([pow(12345, e, n)], forged, (n, e)))
+        self.assertFalse(verify_RSA_digest(MESSAGE, forged, (n, e)))
+
+        keys = create_ELGAMAL_keys(32)
+        public_key = {k: int(v) for k, v in keys["public_key"].items()}
+        signed, _ = sign_ELGAMAL(MESSAGE, public_key, int(keys["private_key - a"]), mode="digest")
+        self.assertTrue(verify_ELGAMAL_digest(MESSAGE, signed, public_key))
+        self.assertFalse(verify_ELGAMAL_digest(MESSAGE + "!", signed, public_key))
+
+        keys = create_ECDSA_keys(curve="secp256k1")
+        public = keys["public_key"]
+        public_key = {k: int(public[k]) for k in ("p", "q", "a", "b")}
+        public_key.update(G=eval(public["G"]), Q=eval(public["Q"]))
+        signed, _ = sign_ECDSA(MESSAGE, public_key, int(keys["private_key"]), mode="digest")
+        self.assertTrue(verify_ECDSA_digest(MESSAGE, eval(signed), public_key))
+        self.assertFalse(verify_ECDSA_digest(MESSAGE + "!", eval(signed), public_key))
+
+    # TC08: Verify services in digest mode
+    def test_tc08_services(self):
+        """Test case TC08: sign and verify through the services in digest mode, hash_message is ignored"""
+        keys = create_RSA_keys(64)
+        private, public = keys["private_key"], keys["public_key"]
+        result = SignatureService.sign_with_rsa(MESSAGE, private["p"], private["q"], private["d"], "digest")
+        verify = lambda message, hashed: SignatureService.verify_rsa_signature(
+            hashed, result["Signed Message"], public["n"], public["e"], "digest", message)
+        self.assertEqual(verify(MESSAGE, None), {"Verification: ": "True"})
+        self.assertEqual(verify(MESSAGE + "!", result["Hashed Message"]), {"Verification: ": "False"})
+        self.assertIn("Error", SignatureService.verify_rsa_signature(
+            result["Hashed Message"], result["Signed Message"], public["n"], public["e"], "sha1"))
+
+        keys = create_ELGAMAL_keys(32)
+        public = keys["public_key"]
+        result = SignatureService.sign_with_elgamal(MESSAGE, int(public["p"]), int(public["alpha"]),
+                                                    int(keys["private_key - a"]), "digest")
+        response = SignatureService.verify_elgamal_signature(
+            None, result["Signed Message"], public["p"], public["alpha"], public["beta"], "digest", MESSAGE)
+        self.assertEqual(response, {"Verification: ": "True"})
+
+        keys = SignatureService.create_ecdsa_keys(None, "P-256")
+        public = keys["public_key"]
+        G, Q = eval(public["G"]), eval(public["Q"])
+        result = SignatureService.sign_with_ecdsa(MESSAGE, public["p"], public["q"], public["a"], public["b"], G,
+                                                  keys["private_key"], "digest")
+        self.assertEqual(len(eval(result["Signed Message"])), 1)
+        response = SignatureService.verify_ecdsa_signature(
+            None, result["Signed Message"], public["p"], public["q"], public["a"], public["b"], G, Q,
+            "digest", MESSAGE)
+        self.assertEqual(response, {"Verification: ": "True"})
+        response = SignatureService.verify_ecdsa_signature(
+            None, result["Signed Message"], public["p"], public["q"], public["a"], public["b"], G, Q,
+            "digest", MESSAGE + "!")
+        self.assertEqual(response, {"Verification: ": "False"})
+
+    # TC09: Batch verification in digest mode
+    def test_tc09_batch(self):
+        """Test case TC09: (message, signed) pairs are checked against digests computed from the messages"""
+        keys = create_RSA_keys(64)
+        private = keys["private_key"]
+        messages = ["MESSAGE %d" % i for i in range(5)]
+        items = [{"message": m, "signed": SignatureService.sign_with_rsa(
+            m, private["p"], private["q"], private["d"], "digest")["Signed Message"]} for m in messages]
+        response = SignatureService.batch_verify_signatures("rsa", items, keys["public_key"], "digest")
+        self.assertEqual(response, {"Verification: ": "True", "Invalid": []})
+        items[2] = dict(items[2], message="ANOTHER MESSAGE")
+        response = SignatureService.batch_verify_signatures("rsa", items, keys["public_key"], "digest")
+        self.assertEqual(response, {"Verification: ": "False", "Invalid": [2]})
+
+
+def suite():
+    """Create test suite"""
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestMessageDigest))
+    suite.addTest(unittest.makeSuite(TestDigestSignatures))
+    suite.addTest(unittest.makeSuite(TestDigestVerify))
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())